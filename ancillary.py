@@ -0,0 +1,170 @@
+# HollywoodSim/game/ancillary.py
+
+"""
+Ancillary Windows
+-----------------
+What a film earns after its theatrical run: home video, then a streaming
+licence, then TV syndication. Each window opens a set number of months
+after the run ends and pays a share of the film's box office that decays
+by a fixed rate every month until the window closes. Films released
+straight to Streaming skip home video, and their streaming window opens
+sooner and pays more.
+
+Because every stream in a window decays at the same rate, the window's
+monthly total obeys
+
+    total(t) = decay * total(t - 1) + streams opening at t - streams closing at t
+
+so the catalog is collected with a few additions per window each month,
+however many titles are in it. Opening and closing amounts sit in buckets
+keyed by absolute month (calendar.month_index), like talent_tasks and the
+loan table in financing. A single film's take is read in closed form
+(a geometric sum) when something asks for it.
+
+Investor stakes cover the theatrical run only; catalog income is the studio's.
+"""
+
+WINDOWS = {
+    # delay: months after the theatrical run; rate: first month's share of box office
+    "home_video": {"label": "Home Video", "delay": 3, "rate": 0.04, "decay": 0.80, "months": 24},
+    "streaming": {"label": "Streaming", "delay": 6, "rate": 0.012, "decay": 0.95, "months": 60},
+    "tv": {"label": "TV Syndication", "delay": 24, "rate": 0.005, "decay": 0.98, "months": 120},
+}
+
+# Release strategy -> {window: (delay, rate multiplier) or None to skip it}
+STRATEGY_WINDOWS = {
+    "Streaming": {"home_video": None, "streaming": (1, 1.5)},
+}
+
+
+def window_total(amount, decay, months):
+    """Sum of a stream paying amount, amount*decay, ... for `months` months."""
+    if decay == 1:
+        return amount * months
+    return amount * (1 - decay ** months) / (1 - decay)
+
+
+class AncillaryMarket:
+    """The studio's back catalog, as one decaying revenue total per window."""
+
+    def __init__(self):
+        self.month = None                              # last absolute month collected
+        self.level = dict.fromkeys(WINDOWS, 0.0)       # window -> this month's total
+        self.open_streams = dict.fromkeys(WINDOWS, 0)  # window -> titles paying this month
+        self.earned = dict.fromkeys(WINDOWS, 0.0)      # window -> collected so far
+        self._starts = {w: {} for w in WINDOWS}        # window -> {month: [amount, count]}
+        self._ends = {w: {} for w in WINDOWS}          # window -> {month: [amount left, count]}
+        self.streams = {}                              # movie id -> [(window, start, amount)]
+
+    # === Opening windows ===
+    def windows_for(self, movie):
+        """[(window, delay, rate)] a film gets once its theatrical run is over."""
+        overrides = STRATEGY_WINDOWS.get(movie.get("release_strategy"), {})
+        found = []
+        for window, spec in WINDOWS.items():
+            delay, rate = spec["delay"], spec["rate"]
+            if window in overrides:
+                if overrides[window] is None:
+                    continue
+                delay, boost = overrides[window]
+                rate *= boost
+            found.append((window, delay, rate))
+        return found
+
+    def open(self, movie, month_index):
+        """Queue a film's windows after a run that ended in month_index; returns its streams."""
+        gross = movie.get("box_office", 0.0)
+        if gross <= 0 or movie["id"] in self.streams:
+            return []
+        if self.month is None:
+            self.month = month_index
+        streams = []
+        for window, delay, rate in self.windows_for(movie):
+            spec = WINDOWS[window]
+            start = month_index + delay
+            amount = gross * rate
+            self._bucket(self._starts[window], start, amount)
+            self._bucket(self._ends[window], start + spec["months"], amount * spec["decay"] ** spec["months"])
+            streams.append((window, start, amount))
+        self.streams[movie["id"]] = streams
+        return streams
+
+    @staticmethod
+    def _bucket(buckets, month, amount):
+        entry = buckets.setdefault(month, [0.0, 0])
+        entry[0] += amount
+        entry[1] += 1
+
+    # === Monthly collection ===
+    def collect(self, month_index):
+        """
+        Step every window up to month_index; returns {window: amount} for the months stepped.
+        Months already collected are skipped, so calling twice in a month pays once.
+        """
+        first = month_index if self.month is None else self.month + 1
+        paid = dict.fromkeys(WINDOWS, 0.0)
+        for month in range(first, month_index + 1):
+            for window, spec in WINDOWS.items():
+                level = self.level[window] * spec["decay"]
+                opened = self._starts[window].pop(month, None)
+                if opened:
+                    level += opened[0]
+                    self.open_streams[window] += opened[1]
+                closed = self._ends[window].pop(month, None)
+                if closed:
+                    level -= closed[0]
+                    self.open_streams[window] -= closed[1]
+                if not self.open_streams[window]:  # nothing paying; clear float error
+                    level = 0.0
+                self.level[window] = level
+                paid[window] += level
+        self.month = max(month_index, first - 1)
+        for window, amount in paid.items():
+            self.earned[window] += amount
+        return paid
+
+    def monthly_income(self):
+        """What the catalog pays this month across all windows."""
+        return sum(self.level.values())
+
+    # === Queries ===
+    def film_earnings(self, movie, month_index=None):
+        """{window: amount} a film has earned from its windows up to month_index (default: last collected)."""
+        month_index = self.month if month_index is None else month_index
+        earned = {}
+        for window, start, amount in self.streams.get(movie.get("id"), ()):
+            spec = WINDOWS[window]
+            months = min(spec["months"], max(0, month_index - start + 1))
+            earned[window] = window_total(amount, spec["decay"], months)
+        return earned
+
+    def projection(self, month_index, horizon):
+        """Catalog income for each of the `horizon` months after month_index."""
+        levels = dict(self.level)
+        counts = dict(self.open_streams)
+        projected = [0.0] * horizon
+        start = month_index + 1 if self.month is None else self.month + 1
+        for month in range(start, month_index + horizon + 1):
+            for window, spec in WINDOWS.items():
+                level = levels[window] * spec["decay"]
+                opened = self._starts[window].get(month)
+                if opened:
+                    level += opened[0]
+                    counts[window] += opened[1]
+                closed = self._ends[window].get(month)
+                if closed:
+                    level -= closed[0]
+                    counts[window] -= closed[1]
+                levels[window] = level if counts[window] else 0.0
+            offset = month - month_index - 1
+            if offset >= 0:
+                projected[offset] = sum(levels.values())
+        return projected
+
+    def summary(self):
+        return {
+            "titles": len(self.streams),
+            "monthly": self.monthly_income(),
+            "earned": dict(self.earned),
+            "by_window": {WINDOWS[w]["label"]: self.level[w] for w in WINDOWS},
+        }
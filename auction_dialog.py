@@ -23,6 +23,11 @@ class AuctionDialog(QtWidgets.QDialog):
         self.status_label = QtWidgets.QLabel(f"Current Bid: ${self.current_bid}M by {self.highest_bidder}")
         layout.addWidget(self.status_label)
 
+        # What the cash-flow forecast says can go without the balance dipping under its reserve
+        self.safe_limit = self.studio.cashflow.spending_limit() if self.studio.cashflow.now is not None else None
+        if self.safe_limit is not None:
+            layout.addWidget(QtWidgets.QLabel(f"Safe to spend: ${self.safe_limit:,.1f}M"))
+
         self.bid_input = QtWidgets.QDoubleSpinBox()
         self.bid_input.setPrefix("$")
         self.bid_input.setRange(self.current_bid + 0.1, self.studio.balance)
@@ -40,7 +45,7 @@ class AuctionDialog(QtWidgets.QDialog):
         from random import uniform
         # Each rival may decide to bid up to 140% of base value
         for rival in self.rivals:
-            if rival.balance > self.current_bid * 1.1:
+            if rival.spending_limit() > self.current_bid * 1.1:
                 rival_bid = round(uniform(self.current_bid, self.current_bid * 1.3), 2)
                 if rival_bid > self.current_bid:
                     self.current_bid = rival_bid
@@ -55,6 +60,12 @@ class AuctionDialog(QtWidgets.QDialog):
         if player_bid > self.studio.balance:
             QtWidgets.QMessageBox.warning(self, "Insufficient Funds", "You can't afford that bid.")
             return
+        if self.safe_limit is not None and player_bid > self.safe_limit:
+            answer = QtWidgets.QMessageBox.question(
+                self, "Cash Flow Warning",
+                f"A ${player_bid}M bid is over the ${self.safe_limit:,.1f}M your cash-flow forecast can spare. Bid anyway?")
+            if answer != QtWidgets.QMessageBox.Yes:
+                return
         self.current_bid = player_bid
         self.highest_bidder = self.studio.name
         self._simulate_rival_bids()
@@ -0,0 +1,123 @@
+# HollywoodSim/game/audience.py
+
+"""
+Audience Segments
+-----------------
+Who turns up for a film. The moviegoing audience is split into segments
+(families, teens, adults, cinephiles), each with a size, a taste for
+every genre, the ratings it can (or will) see, and a month-by-month
+attendance pattern: families go in the summer and the holidays, teens
+in the summer and at Halloween, cinephiles in awards season.
+
+For a calendar month, demand for every genre/rating pair is one matrix
+product:
+
+    DEMAND[month] = PREFERENCES^T  x  diag(size * attendance[month])  x  ELIGIBILITY
+     (genre x rating)  (genre x segment)    (segment x segment)       (segment x rating)
+
+All twelve products are computed at import, so pricing a film's
+audience is a single lookup, DEMAND[month][genre id][rating id], however
+finely the segments are drawn. The table replaces the flat
+RATINGS[...]["max_audience"] cap: each rating is scaled so that its
+average over every genre and month is the old cap, and the segments
+decide which genres and months do better or worse than that. Attendance
+patterns average 1 over the year, so they move audiences between months
+rather than add to the genre's peak-season bonus.
+"""
+
+from functools import lru_cache
+
+from econ_tables import GENRE_NAMES, RATING_NAMES, RATING_CAPS, MONTHS
+
+SEGMENTS = {
+    "families": {
+        "label": "Families", "size": 0.25,
+        "genres": {"Family": 1.8, "Animation": 1.8, "Musical": 1.3, "Adventure": 1.3, "Fantasy": 1.3,
+                   "Comedy": 1.1, "Drama": 0.6, "Romance": 0.6, "Documentary": 0.6, "Mystery": 0.7,
+                   "Western": 0.7, "Thriller": 0.4, "Horror": 0.1},
+        "ratings": {"G": 1.0, "PG": 1.0, "PG-13": 0.5, "R": 0.05, "NC-17": 0.0},
+        "attendance": {1: 0.8, 2: 0.8, 6: 1.3, 7: 1.3, 8: 1.3, 9: 0.7, 10: 0.9, 11: 1.1, 12: 1.4},
+    },
+    "teens": {
+        "label": "Teens", "size": 0.20,
+        "genres": {"Horror": 1.6, "Action": 1.4, "Sci-Fi": 1.3, "Comedy": 1.3, "Fantasy": 1.2,
+                   "Romance": 1.1, "Animation": 0.9, "Musical": 0.8, "Drama": 0.6, "Family": 0.4,
+                   "Western": 0.4, "Documentary": 0.3},
+        # Too old for G, mostly too young for R
+        "ratings": {"G": 0.5, "PG": 0.8, "PG-13": 1.0, "R": 0.4, "NC-17": 0.0},
+        "attendance": {1: 0.9, 2: 0.9, 3: 0.9, 6: 1.35, 7: 1.35, 8: 1.35, 9: 0.8, 10: 1.15, 12: 1.1},
+    },
+    "adults": {
+        "label": "Adults", "size": 0.40,
+        "genres": {"Thriller": 1.3, "Drama": 1.2, "Mystery": 1.2, "Romance": 1.2, "Action": 1.1,
+                   "Comedy": 1.1, "Horror": 0.8, "Animation": 0.8, "Family": 0.8},
+        "ratings": {"G": 0.7, "PG": 0.9, "PG-13": 1.0, "R": 1.0, "NC-17": 0.6},
+        "attendance": {8: 0.9, 12: 1.1},
+    },
+    "cinephiles": {
+        "label": "Cinephiles", "size": 0.15,
+        "genres": {"Drama": 1.6, "Documentary": 1.6, "Western": 1.2, "Mystery": 1.1, "Musical": 1.1,
+                   "Sci-Fi": 0.9, "Animation": 0.9, "Action": 0.6, "Horror": 0.6, "Family": 0.5},
+        "ratings": {"G": 0.8, "PG": 0.9, "PG-13": 1.0, "R": 1.0, "NC-17": 0.9},
+        "attendance": {1: 1.2, 2: 1.2, 6: 0.7, 7: 0.7, 8: 0.7, 10: 1.3, 11: 1.3, 12: 1.3},
+    },
+}
+
+SEGMENT_NAMES = tuple(SEGMENTS)
+SEGMENT_LABELS = tuple(SEGMENTS[s]["label"] for s in SEGMENT_NAMES)
+
+# Dense matrices; a trailing genre/rating column of 1.0 covers unknown names, as in econ_tables
+PREFERENCES = tuple(tuple(SEGMENTS[s]["genres"].get(g, 1.0) for g in GENRE_NAMES) + (1.0,) for s in SEGMENT_NAMES)
+ELIGIBILITY = tuple(tuple(SEGMENTS[s]["ratings"].get(r, 1.0) for r in RATING_NAMES) + (1.0,) for s in SEGMENT_NAMES)
+
+
+def _attendance(segment):
+    """A segment's size by month; the attendance pattern averages 1 over the year."""
+    pattern = [SEGMENTS[segment]["attendance"].get(m, 1.0) for m in MONTHS]
+    mean = sum(pattern) / len(pattern)
+    return [SEGMENTS[segment]["size"] * f / mean for f in pattern]
+
+
+# ATTENDANCE[month][segment] -> how much of the segment goes to the movies (index 0 unused)
+ATTENDANCE = ((1.0,) * len(SEGMENT_NAMES),) + tuple(zip(*(_attendance(s) for s in SEGMENT_NAMES)))
+
+
+def _demand_matrix(weights):
+    """PREFERENCES^T x diag(weights) x ELIGIBILITY -> [genre][rating]."""
+    weighted = [[w * e for e in row] for w, row in zip(weights, ELIGIBILITY)]
+    return tuple(
+        tuple(sum(p * row[r] for p, row in zip(prefs, weighted)) for r in range(len(ELIGIBILITY[0])))
+        for prefs in zip(*PREFERENCES)
+    )
+
+
+_RAW = (None,) + tuple(_demand_matrix(ATTENDANCE[m]) for m in MONTHS)
+
+
+def _scale(rid):
+    """Make the average genre, over the year, demand the rating's old cap (econ_tables.RATING_CAPS)."""
+    mean = sum(_RAW[m][g][rid] for m in MONTHS for g in range(len(GENRE_NAMES))) / (len(MONTHS) * len(GENRE_NAMES))
+    return RATING_CAPS[rid] / mean if mean else 0.0
+
+
+# AUDIENCE_SCALE[rating id] -> factor bringing the rating's average demand to its old cap
+AUDIENCE_SCALE = tuple(_scale(rid) for rid in range(len(RATING_NAMES) + 1))
+
+# DEMAND[month][genre id][rating id] -> audience demand multiplier
+DEMAND = (None,) + tuple(
+    tuple(tuple(AUDIENCE_SCALE[rid] * d for rid, d in enumerate(row)) for row in _RAW[m]) for m in MONTHS
+)
+
+
+@lru_cache(maxsize=None)
+def segment_shares(gid, rid, month):
+    """Each segment's share of a film's audience (sums to 1, or all zero if nobody can see it)."""
+    turnout = [w * prefs[gid] * elig[rid] for w, prefs, elig in zip(ATTENDANCE[month], PREFERENCES, ELIGIBILITY)]
+    total = sum(turnout)
+    return tuple(t / total if total else 0.0 for t in turnout)
+
+
+def audience_text(shares):
+    """'Families 48% · Adults 30% ...' for a film's segment shares, biggest first."""
+    ranked = sorted(zip(SEGMENT_LABELS, shares or ()), key=lambda item: -item[1])
+    return " · ".join(f"{label} {share:.0%}" for label, share in ranked if share >= 0.01) or "N/A"
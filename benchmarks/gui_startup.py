@@ -0,0 +1,54 @@
+# HollywoodSim/benchmarks/gui_startup.py
+# Cold-launch benchmark for the GUI: runs `gui_main.py --startup-benchmark`
+# in fresh interpreters and reports time to first paint and to a playable market.
+#
+#   python benchmarks/gui_startup.py --runs 5 --budget-ms 1500
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_LINE = re.compile(r"STARTUP first_paint_ms=([\d.]+) ready_ms=([\d.]+)")
+
+
+def launch_once():
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")  # no display needed
+    result = subprocess.run(
+        [sys.executable, "gui_main.py", "--startup-benchmark"],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=120,
+    )
+    match = STARTUP_LINE.search(result.stdout)
+    if not match:
+        raise RuntimeError(f"gui_main.py did not report startup times:\n{result.stdout}{result.stderr}")
+    return float(match.group(1)), float(match.group(2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure GUI cold-start time.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="exit non-zero if median time to first paint exceeds this")
+    args = parser.parse_args()
+
+    paints, readies = [], []
+    for _ in range(args.runs):
+        paint, ready = launch_once()
+        paints.append(paint)
+        readies.append(ready)
+
+    paint_median = statistics.median(paints)
+    print(f"first paint: median {paint_median:.1f} ms, max {max(paints):.1f} ms ({args.runs} runs)")
+    print(f"market ready: median {statistics.median(readies):.1f} ms, max {max(readies):.1f} ms")
+
+    if args.budget_ms is not None and paint_median > args.budget_ms:
+        print(f"❌ First paint over budget ({args.budget_ms:.0f} ms)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
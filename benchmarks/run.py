@@ -0,0 +1,369 @@
+# HollywoodSim/benchmarks/run.py
+# Micro- and macro-benchmarks for the monthly turn. Each benchmark runs
+# against headless worlds of several sizes (see worlds.py) and reports
+# ops/sec and peak traced memory. Results are written as JSON and can be
+# compared against a saved baseline to catch regressions.
+#
+#   python benchmarks/run.py                          # small + medium
+#   python benchmarks/run.py --sizes large --filter box_office
+#   python benchmarks/run.py --save-baseline          # record benchmarks/baseline.json
+#   python benchmarks/run.py --baseline benchmarks/baseline.json --threshold 0.2
+
+import argparse
+import copy
+import gc
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from worlds import World, SIZES, quiet
+
+from market import refresh_market, adjust_market_prices
+from talent_tasks import progress_tasks
+from scheduling import ResourceCalendar, SOUNDSTAGES
+from box_office_ticks import TickBoxOffice
+from ancillary import AncillaryMarket
+import events
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUT = os.path.join(BENCH_DIR, "results", "latest.json")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+# name -> function(world) returning (setup, op); setup runs untimed before each op
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+# === Box office ===
+@benchmark("box_office.simulate")
+def bench_simulate_box_office(world):
+    movies = itertools.cycle([dict(m) for m in world.studio.released_movies[:200]])
+
+    def op():
+        world.studio.simulate_box_office(next(movies), world.calendar)
+    return None, op
+
+
+@benchmark("box_office.update_revenue")
+def bench_update_revenue(world):
+    studio = world.studio
+    curves = {id(m): list(m["monthly_revenue"]) or [1.0] for m in studio.released_movies}
+
+    def setup():
+        # Keep every film in its run so each tick does the same work
+        for movie in studio.released_movies:
+            if not movie["monthly_revenue"]:
+                movie["monthly_revenue"] = list(curves[id(movie)])
+
+    return setup, studio.update_revenue
+
+
+def _tick_revenue_benchmark(resolution):
+    def bench(world):
+        # The same films as box_office.update_revenue, run at a finer resolution with competition
+        studio = world.studio
+        studio.box_office = TickBoxOffice(resolution)
+        curves = {id(m): list(m["monthly_revenue"]) or [1.0] for m in studio.released_movies}
+
+        def setup():
+            world.calendar.week = world.calendar.day = 1  # each run plays the whole month
+            for movie in studio.released_movies:
+                if not movie["monthly_revenue"]:
+                    movie["monthly_revenue"] = studio.box_office.start_run(movie, curves[id(movie)])
+
+        def op():
+            studio.update_revenue(world.calendar)
+        return setup, op
+    return bench
+
+
+for _resolution in ("weekly", "daily"):
+    benchmark(f"box_office.update_revenue_{_resolution}")(_tick_revenue_benchmark(_resolution))
+
+
+@benchmark("ancillary.collect")
+def bench_ancillary_catalog(world):
+    # The world's whole history as a back catalog, runs ending over the last ten years
+    catalog = AncillaryMarket()
+    now = world.calendar.month_index()
+    for film in world.studio.movie_history:
+        catalog.open({"id": film["id"], "box_office": random.uniform(5, 200),
+                      "release_strategy": film.get("release_strategy")}, now - random.randrange(120))
+    catalog.collect(now)
+    months = itertools.count(now + 1)
+
+    def op():
+        catalog.collect(next(months))
+    return None, op
+
+
+# === Financing ===
+@benchmark("financing.debt_service")
+def bench_debt_service(world):
+    months = itertools.count(world.calendar.month_index() + 1)
+
+    def op():
+        world.studio.financing.service(next(months))
+    return None, op
+
+
+# === Production ===
+@benchmark("production.advance")
+def bench_production_pipeline(world):
+    # A studio starting `productions` films a month; in steady state ~4x that are in flight
+    pipeline = world.studio.production
+    films = list(itertools.islice(itertools.cycle(world.studio.released_movies), world.spec["productions"]))
+
+    def op():
+        for film in films:
+            pipeline.start(dict(film), world.calendar)
+        world.calendar.advance()
+        pipeline.advance(world.calendar)
+    return None, op
+
+
+@benchmark("scheduling.book")
+def bench_resource_booking(world):
+    # A soundstage lot carrying one booking per film in the world's history
+    lot = ResourceCalendar("Soundstages", SOUNDSTAGES)
+    horizon = world.spec["history"] // 2
+    for _ in range(world.spec["history"]):
+        start = random.randrange(horizon)
+        if lot.is_free(start, start + 2):
+            lot.book(start, start + 2, "film")
+    booked = []
+
+    def setup():
+        while booked:
+            lot.cancel(booked.pop())
+
+    def op():
+        start = lot.next_free(random.randrange(horizon), 3)
+        booked.append(lot.book(start, start + 2, "film"))
+    return setup, op
+
+
+# === Market ===
+@benchmark("market.refresh")
+def bench_refresh_market(world):
+    def op():
+        refresh_market(world.pool, world.casting_pool, world.calendar, world.studio)
+    return world.trim_pool, op
+
+
+@benchmark("market.adjust_prices")
+def bench_adjust_prices(world):
+    def op():
+        adjust_market_prices(world.pool, world.calendar)
+    return None, op
+
+
+@benchmark("rivals.act_month")
+def bench_rivals(world):
+    reserve = {k: list(getattr(world.pool, k)) * 4 for k in world.pool_sizes}
+
+    def setup():
+        world.restock_pool(reserve)
+        if not all(reserve.values()):
+            reserve.update({k: list(getattr(world.pool, k)) * 4 for k in world.pool_sizes})
+        for rival in world.rivals:
+            rival.balance = 1e12
+
+    def op():
+        for rival in world.rivals:
+            rival.act_month(world.pool, world.calendar)
+    return setup, op
+
+
+# === Events & tasks ===
+@benchmark("events.random_events")
+def bench_random_events(world):
+    studio = world.studio
+
+    def setup():
+        # Worst case: every film in release still waiting for its event roll
+        for movie in studio.released_movies:
+            movie["event_checked"] = False
+        studio.newsfeed = []
+
+    def op():
+        events.run_random_events(studio, world.calendar)
+    return setup, op
+
+
+@benchmark("tasks.progress")
+def bench_progress_tasks(world):
+    completed = []
+
+    def setup():
+        for result in completed:
+            world.assign_random_task(world.contracts_by_pid[result["person"]["id"]])
+        completed.clear()
+
+    def op():
+        completed.extend(progress_tasks(world.studio))
+    return setup, op
+
+
+# === Full turn ===
+@benchmark("turn.full_year")
+def bench_full_year(world):
+    def op():
+        for _ in range(12):
+            world.run_month()
+    return None, op
+
+
+# === Harness ===
+def measure(setup, op, min_time, max_runs):
+    """Time op() repeatedly (setup excluded) until min_time has been spent."""
+    runs = 0
+    elapsed = 0.0
+    # Like timeit: a full collection over a large world would land in whichever op triggers it
+    gc.collect()
+    gc.disable()
+    try:
+        while runs < max_runs and (elapsed < min_time or runs < 3):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            op()
+            elapsed += time.perf_counter() - start
+            runs += 1
+    finally:
+        gc.enable()
+    return runs, elapsed
+
+
+def peak_memory(setup, op):
+    """Peak traced allocation (KiB) during a single op."""
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def run_suite(sizes, pattern, min_time, max_runs, seed):
+    results = []
+    for size in sizes:
+        build_start = time.perf_counter()
+        base = World(size, seed=seed)
+        print(f"[{size}] world built in {time.perf_counter() - build_start:.2f}s", file=sys.stderr)
+
+        for name, make in BENCHMARKS.items():
+            if pattern and pattern not in name:
+                continue
+            # Each benchmark gets its own copy so earlier ones cannot skew it
+            world = copy.deepcopy(base)
+            random.seed(seed)
+            with quiet():
+                setup, op = make(world)
+                runs, elapsed = measure(setup, op, min_time, max_runs)
+                peak_kb = peak_memory(setup, op)
+            result = {
+                "name": name,
+                "size": size,
+                "runs": runs,
+                "ops_per_sec": runs / elapsed,
+                "mean_ms": elapsed / runs * 1000,
+                "peak_kb": peak_kb,
+            }
+            results.append(result)
+            print(f"  {name:<28} {result['ops_per_sec']:>12,.1f} ops/s {result['mean_ms']:>10.3f} ms "
+                  f"{peak_kb:>10,.1f} KiB", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print per-benchmark change against the baseline; return the regressions."""
+    previous = {(r["name"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    print(f"\n{'benchmark':<28} {'size':<7} {'ops/s':>12} {'baseline':>12} {'change':>8}")
+    for r in results:
+        old = previous.get((r["name"], r["size"]))
+        if not old:
+            print(f"{r['name']:<28} {r['size']:<7} {r['ops_per_sec']:>12,.1f} {'-':>12} {'new':>8}")
+            continue
+        change = r["ops_per_sec"] / old["ops_per_sec"] - 1
+        flag = ""
+        if change < -threshold:
+            flag = " ❌"
+            regressions.append((r, old, change))
+        print(f"{r['name']:<28} {r['size']:<7} {r['ops_per_sec']:>12,.1f} {old['ops_per_sec']:>12,.1f} "
+              f"{change:>+7.0%}{flag}")
+    return regressions
+
+
+def write_json(path, payload):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the monthly turn phases.")
+    parser.add_argument("--sizes", default="small,medium",
+                        help=f"comma-separated world sizes ({', '.join(SIZES)})")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds of timed runs per benchmark")
+    parser.add_argument("--max-runs", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", default=DEFAULT_OUT, help="where to write this run's JSON")
+    parser.add_argument("--baseline", default=None, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help=f"also write results to {DEFAULT_BASELINE}")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="fractional ops/sec drop that counts as a regression")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return
+
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        parser.error(f"unknown size(s): {', '.join(unknown)}")
+
+    results = run_suite(sizes, args.filter, args.min_time, args.max_runs, args.seed)
+    payload = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "results": results,
+    }
+    write_json(args.out, payload)
+    print(f"\nResults written to {args.out}")
+    if args.save_baseline:
+        write_json(DEFAULT_BASELINE, payload)
+        print(f"Baseline saved to {DEFAULT_BASELINE}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
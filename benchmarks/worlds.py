@@ -0,0 +1,162 @@
+# HollywoodSim/benchmarks/worlds.py
+# Headless game worlds of a few fixed sizes for the benchmark suite.
+
+import contextlib
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from studio import Studio
+from calendar_1 import GameCalendar
+from market import init_market, refresh_market, adjust_market_prices
+from personnel import CastingPool, generate_actor, generate_director, generate_writer, generate_staff_member
+from scripts import generate_script
+from contracts import create_contract
+from rivals import RivalStudio
+from talent_tasks import assign_task, progress_tasks, COMPILED_TASKS
+from game_data import STAFF_SPECIALTIES
+import events
+
+# pool: market pool actors (other roles and scripts scale from it)
+# history: films already released; released: films still in their run
+# contracts: talent under contract, all kept busy with tasks
+# loans: open bank loans being repaid
+# productions: films started per month in the production pipeline benchmark
+SIZES = {
+    "small": {"pool": 50, "history": 200, "released": 20, "contracts": 20, "loans": 10, "productions": 5},
+    "medium": {"pool": 500, "history": 2000, "released": 200, "contracts": 200, "loans": 100, "productions": 50},
+    "large": {"pool": 5000, "history": 20000, "released": 2000, "contracts": 2000, "loans": 1000, "productions": 500},
+}
+
+CONTRACT_ROLES = ("actors", "writers", "directors", "staff")
+
+
+class _Discard:
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def quiet():
+    """Swallow the game's console output while benchmarking."""
+    return contextlib.redirect_stdout(_Discard())
+
+
+class World:
+    def __init__(self, size, seed=1):
+        spec = SIZES[size]
+        random.seed(seed)
+        self.size = size
+        self.spec = spec
+        self.calendar = GameCalendar(market_seed=seed)
+        self.studio = Studio(year=self.calendar.year)
+        self.studio.balance = 1e12
+        self.pool = init_market()
+        self.casting_pool = CastingPool()
+        self.rivals = [
+            RivalStudio("Silver Screen Studios", balance=150, prestige=10),
+            RivalStudio("Golden Gate Films", balance=120, prestige=8),
+            RivalStudio("Sunset Pictures", balance=100, prestige=5),
+        ]
+        year = self.calendar.year
+
+        with quiet():
+            self._fill_pool(year)
+            self.actors = [generate_actor(year) for _ in range(max(10, spec["pool"] // 5))]
+            self.directors = [generate_director(year) for _ in range(max(3, spec["pool"] // 20))]
+            self.writers = [generate_writer(year) for _ in range(max(3, spec["pool"] // 20))]
+            for _ in range(spec["history"]):
+                self.release_film()
+            self.studio.released_movies = self.studio.released_movies[-spec["released"]:]
+            self._sign_contracts(year)
+            for _ in range(spec["loans"]):
+                self.studio.financing.take_loan(random.uniform(1, 20), random.uniform(0.05, 0.12),
+                                                self.calendar, term_months=random.randint(120, 600))
+
+    # === Setup ===
+    def _fill_pool(self, year):
+        n = self.spec["pool"]
+        for _ in range(n):
+            self.pool.add_actor(generate_actor(year))
+        for _ in range(max(2, n // 5)):
+            self.pool.add_director(generate_director(year))
+            self.pool.add_writer(generate_writer(year))
+            self.pool.add_staff(generate_staff_member(random.choice(list(STAFF_SPECIALTIES)), year))
+        for _ in range(max(5, n // 2)):
+            self.pool.add_script(generate_script(self.calendar, random.choice(self.pool.writers)))
+        adjust_market_prices(self.pool, self.calendar)
+        self.pool_sizes = self._pool_sizes()
+        self.pool.caps = dict(self.pool_sizes)  # benchmark the market at its full size
+
+    def _sign_contracts(self, year):
+        makers = {
+            "actors": lambda: generate_actor(year),
+            "writers": lambda: generate_writer(year),
+            "directors": lambda: generate_director(year),
+            "staff": lambda: generate_staff_member(random.choice(list(STAFF_SPECIALTIES)), year),
+        }
+        self.contracts_by_pid = {}
+        for i in range(self.spec["contracts"]):
+            role = CONTRACT_ROLES[i % len(CONTRACT_ROLES)]
+            person = makers[role]()
+            contract = create_contract(person, role, 10 ** 6, 0.0)
+            self.studio.sign_contract(contract)
+            self.contracts_by_pid[person["id"]] = contract
+            self.assign_random_task(contract)
+
+    def _pool_sizes(self):
+        return {k: len(getattr(self.pool, k)) for k in ("actors", "directors", "writers", "staff", "scripts")}
+
+    # === Helpers used by benchmarks ===
+    def assign_random_task(self, contract):
+        names = [name for role, name in COMPILED_TASKS if role == contract["type"]]
+        assign_task(self.studio.task_engine, contract, random.choice(names))
+
+    def trim_pool(self):
+        """Hold the market at its starting size so repeated runs stay comparable."""
+        for key, size in self.pool_sizes.items():
+            items = getattr(self.pool, key)
+            del items[size:]
+
+    def restock_pool(self, reserve):
+        """Top pools back up after rivals take scripts or actors."""
+        for key, size in self.pool_sizes.items():
+            items = getattr(self.pool, key)
+            while len(items) < size and reserve[key]:
+                items.append(reserve[key].pop())
+
+    def release_film(self):
+        """Write, produce and release one film this month."""
+        script = generate_script(self.calendar, random.choice(self.writers))
+        script["status"] = "approved"
+        movie = self.studio.produce_movie(script, random.sample(self.actors, 2),
+                                          random.choice(self.directors), self.calendar, months_ahead=0)
+        # Skip the production pipeline and bookings; they have their own benchmarks
+        self.studio.production.finish(movie)
+        self.studio.schedule.release(movie)
+        movie["release_date"] = (self.calendar.year, self.calendar.month)
+        for released in self.studio.check_for_releases(self.calendar):
+            self.studio.apply_post_production(released)
+        return movie
+
+    def run_month(self):
+        """One headless monthly turn, in the same phase order as the GUI."""
+        self.calendar.advance()
+        refresh_market(self.pool, self.casting_pool, self.calendar, self.studio)
+        adjust_market_prices(self.pool, self.calendar)
+        for rival in self.rivals:
+            rival.act_month(self.pool, self.calendar)
+        self.release_film()
+        self.studio.update_revenue(self.calendar)
+        self.studio.pay_interest(self.calendar)
+        for result in progress_tasks(self.studio):
+            self.assign_random_task(self.contracts_by_pid[result["person"]["id"]])
+        events.run_random_events(self.studio, self.calendar)
+        self.studio.renew_contracts()
+        self.trim_pool()
@@ -0,0 +1,164 @@
+# HollywoodSim/game/box_office_ticks.py
+
+"""
+Box-Office Ticks
+----------------
+Optional weekly or daily box-office resolution. The monthly model gives a
+film its total take and how many months it runs; at a finer resolution
+that total is spread over the run with an opening spike and a
+week-over-week decay that depends on the release strategy (daily ticks
+add the weekend bump), and rival openings in the same week eat into the
+weeks after them.
+
+Nothing here loops per tick at run time. The shape of a run is a
+normalized tuple built once per (strategy, ticks per month, months) and
+cached, so a film's curve is one scaled copy of it; each month takes one
+slice of the film's ticks and weights it by that month's competition
+vector, which is computed once per genre. A monthly turn therefore costs
+about the same at 4 or 30 ticks a month as at one, and the month's sum is
+what reaches the ledger.
+
+GameCalendar.week/day say how far into the month the box office has run.
+A monthly turn runs them on to the month's end (TickBoxOffice.advance)
+and collects the ticks crossed, so a month that has already been partly
+played only pays for the ticks that are left.
+"""
+
+from functools import lru_cache
+from operator import mul
+
+from calendar_1 import WEEKS_PER_MONTH
+
+RESOLUTIONS = {"monthly": 1, "weekly": 4, "daily": 30}
+
+# Strategy -> (opening-week multiple, week-over-week hold); Limited builds first
+WEEKLY_RUN = {
+    "Wide": (2.2, 0.72),
+    "Limited": (0.5, 0.90),
+    "International": (1.6, 0.82),
+    "Streaming": (1.0, 0.97),
+}
+LIMITED_BUILD_WEEKS = 6
+# Daily ticks: a release opens on a Friday; share of an average day
+WEEKDAY_FACTORS = (1.8, 1.7, 1.3, 0.6, 0.5, 0.5, 0.6)
+
+# A rival opening takes this share of same-genre business (any genre: OTHER_GENRE_HIT),
+# scaled by its performance, and loses a third of its pull every week after
+SAME_GENRE_HIT = 0.25
+OTHER_GENRE_HIT = 0.04
+COMPETITION_HOLD = 0.67
+
+
+def _week_factor(strategy, week):
+    opening, hold = WEEKLY_RUN.get(strategy, WEEKLY_RUN["Streaming"])
+    if strategy == "Limited":
+        if week < LIMITED_BUILD_WEEKS:
+            return opening + week * 0.12
+        return (opening + LIMITED_BUILD_WEEKS * 0.12) * hold ** (week - LIMITED_BUILD_WEEKS)
+    return opening * hold ** week
+
+
+@lru_cache(maxsize=None)
+def run_shape(strategy, ticks_per_month, months):
+    """Share of a film's total take earned in each tick of its run (sums to 1)."""
+    ticks_per_week = ticks_per_month / WEEKS_PER_MONTH
+    raw = []
+    for k in range(ticks_per_month * months):
+        factor = _week_factor(strategy, int(k / ticks_per_week))
+        if ticks_per_month >= 7 * WEEKS_PER_MONTH:
+            factor *= WEEKDAY_FACTORS[k % 7]
+        raw.append(factor)
+    total = sum(raw)
+    return tuple(f / total for f in raw)
+
+
+def tick_curve(movie, total, months, ticks_per_month):
+    """A film's per-tick revenue for a run of `months` that earns `total` in all."""
+    # Like the monthly model, a film with no (or an unknown) strategy runs flat
+    strategy = movie.get("release_strategy")
+    if strategy not in WEEKLY_RUN:
+        strategy = None
+    return [total * share for share in run_shape(strategy, ticks_per_month, months)]
+
+
+def rollup(ticks, ticks_per_month):
+    """Monthly sums of a tick curve."""
+    return [round(sum(ticks[i:i + ticks_per_month]), 2) for i in range(0, len(ticks), ticks_per_month)]
+
+
+def opening_week(ticks, ticks_per_month):
+    return sum(ticks[:max(1, ticks_per_month // WEEKS_PER_MONTH)])
+
+
+def competition_vectors(releases, ticks_per_month):
+    """
+    {genre: per-tick multiplier for this month} from the calendar's competition
+    releases (each opening in its "week"); genres no rival opened in use vectors[None].
+    """
+    ticks_per_week = ticks_per_month / WEEKS_PER_MONTH
+    week_of_tick = [int(k / ticks_per_week) + 1 for k in range(ticks_per_month)]
+
+    def vector(hit_for):
+        out = [1.0] * ticks_per_month
+        for release in releases:
+            hit = hit_for(release) * release.get("performance", 50) / 100
+            if not hit:
+                continue
+            opens = release.get("week", 1)
+            for k, week in enumerate(week_of_tick):
+                if week >= opens:
+                    out[k] *= 1 - hit * COMPETITION_HOLD ** (week - opens)
+        return out
+
+    vectors = {genre: vector(lambda r, g=genre: SAME_GENRE_HIT if r["genre"] == g else OTHER_GENRE_HIT)
+               for genre in {r["genre"] for r in releases}}
+    vectors[None] = vector(lambda r: OTHER_GENRE_HIT)
+    return vectors
+
+
+class TickBoxOffice:
+    """A studio's box-office resolution and this month's competition vectors."""
+
+    def __init__(self, resolution="monthly"):
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown box-office resolution: {resolution}")
+        self.resolution = resolution
+        self.ticks = RESOLUTIONS[resolution]
+        self._vectors = (None, None)  # (month index, {genre: vector})
+
+    @property
+    def enabled(self):
+        return self.ticks > 1
+
+    def start_run(self, movie, curve):
+        """Spread a monthly curve over ticks; returns the monthly rollup to use instead."""
+        ticks = tick_curve(movie, sum(curve), len(curve), self.ticks)
+        n = self.ticks
+        # Split by month up front so each turn just pops its slice
+        movie["tick_revenue"] = [tuple(ticks[i:i + n]) for i in range(0, len(ticks), n)]
+        movie["opening_week"] = round(opening_week(ticks, n), 2)
+        return rollup(ticks, n)
+
+    def advance(self, calendar):
+        """Run the calendar's week/day on to the end of the month; returns the (first, end) ticks crossed."""
+        return calendar.advance_ticks(self.ticks, self.ticks)
+
+    def month_take(self, movie, weights=None, span=None):
+        """
+        A film's ticks in span (default: the whole month), weighted by competition if given.
+        The month is consumed once span reaches its end.
+        """
+        first, end = span or (0, self.ticks)
+        month = movie["tick_revenue"][0][first:end]
+        if end >= self.ticks:
+            movie["tick_revenue"].pop(0)
+        if weights is None:
+            return sum(month)
+        return sum(map(mul, month, (weights.get(movie["genre"]) or weights[None])[first:end]))
+
+    def vectors(self, calendar):
+        """This month's {genre: competition vector}, computed once per month."""
+        key = calendar.month_index()
+        if self._vectors[0] != key:
+            self._vectors = (key, competition_vectors(calendar.competition_releases, self.ticks))
+        return self._vectors[1]
@@ -1,11 +1,17 @@
 # HollywoodSim/game/calendar_1.py
 # Dynamic in-game calendar with economic cycles, competition, and event-driven market effects
 
+import heapq
 import random
 from genres import GENRES as GENRE_LIST
+from market_series import MarketSeries, SPECIAL_EVENTS
+
+DAYS_PER_MONTH = 30
+WEEKS_PER_MONTH = 4
 
 class GameCalendar:
-    def __init__(self, start_year=2025):
+    def __init__(self, start_year=2025, market_seed=None):
+        self.start_year = start_year
         self.year = start_year
         self.month = 1
         self.week = 1
@@ -18,14 +24,22 @@ class GameCalendar:
         self.streaming_impact = 0.0
         self.competition_level = "medium"
 
+        # Seeded market paths; the calendar replays them month by month
+        if market_seed is None:
+            market_seed = random.getrandbits(32)
+        self.market = MarketSeries(start_year, self.generate_annual_events, seed=market_seed)
+
         # Genre Trends
         self.trending_genres = self.new_trends()
         self.forecast_genres = self.generate_forecast()
 
         # Events
         self.events = self.generate_annual_events(self.year)
-        self.special_events = []
+        self.special_events = []     # special events in effect right now
         self.historical_events = []
+        self._event_expiry = []      # heap of (end month index, seq, event)
+        self._extra_events = []      # active events added outside the market series
+        self._modifier_cache = None  # (month index, composite modifier)
 
         # Release strategy
         self.release_windows = self.calculate_release_windows()
@@ -48,6 +62,8 @@ class GameCalendar:
     def advance(self, days=30):
         """Advance by ~month (default 30 days)."""
         self.month += 1
+        self.week = 1  # week/day mark the position inside the month for sub-month box office
+        self.day = 1
         if self.month > 12:
             self.month = 1
             self.year += 1
@@ -58,13 +74,43 @@ class GameCalendar:
         self.update_market_index()
         return self.get_market_report()
 
+    def advance_ticks(self, ticks, ticks_per_month):
+        """
+        Move week/day on by `ticks` of a month split into ticks_per_month; stops at the
+        month's end. Returns the (first, end) tick range crossed, end exclusive.
+        """
+        first = self.tick_of(ticks_per_month)
+        end = min(ticks_per_month, first + ticks)
+        if end >= ticks_per_month:
+            self.day = DAYS_PER_MONTH + 1  # the month is used up until advance()
+        else:
+            self.day = end * DAYS_PER_MONTH // ticks_per_month + 1
+        self.week = min(WEEKS_PER_MONTH, end * WEEKS_PER_MONTH // ticks_per_month + 1)
+        return first, end
+
+    def tick_of(self, ticks_per_month):
+        """Which tick of the month week/day point at, for a month split into ticks_per_month."""
+        return min(ticks_per_month, -(-(self.day - 1) * ticks_per_month // DAYS_PER_MONTH))
+
+    def month_index(self, year=None, month=None):
+        """Months since January of the start year (the market series index)."""
+        year = self.year if year is None else year
+        month = self.month if month is None else month
+        return (year - self.start_year) * 12 + (month - 1)
+
+    def date_of(self, index):
+        """(year, month) for a month_index()."""
+        year, month = divmod(index, 12)
+        return self.start_year + year, month + 1
+
     # === Event Hooks ===
     def on_month_change(self):
         if self.month % 3 == 1:
             self.trending_genres = self.forecast_genres
             self.forecast_genres = self.generate_forecast()
-        if random.random() < 0.2:
-            self.generate_special_event()
+        self.expire_special_events()
+        for e in self.market.event_starts.get(self.month_index(), ()):
+            self._start_special_event(e)
         self.generate_competition_releases()
         self.record_monthly_stats()
 
@@ -93,33 +139,35 @@ class GameCalendar:
 
     # === Market Logic ===
     def update_market_conditions(self):
-        self.market_sentiment = round(max(0.5, min(1.5, self.market_sentiment + random.uniform(-0.05, 0.05))), 2)
-        self.streaming_impact = round(max(-0.3, min(0.3, self.streaming_impact + random.uniform(-0.02, 0.02))), 2)
+        t = self.month_index()
+        self.market_sentiment = self.market.sentiment_at(t)
+        self.streaming_impact = self.market.streaming_at(t)
 
     def update_economy(self):
-        roll = random.random()
-        if roll < 0.15:
-            self.economy_state = "recession"
-        elif roll < 0.30:
-            self.economy_state = "boom"
-        else:
-            self.economy_state = "stable"
-
-    def get_market_modifier(self):
-        mod = self.market_sentiment
-        if self.economy_state == "boom": mod *= 1.1
-        elif self.economy_state == "recession": mod *= 0.9
-        event = self.get_current_event()
-        if event: mod *= event.get("market_boost", 1.0)
-        for e in self.get_active_special_events():
-            mod *= (1 + e["impact"])
-        return round(mod, 2)
+        self.economy_state = self.market.economy_at(self.month_index())
+
+    def get_market_modifier(self, year=None, month=None):
+        """Combined market modifier for any month (default: the current one)."""
+        t = self.month_index(year, month)
+        cached = self._modifier_cache
+        if cached and cached[0] == t:
+            return cached[1]
+
+        mod = self.market.modifier_at(t)
+        extra = False
+        for e in self._extra_events:
+            start, end = self._span(e)
+            if start <= t <= end:
+                mod *= (1 + e["impact"])
+                extra = True
+        if extra:
+            mod = round(mod, 2)
+        self._modifier_cache = (t, mod)
+        return mod
 
     def update_market_index(self):
         """Track overall market performance like a stock index."""
-        mod = self.get_market_modifier()
-        change = (mod - 1.0) * random.uniform(5, 10)
-        self.market_index = round(max(50, min(150, self.market_index + change)), 2)
+        self.market_index = self.market.index_at(self.month_index())
 
     def get_market_index_trend(self):
         """Returns 📈 or 📉 depending on last sentiment."""
@@ -139,13 +187,14 @@ class GameCalendar:
         num_releases = random.randint(1, 5)  # e.g. 1–5 competing releases
         self.competition_releases = []
 
-        for _ in range(num_releases):
+        for i in range(num_releases):
             genre = random.choice(list(GENRE_LIST.keys()))
             performance = round(random.uniform(40, 100), 2)  # arbitrary success index
             self.competition_releases.append({
                 "title": f"Rival Film {random.randint(100,999)}",
                 "genre": genre,
-                "performance": performance
+                "performance": performance,
+                "week": 1 + i * 4 // num_releases,  # opening week, read by box_office_ticks
             })
 
         # Optional: adjust competition level
@@ -159,20 +208,36 @@ class GameCalendar:
 
     # === Events ===
     def generate_special_event(self):
-        events = [
-            {"name": "Streaming Wars Intensify", "impact": -0.1, "duration": 3},
-            {"name": "New Tech Breakthrough", "impact": 0.15, "duration": 2},
-            {"name": "Major Scandal Hits Competitor", "impact": -0.2, "duration": 2},
-            {"name": "Prestigious Festival Buzz", "impact": 0.1, "duration": 1},
-        ]
-        e = random.choice(events).copy()
+        """Start an unscheduled special event now (outside the market series)."""
+        e = random.choice(SPECIAL_EVENTS).copy()
         e["start"] = (self.year, self.month)
         e["end"] = (self.year, min(12, self.month + e["duration"]))
+        self._extra_events.append(e)
+        self._start_special_event(e)
+        self._modifier_cache = None
+
+    def _span(self, e):
+        return self.month_index(*e["start"]), self.month_index(*e["end"])
+
+    def _start_special_event(self, e):
         self.special_events.append(e)
         self.historical_events.append(e)
+        heapq.heappush(self._event_expiry, (self._span(e)[1], len(self.historical_events), e))
+
+    def expire_special_events(self):
+        """Drop special events whose last month has passed."""
+        now = self.month_index()
+        expired = False
+        while self._event_expiry and self._event_expiry[0][0] < now:
+            _, _, e = heapq.heappop(self._event_expiry)
+            if e in self._extra_events:
+                self._extra_events.remove(e)
+            expired = True
+        if expired:
+            self.special_events = [e for _, _, e in sorted(self._event_expiry, key=lambda item: item[1])]
 
     def get_active_special_events(self):
-        return [e for e in self.special_events if e["end"][0] > self.year or (e["end"][0] == self.year and e["end"][1] >= self.month)]
+        return list(self.special_events)
 
     # === Reporting ===
     def display(self):
@@ -205,15 +270,11 @@ class GameCalendar:
         }
 
     def simulate_forward(self, months=3):
+        """Annual events and market outlook for the next `months` months."""
         forecast = []
-        for i in range(1, months + 1):
-            m = (self.month - 1 + i) % 12 + 1
-            y = self.year + ((self.month - 1 + i) // 12)
-            e = self.events.get(m)
-            forecast.append({
-                "month": m,
-                "year": y,
-                "name": e["name"] if e else "None",
-                "boost": e["market_boost"] if e else 1.0,
-            })
+        for snapshot in self.market.window(self.month_index() + 1, months):
+            e = self.events.get(snapshot["month"])
+            snapshot["name"] = e["name"] if e else "None"
+            snapshot["boost"] = e["market_boost"] if e else 1.0
+            forecast.append(snapshot)
         return forecast
\ No newline at end of file
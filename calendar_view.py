@@ -1,6 +1,7 @@
 # HollywoodSim/game/calendar_view.py
 
 from PySide6 import QtWidgets, QtCore, QtGui
+from profiling import PROFILER
 
 
 class CalendarView(QtWidgets.QWidget):
@@ -169,6 +170,7 @@ class CalendarView(QtWidgets.QWidget):
         ][:3]
 
         self.events_table.setRowCount(len(upcoming))
+        PROFILER.count("rows_rendered", len(upcoming))
         for row, (year, month, event) in enumerate(upcoming):
             self.events_table.setItem(row, 0, QtWidgets.QTableWidgetItem(self.calendar.month_name_from_num(month)))
             self.events_table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(year)))
@@ -0,0 +1,122 @@
+# HollywoodSim/game/career_stats.py
+
+"""
+Career Statistics Cache
+-----------------------
+Running totals for every person and every collaborating pair, kept up to
+date as films release and earn. Recaps and pairing descriptions read a
+single record instead of summing over full film histories.
+"""
+
+import math
+
+
+class CareerStats:
+    """Count, sums and sums of squares for a person's (or pair's) films."""
+
+    __slots__ = ("count", "quality_sum", "quality_sq", "box_office_sum",
+                 "box_office_sq", "last_film", "genres")
+
+    def __init__(self):
+        self.count = 0
+        self.quality_sum = 0.0
+        self.quality_sq = 0.0
+        self.box_office_sum = 0.0
+        self.box_office_sq = 0.0
+        self.last_film = None
+        self.genres = {}
+
+    def add_film(self, movie, quality, box_office):
+        self.count += 1
+        self.quality_sum += quality
+        self.quality_sq += quality * quality
+        self.box_office_sum += box_office
+        self.box_office_sq += box_office * box_office
+        self.last_film = movie
+        genre = movie.get("genre")
+        self.genres[genre] = self.genres.get(genre, 0) + 1
+
+    def shift(self, old_quality, new_quality, old_box, new_box):
+        """Apply a change in one film's quality or box office."""
+        self.quality_sum += new_quality - old_quality
+        self.quality_sq += new_quality * new_quality - old_quality * old_quality
+        self.box_office_sum += new_box - old_box
+        self.box_office_sq += new_box * new_box - old_box * old_box
+
+    @property
+    def avg_quality(self):
+        return self.quality_sum / self.count if self.count else 0.0
+
+    @property
+    def avg_box_office(self):
+        return self.box_office_sum / self.count if self.count else 0.0
+
+    @property
+    def quality_stdev(self):
+        if not self.count:
+            return 0.0
+        return math.sqrt(max(0.0, self.quality_sq / self.count - self.avg_quality ** 2))
+
+    @property
+    def box_office_stdev(self):
+        if not self.count:
+            return 0.0
+        return math.sqrt(max(0.0, self.box_office_sq / self.count - self.avg_box_office ** 2))
+
+    @property
+    def top_genre(self):
+        return max(self.genres, key=self.genres.get) if self.genres else None
+
+
+def pair_key(id_a, id_b):
+    """Order-independent key for a collaborating pair."""
+    return (id_a, id_b) if id_a <= id_b else (id_b, id_a)
+
+
+class CareerStatsCache:
+    """
+    Stats records keyed by person id, pair_key() or trio tuple, updated
+    incrementally. Movies are tracked only while their numbers can still
+    move; settle() drops the bookkeeping once a theatrical run is over.
+    """
+
+    def __init__(self):
+        self.records = {}
+        self._movie_keys = {}   # movie_id -> keys whose record includes the movie
+        self._movie_seen = {}   # movie_id -> (quality, box_office) already counted
+
+    def record(self, movie_id, key, movie):
+        """Count a movie once toward the record at `key`."""
+        keys = self._movie_keys.setdefault(movie_id, set())
+        if key in keys:
+            return
+        keys.add(key)
+
+        quality, box_office = self._movie_seen.setdefault(
+            movie_id, (movie.get("quality", 0), movie.get("box_office", 0.0))
+        )
+        stats = self.records.get(key)
+        if stats is None:
+            stats = self.records[key] = CareerStats()
+        stats.add_film(movie, quality, box_office)
+
+    def refresh(self, movie_id, movie):
+        """Push changes in a movie's quality or box office into every record that counts it."""
+        seen = self._movie_seen.get(movie_id)
+        if seen is None:
+            return
+        quality, box_office = movie.get("quality", 0), movie.get("box_office", 0.0)
+        if (quality, box_office) == seen:
+            return
+        for key in self._movie_keys[movie_id]:
+            self.records[key].shift(seen[0], quality, seen[1], box_office)
+        self._movie_seen[movie_id] = (quality, box_office)
+
+    def settle(self, movie_id, movie):
+        """Apply a movie's final numbers and stop tracking it."""
+        self.refresh(movie_id, movie)
+        self._movie_keys.pop(movie_id, None)
+        self._movie_seen.pop(movie_id, None)
+
+    def get(self, key):
+        return self.records.get(key)
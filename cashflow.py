@@ -0,0 +1,167 @@
+# HollywoodSim/game/cashflow.py
+
+"""
+Cash-Flow Forecast
+------------------
+Projects the studio's balance month by month over the next 12-36 months.
+Each source of money is kept as its own per-month array and the arrays are
+summed elementwise, then accumulated into a balance path:
+
+  revenue     what released films still have to earn (their monthly_revenue),
+              net of investors' shares (financing.FinanceBook.studio_share),
+              plus the back catalog's ancillary windows (ancillary.AncillaryMarket)
+  releases    expected earnings of scheduled films, at an average rollout
+  salaries    the payroll, less contracts as they expire (PayrollLedger.salary_schedule)
+  overhead    Studio.operating_costs(), for game modes that charge it
+  obligations fixed payments registered with add_obligation() (loan schedules)
+
+Released-film revenue is folded in once per film, keyed by absolute month,
+so a refresh only touches films that are new since the last one. Scheduled
+films are re-estimated only when their release date or marketing changes.
+Call refresh() once a turn has settled (or after a player action); it is
+cheap enough to run every turn and is idempotent within a month.
+
+spending_limit() turns a projected balance path into the most that can be
+spent now; rival studios use it too, on the path they can project.
+"""
+
+from itertools import accumulate
+
+DEFAULT_HORIZON = 24
+EXPECTED_ROLLOUT = 4  # mean of the 3-5 month rollout simulate_box_office rolls
+DEFAULT_RESERVE = 10.0  # cash a spending limit keeps untouched ($M)
+
+
+def spending_limit(balance, projected=(), reserve=DEFAULT_RESERVE):
+    """Most that can be spent now without a projected balance path dipping under the reserve."""
+    return max(0.0, min([balance, *projected]) - reserve)
+
+
+class CashFlowForecast:
+    def __init__(self, studio, horizon=DEFAULT_HORIZON, include_overhead=False, reserve=DEFAULT_RESERVE):
+        self.studio = studio
+        self.horizon = max(12, min(36, horizon))
+        self.include_overhead = include_overhead
+        self.reserve = reserve       # cash the spending limit keeps untouched ($M)
+        self.now = None              # calendar.month_index() of the last refresh
+        self.obligations = {}        # absolute month -> amount owed
+        self._film_revenue = {}      # absolute month -> revenue from released films
+        self._films_seen = set()
+        self._release_estimates = {}  # movie id -> (key, curve)
+
+        # Projected flows for months now+1 .. now+horizon
+        self.revenue = []
+        self.releases = []
+        self.salaries = []
+        self.overhead = []
+        self.payments = []
+        self.net = []
+        self.balance = []
+
+    # === Inputs ===
+    def add_obligation(self, month_index, amount):
+        """Register a fixed payment due in an absolute calendar month."""
+        self.obligations[month_index] = self.obligations.get(month_index, 0.0) + amount
+
+    def _fold_released_films(self, now):
+        for movie in self.studio.released_movies:
+            if movie["id"] in self._films_seen:
+                continue
+            self._films_seen.add(movie["id"])
+            # What is left of the curve is earned from next month onward, less investors' cut
+            remaining = self.studio.financing.studio_share(movie, movie.get("monthly_revenue") or ())
+            for offset, amount in enumerate(remaining, start=1):
+                self._film_revenue[now + offset] = self._film_revenue.get(now + offset, 0.0) + amount
+
+    def _release_curve(self, movie, calendar):
+        key = (movie.get("release_date"), movie.get("quality"), movie.get("buzz"),
+               movie.get("release_strategy"), movie.get("marketing_spend"))
+        cached = self._release_estimates.get(movie["id"])
+        if cached and cached[0] == key:
+            return cached[1]
+        year, month = movie["release_date"]
+        start = calendar.month_index(year, month)
+        # Trends at release are unknown, so no trend bonus: the estimate errs low
+        curve = self.studio.revenue_curve(movie, month, None, rollout_months=EXPECTED_ROLLOUT)
+        curve = self.studio.financing.studio_share(movie, curve)
+        entry = (start, curve)
+        self._release_estimates[movie["id"]] = (key, entry)
+        return entry
+
+    # === Projection ===
+    def refresh(self, calendar):
+        now = calendar.month_index()
+        if self.now is not None and now > self.now:
+            for month in [m for m in self._film_revenue if m <= now]:
+                del self._film_revenue[month]
+            for month in [m for m in self.obligations if m <= now]:
+                del self.obligations[month]
+        self.now = now
+        self._fold_released_films(now)
+
+        months = range(now + 1, now + 1 + self.horizon)
+        catalog = self.studio.ancillary.projection(now, self.horizon)
+        self.revenue = [self._film_revenue.get(m, 0.0) + c for m, c in zip(months, catalog)]
+        self.payments = [self.obligations.get(m, 0.0) for m in months]
+
+        # Scheduled films: revenue starts in their release month
+        releases = [0.0] * self.horizon
+        live = set()
+        for movie in self.studio.scheduled_movies:
+            if not movie.get("release_date"):
+                continue
+            live.add(movie["id"])
+            start, curve = self._release_curve(movie, calendar)
+            for offset, amount in enumerate(curve, start=start - now - 1):
+                if 0 <= offset < self.horizon:
+                    releases[offset] += amount
+        for movie_id in [i for i in self._release_estimates if i not in live]:
+            del self._release_estimates[movie_id]
+        self.releases = releases
+
+        # Salaries: a contract is paid until its expiry month; the ledger keeps salary
+        # totals by expiry month, so this is O(horizon) however many contracts there are
+        self.salaries = self.studio.payroll.salary_schedule(self.horizon)
+
+        overhead = self.studio.operating_costs()["total"] if self.include_overhead else 0.0
+        self.overhead = [overhead] * self.horizon
+
+        self.net = [r + p - s - o - d for r, p, s, o, d in
+                    zip(self.revenue, self.releases, self.salaries, self.overhead, self.payments)]
+        self.balance = list(accumulate(self.net, initial=self.studio.balance))[1:]
+        return self
+
+    # === Queries ===
+    def first_shortfall(self):
+        """Months ahead until the projected balance first drops below zero, or None."""
+        return next((k for k, b in enumerate(self.balance, start=1) if b < 0), None)
+
+    def low_point(self):
+        """(months ahead, balance) of the lowest projected balance."""
+        if not self.balance:
+            return 0, self.studio.balance
+        k = min(range(len(self.balance)), key=self.balance.__getitem__)
+        return k + 1, self.balance[k]
+
+    def spending_limit(self):
+        """Most that can be spent now without the projection dipping under the reserve."""
+        return spending_limit(self.studio.balance, self.balance, self.reserve)
+
+    def warning(self):
+        """Early-warning text when the studio is projected to run out of cash, else None."""
+        months = self.first_shortfall()
+        if months is None:
+            return None
+        _, low = self.low_point()
+        when = "next month" if months == 1 else f"in {months} months"
+        return f"⚠️ Cash projected to run out {when} (low point ${low:,.1f}M)."
+
+    def summary(self):
+        return {
+            "months": self.horizon,
+            "balance": self.balance,
+            "net": self.net,
+            "first_shortfall": self.first_shortfall(),
+            "low_point": self.low_point(),
+            "spending_limit": self.spending_limit(),
+        }
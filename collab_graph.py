@@ -0,0 +1,122 @@
+# HollywoodSim/game/collab_graph.py
+
+"""
+Collaboration Graph
+-------------------
+People are integer nodes; every pair who shared a film is joined by a
+weighted edge carrying running quality and box-office aggregates
+(a CareerStats record from the shared stats cache). Actor–writer–director
+trios get their own records so "best trio" questions never need a scan of
+film history.
+"""
+
+import heapq
+from career_stats import pair_key
+
+SORT_KEYS = {
+    "count": lambda s: s.count,
+    "quality": lambda s: s.avg_quality,
+    "box_office": lambda s: s.avg_box_office,
+    "total_box_office": lambda s: s.box_office_sum,
+}
+
+
+class CollaborationGraph:
+    def __init__(self, stats):
+        self.stats = stats          # CareerStatsCache shared with the credits table
+        self.adjacency = {}         # node -> {neighbor: CareerStats}
+        self.trios = set()          # every (actor, writer, director) key
+        self.trios_by_node = {}     # node -> set of trio keys it appears in
+
+    # === Building ===
+    def add_film(self, movie_id, movie, cast_ids, writer_id=None, director_id=None):
+        """Link everyone credited on a film and update edge and trio aggregates."""
+        nodes = list(dict.fromkeys(cast_ids))
+        for pid in (writer_id, director_id):
+            if pid is not None and pid not in nodes:
+                nodes.append(pid)
+
+        for i, a in enumerate(nodes):
+            for b in nodes[i + 1:]:
+                key = pair_key(a, b)
+                self.stats.record(movie_id, key, movie)
+                edge = self.stats.get(key)
+                self.adjacency.setdefault(a, {})[b] = edge
+                self.adjacency.setdefault(b, {})[a] = edge
+
+        if writer_id is None or director_id is None:
+            return
+        for actor_id in cast_ids:
+            trio = (actor_id, writer_id, director_id)
+            self.stats.record(movie_id, trio, movie)
+            self.trios.add(trio)
+            for pid in trio:
+                self.trios_by_node.setdefault(pid, set()).add(trio)
+
+    # === Queries ===
+    def edge(self, a, b):
+        """Aggregates for a pair, or None if they never worked together."""
+        return self.adjacency.get(a, {}).get(b)
+
+    def neighbors(self, node):
+        return self.adjacency.get(node, {})
+
+    def degree(self, node):
+        return len(self.adjacency.get(node, ()))
+
+    def neighborhood(self, node, depth=2):
+        """Everyone within `depth` hops of a node, mapped to their hop distance."""
+        seen = {node: 0}
+        frontier = [node]
+        for hop in range(1, depth + 1):
+            next_frontier = []
+            for current in frontier:
+                for nbr in self.adjacency.get(current, ()):
+                    if nbr not in seen:
+                        seen[nbr] = hop
+                        next_frontier.append(nbr)
+            frontier = next_frontier
+        del seen[node]
+        return seen
+
+    def top_partners(self, node, k=5, by="count", min_films=1):
+        """The k strongest collaborators of a node as (neighbor, stats) pairs."""
+        score = SORT_KEYS[by]
+        edges = ((nbr, s) for nbr, s in self.adjacency.get(node, {}).items() if s.count >= min_films)
+        return heapq.nlargest(k, edges, key=lambda item: score(item[1]))
+
+    def common_partners(self, a, b):
+        """Nodes that closed a triangle with both a and b."""
+        adj_a = self.adjacency.get(a, {})
+        adj_b = self.adjacency.get(b, {})
+        if len(adj_a) > len(adj_b):
+            adj_a, adj_b = adj_b, adj_a
+        return [n for n in adj_a if n in adj_b]
+
+    def triangles(self, node):
+        """Every (node, x, y) triangle through a node, each listed once."""
+        adj = self.adjacency.get(node, {})
+        found = []
+        for x in adj:
+            adj_x = self.adjacency[x]
+            for y in adj:
+                if x < y and y in adj_x:
+                    found.append((node, x, y))
+        return found
+
+    def trio(self, actor_id, writer_id, director_id):
+        return self.stats.get((actor_id, writer_id, director_id))
+
+    def trios_for(self, node, k=5, by="quality", min_films=1):
+        """Best actor–writer–director trios a node took part in."""
+        score = SORT_KEYS[by]
+        trios = ((t, self.stats.get(t)) for t in self.trios_by_node.get(node, ()))
+        return heapq.nlargest(k, (item for item in trios if item[1].count >= min_films),
+                              key=lambda item: score(item[1]))
+
+    def best_trios(self, k=5, by="quality", min_films=1):
+        """Best actor–writer–director trios across the whole history."""
+        score = SORT_KEYS[by]
+        trios = ((t, self.stats.get(t)) for t in self.trios)
+        return heapq.nlargest(k, (item for item in trios if item[1].count >= min_films),
+                              key=lambda item: score(item[1]))
@@ -1,5 +1,6 @@
 # HollywoodSim/game/contracts.py
 
+
 def create_contract(person, role_type, months, salary=None, exclusive=True):
     """
     Creates a contract object for an actor, writer, director, or staff.
@@ -13,34 +14,10 @@ def create_contract(person, role_type, months, salary=None, exclusive=True):
         "duration": months,
         "salary": salary,
         "exclusive": exclusive,
-        "remaining": months,
+        # No months-left counter: PayrollLedger.sign stamps the expiry month from duration
     }
 
 
-def age_contracts(contracts_by_type):
-    """
-    Reduces contract durations by 1 month and removes expired ones.
-    """
-    for role in ["actors", "writers", "directors", "staff"]:
-        new_list = []
-        for contract in contracts_by_type.get(role, []):
-            contract["remaining"] -= 1
-            if contract["remaining"] > 0:
-                new_list.append(contract)
-            else:
-                print(f"📄 Contract expired: {contract['person']['name']} ({role[:-1]})")
-        contracts_by_type[role] = new_list
-
-
-def find_active_contracts(contracts_by_type, role):
-    """
-    Returns active contract dicts (with person + remaining months).
-    """
-    return [c for c in contracts_by_type.get(role, []) if c["remaining"] > 0]
-
-
-
-
 def contract_phase(studio, casting_pool):
     """
     Handles a single contract-signing phase for the player.
@@ -104,7 +81,7 @@ def contract_phase(studio, casting_pool):
         exclusive=True
     )
 
-    studio.contracts[role].append(contract)
+    studio.sign_contract(contract)
     studio.hire(selected)
     print(f"✅ Signed {selected['name']} to a {months}-month exclusive contract!")
 
@@ -113,7 +90,7 @@ def print_roster(studio):
     """Prints the studio's current roster of signed talent and staff, sorted by expiring contracts."""
     
     def show_group(role, title, extra=""):
-        contracts = sorted(find_active_contracts(studio.contracts, role), key=lambda c: c["remaining"])
+        contracts = studio.payroll.roster(role)  # already soonest-to-expire first
         print(f"\n{title} ({len(contracts)}):")
         if contracts:
             for c in contracts:
@@ -123,7 +100,7 @@ def print_roster(studio):
                     line += f", Salary: ${p['salary']}M"
                 if role == "staff":
                     line += f", Role: {p['role']}"
-                line += f", Contract: {c['remaining']} months left)"
+                line += f", Contract: {studio.payroll.remaining(c)} months left)"
                 print(line)
         else:
             print("   None")
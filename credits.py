@@ -0,0 +1,135 @@
+# HollywoodSim/game/credits.py
+
+"""
+Shared Credits Table
+--------------------
+Every film is stored once and every credit is a compact
+(movie_id, person_id, role) row pointing at it. Talent no longer carry
+their own copies of film facts; `film_history` views are built on demand
+from the live movie dicts, so box office is always current.
+"""
+
+from array import array
+from career_stats import CareerStatsCache
+from collab_graph import CollaborationGraph
+from registry import ensure_id
+
+
+def person_id(person):
+    """Return a person's registry id (people built outside the generators get one here)."""
+    return ensure_id(person, "person")
+
+
+class CreditsTable:
+    def __init__(self):
+        self.films = {}                  # movie_id -> movie dict (facts stored once)
+        self.movie_ids = array("l")      # credit row -> movie_id
+        self.person_ids = array("l")     # credit row -> person_id
+        self.role_codes = array("B")     # credit row -> index into self.roles
+        self.roles = []                  # interned role names ("Actor", "Editor", ...)
+        self._role_index = {}
+        self._by_person = {}             # person_id -> array of credit rows
+        self.people = {}                 # person_id -> person dict
+        self.stats = CareerStatsCache()  # running per-person, pair and trio totals
+        self.graph = CollaborationGraph(self.stats)
+
+    # === Interning ===
+    def _role_code(self, role):
+        code = self._role_index.get(role)
+        if code is None:
+            code = len(self.roles)
+            self.roles.append(role)
+            self._role_index[role] = code
+        return code
+
+    # === Recording ===
+    def add_film(self, movie):
+        """Register a movie once and return its id."""
+        movie_id = ensure_id(movie, "movie")
+        if movie_id not in self.films:
+            self.films[movie_id] = movie
+        return movie_id
+
+    def add_credit(self, movie, person, role):
+        """Credit a person on a movie. Repeated credits for the same role are ignored."""
+        if not person:
+            return False
+        movie_id = self.add_film(movie)
+        pid = person_id(person)
+        code = self._role_code(role)
+
+        self.people[pid] = person
+        rows = self._by_person.setdefault(pid, array("l"))
+        for row in rows:
+            if self.movie_ids[row] == movie_id and self.role_codes[row] == code:
+                return False
+
+        rows.append(len(self.movie_ids))
+        self.movie_ids.append(movie_id)
+        self.person_ids.append(pid)
+        self.role_codes.append(code)
+        self.stats.record(movie_id, pid, movie)
+        return True
+
+    def record_release(self, movie):
+        """Credit the cast, director and writer of a newly released movie."""
+        cast = movie.get("cast", [])
+        director = movie.get("director")
+        writer = movie.get("writer")
+
+        for actor in cast:
+            self.add_credit(movie, actor, "Actor")
+        self.add_credit(movie, director, "Director")
+        self.add_credit(movie, writer, "Writer")
+
+        self.graph.add_film(
+            movie["id"],
+            movie,
+            [person_id(a) for a in cast],
+            writer_id=person_id(writer) if writer else None,
+            director_id=person_id(director) if director else None,
+        )
+
+    def refresh(self, movie):
+        """Carry a movie's latest quality and box office into career stats."""
+        if "id" in movie:
+            self.stats.refresh(movie["id"], movie)
+
+    def settle(self, movie):
+        """Lock in a movie's final numbers once it has stopped earning."""
+        if "id" in movie:
+            self.stats.settle(movie["id"], movie)
+
+    # === Stats ===
+    def stats_for(self, person):
+        return self.stats.get(person.get("id"))
+
+    def pair_stats(self, person_a, person_b):
+        if "id" not in person_a or "id" not in person_b:
+            return None
+        return self.graph.edge(person_a["id"], person_b["id"])
+
+    # === Views ===
+    def credits_for(self, person):
+        """Return (movie, role) pairs for a person's credits, oldest first."""
+        rows = self._by_person.get(person.get("id"), ())
+        return [(self.films[self.movie_ids[r]], self.roles[self.role_codes[r]]) for r in rows]
+
+    def credit_count(self, person):
+        return len(self._by_person.get(person.get("id"), ()))
+
+    def film_history(self, person):
+        """Build a person's film history from the shared table."""
+        history = []
+        for movie, role in self.credits_for(person):
+            year, month = movie.get("release_date", (None, None))
+            history.append({
+                "title": movie["title"],
+                "year": year,
+                "month": month,
+                "role": role,
+                "genre": movie.get("genre"),
+                "quality": movie.get("quality"),
+                "box_office": movie.get("box_office", 0),
+            })
+        return history
@@ -3,6 +3,8 @@
 from PySide6 import QtWidgets, QtCore
 from library import get_script_resale_value
 import calendar_1 as calendar
+from profiling import PROFILER
+from production import STAGE_LABELS
 
 
 class DashboardView(QtWidgets.QWidget):
@@ -41,6 +43,8 @@ class DashboardView(QtWidgets.QWidget):
         for lbl in (self.date_label, self.balance_label, self.prestige_label):
             lbl.setStyleSheet("font-weight: bold; font-size: 14px; color: #00bfa6;")
             left_column_layout.addWidget(lbl)
+        self.forecast_label = QtWidgets.QLabel()
+        left_column_layout.addWidget(self.forecast_label)
 
         # Script Development
         left_column_layout.addWidget(QtWidgets.QLabel("== Script Development =="))
@@ -183,6 +187,7 @@ class DashboardView(QtWidgets.QWidget):
         )
         self.balance_label.setText(f"💰 Balance: ${self.studio.balance:,.2f}M")
         self.prestige_label.setText(f"👑 Prestige: {self.studio.prestige}")
+        self._refresh_forecast()
 
         # --- Update Tables ---
         self._refresh_scripts_table()
@@ -192,9 +197,33 @@ class DashboardView(QtWidgets.QWidget):
 
 
 
+    def _refresh_forecast(self):
+        forecast = self.studio.cashflow.refresh(self.calendar)
+        warning = forecast.warning()
+        months, low = forecast.low_point()
+        if warning:
+            self.forecast_label.setText(warning)
+            self.forecast_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #ff6b6b;")
+        else:
+            self.forecast_label.setText(
+                f"📊 {forecast.horizon}-month outlook: low ${low:,.1f}M in {months} mo · "
+                f"safe to spend ${forecast.spending_limit():,.1f}M"
+            )
+            self.forecast_label.setStyleSheet("font-size: 13px; color: #a0a0a0;")
+        catalog = self.studio.ancillary.monthly_income()
+        if catalog > 0:
+            self.forecast_label.setText(f"{self.forecast_label.text()} · catalog ${catalog:,.2f}M/mo")
+        if self.studio.debt > 0:
+            finance = self.studio.financing.summary(self.calendar.month_index())
+            self.forecast_label.setText(
+                f"{self.forecast_label.text()} · debt ${finance['debt']:,.1f}M "
+                f"(loans: {finance['open_loans']}, next payment ${finance['next_payment']:,.2f}M)"
+            )
+
     def _refresh_scripts_table(self):
         scripts_in_dev = [s for s in self.studio.scripts if s.get("status") in ["first_draft", "rewritten", "approved"]]
         self.scripts_table.setRowCount(len(scripts_in_dev))
+        PROFILER.count("rows_rendered", len(scripts_in_dev))
         for row, s in enumerate(scripts_in_dev):
             self.scripts_table.setItem(row, 0, QtWidgets.QTableWidgetItem(s["title"]))
             self.scripts_table.setItem(row, 1, QtWidgets.QTableWidgetItem(s["genre"]))
@@ -205,6 +234,7 @@ class DashboardView(QtWidgets.QWidget):
     def _refresh_shelf_table(self):
         shelf = getattr(self.studio, "script_library", [])
         self.shelf_table.setRowCount(len(shelf))
+        PROFILER.count("rows_rendered", len(shelf))
         for row, s in enumerate(shelf):
             resale = get_script_resale_value(s, self.calendar)
             values = [s["title"], s["genre"], str(s.get("potential_quality", 0)), f"${resale}M"]
@@ -214,8 +244,9 @@ class DashboardView(QtWidgets.QWidget):
     def _refresh_roster_table(self):
         """Rebuild the roster table with live contract data."""
         roster = []
-        for role, contracts in self.studio.contracts.items():
-            for contract in contracts:
+        tasks = self.studio.task_engine
+        for role in self.studio.contracts:
+            for contract in self.studio.payroll.roster(role):  # soonest to expire first
                 person = contract.get("person", {})
                 task = contract.get("task")
 
@@ -227,15 +258,17 @@ class DashboardView(QtWidgets.QWidget):
                     "specialty": person.get("specialty", {}).get("name") 
                                 if isinstance(person.get("specialty"), dict)
                                 else person.get("specialty", "-"),
-                    "task": f"{task['name']} ({task['remaining']}m)" if task else "Idle",
-                    "duration": contract.get("duration", "∞")
+                    "task": (f"{task['name']} ({tasks.remaining(task)}m)" if task
+                             else f"Injured ({tasks.injured(contract)}m)" if tasks.injured(contract) else "Idle"),
+                    "remaining": self.studio.payroll.remaining(contract)
                 })
 
         # Update table
-        headers = ["Name", "Role", "Fame", "Salary", "Specialty", "Task", "Contract (mths)"]
+        headers = ["Name", "Role", "Fame", "Salary", "Specialty", "Task", "Months Left"]
         self.roster_table.setColumnCount(len(headers))
         self.roster_table.setHorizontalHeaderLabels(headers)
         self.roster_table.setRowCount(len(roster))
+        PROFILER.count("rows_rendered", len(roster))
 
         for row, person in enumerate(roster):
             self.roster_table.setItem(row, 0, QtWidgets.QTableWidgetItem(person["name"]))
@@ -244,12 +277,14 @@ class DashboardView(QtWidgets.QWidget):
             self.roster_table.setItem(row, 3, QtWidgets.QTableWidgetItem(f"${person['salary']:.2f}M"))
             self.roster_table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(person["specialty"])))
             self.roster_table.setItem(row, 5, QtWidgets.QTableWidgetItem(person["task"]))
-            self.roster_table.setItem(row, 6, QtWidgets.QTableWidgetItem(str(person["duration"])))
+            self.roster_table.setItem(row, 6, QtWidgets.QTableWidgetItem(str(person["remaining"])))
 
 
     def _refresh_movies_table(self):
         movies = self.studio.scheduled_movies + self.studio.released_movies
+        now = self.calendar.month_index()
         self.movies_table.setRowCount(len(movies))
+        PROFILER.count("rows_rendered", len(movies))
         for row, movie in enumerate(movies):
             release_date = movie.get("release_date", ("?", "?"))
             release_str = f"{release_date[1]}/{release_date[0]}"
@@ -265,7 +300,10 @@ class DashboardView(QtWidgets.QWidget):
                 actor_name = "N/A"
 
             self.movies_table.setItem(row, 0, QtWidgets.QTableWidgetItem(movie["title"]))
-            self.movies_table.setItem(row, 1, QtWidgets.QTableWidgetItem(movie.get("status", "Scheduled")))
+            status = movie.get("status", "Scheduled")
+            if "stage_index" in movie:
+                status = f"{STAGE_LABELS[status]} ({self.studio.production.remaining(movie, now)}m)"
+            self.movies_table.setItem(row, 1, QtWidgets.QTableWidgetItem(STAGE_LABELS.get(status, status)))
             self.movies_table.setItem(row, 2, QtWidgets.QTableWidgetItem(director_name))
             self.movies_table.setItem(row, 3, QtWidgets.QTableWidgetItem(actor_name))
             self.movies_table.setItem(row, 4, QtWidgets.QTableWidgetItem(release_str))
@@ -312,7 +350,7 @@ class DashboardView(QtWidgets.QWidget):
         selected_row = self.movies_table.currentRow()
         if selected_row >= 0:
             movie = (self.studio.scheduled_movies + self.studio.released_movies)[selected_row]
-            if movie.get("status") != "in_production":
+            if movie not in self.studio.scheduled_movies:
                 QtWidgets.QMessageBox.information(self, "Action", "You can only set marketing for a movie in production.")
                 return
             self.open_post_production_requested.emit(movie)
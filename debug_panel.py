@@ -0,0 +1,127 @@
+# HollywoodSim/game/debug_panel.py
+
+from PySide6 import QtWidgets, QtCore
+from profiling import PROFILER
+
+
+class DebugPanel(QtWidgets.QDialog):
+    """Non-modal window over PROFILER: phase timings, counters and the last capture."""
+
+    def __init__(self, profiler=PROFILER, parent=None):
+        super().__init__(parent)
+        self.profiler = profiler
+        self.setWindowTitle("Turn Profiler")
+        self.setMinimumSize(640, 520)
+        self.setModal(False)
+        self._setup_ui()
+        self.refresh_view()
+
+    def _setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+
+        # --- Controls ---
+        controls = QtWidgets.QHBoxLayout()
+        self.enabled_box = QtWidgets.QCheckBox("Enabled")
+        self.enabled_box.setChecked(self.profiler.enabled)
+        self.enabled_box.toggled.connect(self._set_enabled)
+        controls.addWidget(self.enabled_box)
+
+        controls.addWidget(QtWidgets.QLabel("cProfile/tracemalloc every"))
+        self.capture_spin = QtWidgets.QSpinBox()
+        self.capture_spin.setRange(0, 120)
+        self.capture_spin.setSpecialValueText("off")
+        self.capture_spin.setSuffix(" turns")
+        self.capture_spin.setValue(self.profiler.capture_every)
+        self.capture_spin.valueChanged.connect(self._set_capture_every)
+        controls.addWidget(self.capture_spin)
+        controls.addStretch()
+
+        reset_btn = QtWidgets.QPushButton("Reset")
+        reset_btn.clicked.connect(self._reset)
+        controls.addWidget(reset_btn)
+        dump_btn = QtWidgets.QPushButton("Dump JSON")
+        dump_btn.clicked.connect(lambda: self.dump_json())
+        controls.addWidget(dump_btn)
+        layout.addLayout(controls)
+
+        # --- Phases ---
+        self.turn_label = QtWidgets.QLabel()
+        layout.addWidget(self.turn_label)
+        self.phase_table = QtWidgets.QTableWidget()
+        self.phase_table.setColumnCount(5)
+        self.phase_table.setHorizontalHeaderLabels(["Phase", "Calls", "Last (ms)", "Avg (ms)", "Max (ms)"])
+        self.phase_table.horizontalHeader().setStretchLastSection(True)
+        self.phase_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.phase_table)
+
+        # --- Counters ---
+        layout.addWidget(QtWidgets.QLabel("== Counters =="))
+        self.counter_table = QtWidgets.QTableWidget()
+        self.counter_table.setColumnCount(3)
+        self.counter_table.setHorizontalHeaderLabels(["Counter", "Last Turn", "Total"])
+        self.counter_table.horizontalHeader().setStretchLastSection(True)
+        self.counter_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.counter_table.setMaximumHeight(150)
+        layout.addWidget(self.counter_table)
+
+        # --- Last Capture ---
+        layout.addWidget(QtWidgets.QLabel("== Last Capture =="))
+        self.capture_text = QtWidgets.QPlainTextEdit()
+        self.capture_text.setReadOnly(True)
+        self.capture_text.setStyleSheet("font-family: monospace; font-size: 11px;")
+        layout.addWidget(self.capture_text)
+
+    # === Controls ===
+    def _set_enabled(self, enabled):
+        self.profiler.enabled = enabled
+
+    def _set_capture_every(self, turns):
+        self.profiler.capture_every = turns
+
+    def _reset(self):
+        self.profiler.reset()
+        self.refresh_view()
+
+    def dump_json(self, path=None):
+        if path is None:
+            path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Dump Profile", "turn_profile.json", "JSON Files (*.json)")
+            if not path:
+                return None
+        return self.profiler.dump_json(path)
+
+    # === Display ===
+    def refresh_view(self):
+        profiler = self.profiler
+        last = profiler.turns[-1] if profiler.turns else None
+        if last:
+            self.turn_label.setText(f"Turn {last['turn']} ({last['label']}): {last['total_ms']:.1f} ms")
+        else:
+            self.turn_label.setText("No turns recorded yet." if profiler.enabled else "Profiler is disabled.")
+
+        rows = profiler.summary()
+        self.phase_table.setRowCount(len(rows))
+        for r, (name, calls, last_ms, avg_ms, max_ms) in enumerate(rows):
+            values = (name, str(calls), f"{last_ms:.2f}", f"{avg_ms:.2f}", f"{max_ms:.2f}")
+            for c, value in enumerate(values):
+                item = QtWidgets.QTableWidgetItem(value)
+                if c:
+                    item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+                self.phase_table.setItem(r, c, item)
+
+        last_counts = last["counters"] if last else {}
+        counters = sorted(profiler.counters.items())
+        self.counter_table.setRowCount(len(counters))
+        for r, (name, total) in enumerate(counters):
+            self.counter_table.setItem(r, 0, QtWidgets.QTableWidgetItem(name))
+            self.counter_table.setItem(r, 1, QtWidgets.QTableWidgetItem(str(last_counts.get(name, 0))))
+            self.counter_table.setItem(r, 2, QtWidgets.QTableWidgetItem(str(total)))
+
+        capture = profiler.last_capture
+        if capture:
+            allocations = "\n".join(capture["top_allocations"])
+            self.capture_text.setPlainText(
+                f"Turn {capture['turn']} ({capture['label']}) - peak traced memory {capture['peak_kb']:,.1f} KiB\n\n"
+                f"{capture['profile']}\nTop allocations:\n{allocations}"
+            )
+        else:
+            self.capture_text.setPlainText("No capture yet. Set a capture interval to profile every Nth turn.")
@@ -9,18 +9,21 @@ This version:
  - Uses signed talent first (from studio.contracts) then free agents (casting_pool)
  - Does not assume non-existent fields like `skill` or `salary` on staff objects
  - Stores staff assignments on the movie dict for future phases
+ - Offers outside financing (loan, investor, crowdfunding) before scheduling
  - Marks the script as 'in_production' after scheduling
  - Returns the scheduled movie (or None)
 """
 
 from personnel import generate_staff_member
+from funding import generate_funding_offers, describe_offer, choose_funding_offer
 
 
-def _pick_from_signed_then_pool(signed_contracts, pool_choices, role_name):
+def _pick_from_signed_then_pool(signed_contracts, pool_choices, role_name, booked=None):
     """
     Helper: present signed people first (if any) then pool choices.
     signed_contracts is a list of contract dicts (each with "person").
     pool_choices is a list of person dicts.
+    booked (optional) maps a person to a note if they are already booked.
     Returns the chosen person dict or None.
     """
     options = []
@@ -51,6 +54,8 @@ def _pick_from_signed_then_pool(signed_contracts, pool_choices, role_name):
             extra.append(f"Focus {p.get('genre_focus')}")
         if p.get("tags"):
             extra.append(", ".join(p.get("tags")))
+        if booked and booked(p):
+            extra.append(booked(p))
         print(f"{i}. {p.get('name', 'Unknown')} {tag_mark} — {' | '.join(extra)}")
 
     idx = input(f"Select {role_name} number (or press Enter to cancel): ").strip()
@@ -94,11 +99,18 @@ def draft_production(studio, calendar, casting_pool, market_pool):
         return None
     script = approved_scripts[int(idx) - 1]
 
+    def booked(person):
+        busy = studio.schedule.busy_until(person, calendar.month_index())
+        if busy is None:
+            return None
+        year, month = calendar.date_of(busy)
+        return f"⏳ Booked until {month}/{year}"
+
     # --- Step 2: Choose Lead Actor ---
     # signed actors from contracts
     signed_actor_contracts = studio.contracts.get("actors", [])
     actor_pool = casting_pool.get_actor_choices(3)
-    actor = _pick_from_signed_then_pool(signed_actor_contracts, actor_pool, "Actor")
+    actor = _pick_from_signed_then_pool(signed_actor_contracts, actor_pool, "Actor", booked)
     if not actor:
         print("⚠️ No actor selected; aborting draft.")
         return None
@@ -106,7 +118,7 @@ def draft_production(studio, calendar, casting_pool, market_pool):
     # --- Step 3: Choose Director ---
     signed_dir_contracts = studio.contracts.get("directors", [])
     director_pool = casting_pool.get_director_choices(3)
-    director = _pick_from_signed_then_pool(signed_dir_contracts, director_pool, "Director")
+    director = _pick_from_signed_then_pool(signed_dir_contracts, director_pool, "Director", booked)
     if not director:
         print("⚠️ No director selected; aborting draft.")
         return None
@@ -175,14 +187,26 @@ def draft_production(studio, calendar, casting_pool, market_pool):
     months_ahead = int(months_ahead_str) if months_ahead_str.isdigit() else 1
     months_ahead = max(1, min(months_ahead, 6))
 
-    # --- Step 6: Produce / Schedule Movie ---
+    # --- Step 6: Financing ---
+    budget = studio.production_cost(script, [actor], director)
+    offers = generate_funding_offers(budget, studio.reputation)
+    print(f"\n🏦 Financing options (budget ${budget:,.2f}M):")
+    for i, offer in enumerate(offers, 1):
+        print(f"{i}. {describe_offer(offer)}")
+    choice = input("Choose financing [Enter for self-funding]: ").strip()
+    funding = None
+    if choice.isdigit() and 1 <= int(choice) <= len(offers):
+        funding = choose_funding_offer(offers, int(choice) - 1)
+
+    # --- Step 7: Produce / Schedule Movie ---
     movie = studio.produce_movie(
         script,
         [actor],
         director,
         calendar,
         staff_assignments,
-        months_ahead
+        months_ahead,
+        funding
     )
 
     if not movie:
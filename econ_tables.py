@@ -0,0 +1,103 @@
+# HollywoodSim/game/econ_tables.py
+
+"""
+Economics Lookup Tables
+-----------------------
+Dense tables compiled at import from game_data.GENRES / SEASONS, the
+rating caps, release strategies and marketing plans. Genres, ratings,
+strategies and plans get integer ids; every table has one extra trailing
+row for unknown names, so lookups never branch on missing keys.
+"""
+
+import game_data
+from scripts import RATINGS
+from post_production import RELEASE_STRATEGIES, MARKETING_PLANS
+
+MONTHS = range(1, 13)
+MAX_ROLLOUT = 12  # longest revenue curve simulate_box_office can ask for
+
+# === Genres ===
+GENRE_NAMES = tuple(game_data.GENRES)
+GENRE_IDS = {name: gid for gid, name in enumerate(GENRE_NAMES)}
+UNKNOWN_GENRE = len(GENRE_NAMES)
+
+
+def genre_id(name):
+    return GENRE_IDS.get(name, UNKNOWN_GENRE)
+
+
+def _season_row(info):
+    peaks = info.get("peak_seasons", [])
+    bonus = info.get("trend_bonus", 0) / 100
+    return (0.0,) + tuple(bonus if game_data.SEASONS.get(m, "summer") in peaks else 0.0 for m in MONTHS)
+
+
+# SEASONAL_BONUS[genre_id][month] -> fractional seasonal bonus
+SEASONAL_BONUS = tuple(_season_row(game_data.GENRES[g]) for g in GENRE_NAMES) + ((0.0,) * 13,)
+
+# === Ratings ===
+RATING_NAMES = tuple(RATINGS)
+RATING_IDS = {name: rid for rid, name in enumerate(RATING_NAMES)}
+RATING_CAPS = tuple(RATINGS[r].get("max_audience", 1.0) for r in RATING_NAMES) + (1.0,)
+
+
+def rating_id(name):
+    return RATING_IDS.get(name, len(RATING_NAMES))
+
+
+# === Release strategies ===
+STRATEGY_NAMES = tuple(RELEASE_STRATEGIES)
+STRATEGY_IDS = {name: sid for sid, name in enumerate(STRATEGY_NAMES)}
+STRATEGY_MULTIPLIERS = tuple(RELEASE_STRATEGIES[s].get("multiplier", 1.0) for s in STRATEGY_NAMES) + (1.0,)
+STRATEGY_LONGEVITY = tuple(RELEASE_STRATEGIES[s].get("longevity", 0.0) for s in STRATEGY_NAMES) + (0.0,)
+
+
+def strategy_id(name):
+    return STRATEGY_IDS.get(name, len(STRATEGY_NAMES))
+
+
+def _curve_factor(strategy, i):
+    if strategy == "Wide":
+        factor = 1.5 if i == 0 else (1.0 - (i * 0.15))
+    elif strategy == "Limited":
+        factor = 0.5 + (i * 0.2)
+    elif strategy == "International":
+        factor = 1.2 - (i * 0.05)
+    else:  # Streaming and anything unknown run flat
+        factor = 1.0
+    return max(0.3, factor)
+
+
+# STRATEGY_CURVES[strategy_id][month_of_run] -> share of the monthly base
+STRATEGY_CURVES = tuple(
+    tuple(_curve_factor(s, i) for i in range(MAX_ROLLOUT)) for s in STRATEGY_NAMES + (None,)
+)
+
+# === Marketing plans ===
+PLAN_NAMES = tuple(MARKETING_PLANS)
+PLAN_IDS = {name: pid for pid, name in enumerate(PLAN_NAMES)}
+PLAN_COSTS = tuple(MARKETING_PLANS[p].get("cost", 0) for p in PLAN_NAMES) + (0,)
+PLAN_BUZZ = tuple(MARKETING_PLANS[p].get("buzz", 0) for p in PLAN_NAMES) + (0,)
+
+# === Market demand ===
+TREND_DEMAND = 1.25
+EVENT_DEMAND = {
+    "Awards Season": {"Drama": 1.5},
+    "Summer Blockbuster": {"Action": 1.4, "Sci-Fi": 1.4},
+    "Holiday Movie Rush": {"Family": 1.3, "Musical": 1.3},
+}
+NO_DEMAND = (1.0,) * (len(GENRE_NAMES) + 1)
+
+# event name -> demand multiplier per genre id
+EVENT_DEMAND_ROWS = {
+    name: tuple(boosts.get(g, 1.0) for g in GENRE_NAMES) + (1.0,)
+    for name, boosts in EVENT_DEMAND.items()
+}
+
+
+def demand_row(trending_genres, event=None):
+    """Demand multiplier per genre id for the given trends and annual event."""
+    row = list(EVENT_DEMAND_ROWS.get(event["name"], NO_DEMAND) if event else NO_DEMAND)
+    for g in trending_genres or ():
+        row[genre_id(g)] *= TREND_DEMAND
+    return row
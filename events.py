@@ -1,6 +1,7 @@
 # HollywoodSim/game/events.py
 
 import random
+from messages import emit
 
 class Event:
     def __init__(self, title, description, effect_fn=None):
@@ -9,8 +10,8 @@ class Event:
         self.effect_fn = effect_fn  # Optional function to apply effects
 
     def trigger(self, studio, calendar):
-        print(f"\n🎭 EVENT: {self.title}")
-        print(f"{self.description}")
+        emit("events", f"🎭 EVENT: {self.title}")
+        emit("events", self.description)
         if self.effect_fn:
             self.effect_fn(studio, calendar)
 
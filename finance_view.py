@@ -1,6 +1,7 @@
 #HollywoodSim/game/finance_view.py
 
 from PySide6 import QtWidgets, QtCore
+from profiling import PROFILER
 
 
 class FinanceView(QtWidgets.QWidget):
@@ -18,8 +19,11 @@ class FinanceView(QtWidgets.QWidget):
         self.earnings_label = QtWidgets.QLabel("📈 Total Earnings: ...")
         self.expenses_label = QtWidgets.QLabel("📉 Total Expenses: ...")
         self.highest_label = QtWidgets.QLabel("🎬 Highest Grossing: ...")
+        self.territory_label = QtWidgets.QLabel("🌍 Box Office by Territory: ...")
+        self.territory_label.setWordWrap(True)
 
-        for lbl in (self.balance_label, self.earnings_label, self.expenses_label, self.highest_label):
+        for lbl in (self.balance_label, self.earnings_label, self.expenses_label, self.highest_label,
+                    self.territory_label):
             lbl.setStyleSheet("font-weight: bold; font-size: 14px; color: #00bfa6;")
             layout.addWidget(lbl)
 
@@ -70,8 +74,13 @@ class FinanceView(QtWidgets.QWidget):
         else:
             self.highest_label.setText("🎬 Highest Grossing: N/A")
 
+        territories = sorted(self.studio.territory_gross.items(), key=lambda item: -item[1])
+        parts = [f"{name} ${amount:,.1f}M" for name, amount in territories if amount >= 0.05]
+        self.territory_label.setText(f"🌍 Box Office by Territory: {' · '.join(parts) or 'N/A'}")
+
         # Populate ledger table
         self.ledger_table.setRowCount(len(self.ledger))
+        PROFILER.count("rows_rendered", len(self.ledger))
         for row, entry in enumerate(self.ledger):
             self.ledger_table.setItem(row, 0, QtWidgets.QTableWidgetItem(entry["date"]))
             self.ledger_table.setItem(row, 1, QtWidgets.QTableWidgetItem(entry["description"]))
@@ -0,0 +1,241 @@
+# HollywoodSim/game/financing.py
+
+"""
+Financing
+---------
+Tracks the money a studio raises against its films once a funding offer
+(see funding.generate_funding_offers) is accepted:
+
+  loans      Bank loans get an amortization schedule when they are signed:
+             interest-only until the film releases ("Repay after release"),
+             then level monthly payments. Every loan's payments are summed
+             into one per-month table, so the monthly debt service is a
+             single lookup however many loans are open.
+  investors  Private investors own a stake in one film. As the film's
+             revenue comes in it runs through a waterfall: investors first
+             recoup their money pro rata, then take their profit share of
+             every dollar after that.
+  grants     Crowdfunding is cash plus buzz, with nothing to pay back.
+
+Loan payments are also registered with the studio's CashFlowForecast, and
+the forecast asks studio_share() how much of a film's revenue the studio
+actually keeps.
+"""
+
+from registry import new_id
+from messages import emit
+
+DEFAULT_LOAN_TERM = 24  # months of repayment after any grace period
+CROWDFUND_BUZZ = 5
+
+
+def amortization_schedule(principal, annual_rate, term_months, grace_months=0):
+    """
+    [(interest, principal, balance_after)] for each month of a loan:
+    interest-only for grace_months, then term_months level payments.
+    """
+    rate = annual_rate / 12
+    balance = principal
+    rows = [(balance * rate, 0.0, balance)] * grace_months
+    if rate:
+        payment = principal * rate / (1 - (1 + rate) ** -term_months)
+    else:
+        payment = principal / term_months
+    for k in range(term_months):
+        interest = balance * rate
+        repaid = balance if k == term_months - 1 else payment - interest
+        balance -= repaid
+        rows.append((interest, repaid, balance))
+    return rows
+
+
+class FinanceBook:
+    def __init__(self, studio):
+        self.studio = studio
+        self.loans = {}         # loan id -> loan
+        self.stakes = {}        # movie id -> waterfall
+        self.interest_paid = 0.0
+        self.principal_paid = 0.0
+        self.shares_paid = 0.0  # recoupment + profit share paid to investors
+        self.raised = 0.0       # crowdfunding, never repaid
+        self._due = {}          # absolute month -> [interest, principal] over all loans
+        self._maturing = {}     # absolute month -> ids of loans making their last payment
+        self._serviced = None   # last month service() ran for
+
+    # === Offers ===
+    def cash_from(self, offer):
+        """What an offer adds to the studio's balance up front."""
+        if not offer or offer["type"] == "Self-Funding":
+            return 0.0
+        return offer["amount"]
+
+    def accept(self, offer, movie, calendar):
+        """Take up a funding offer for a film that has just been scheduled."""
+        if not offer or offer["type"] == "Self-Funding":
+            return None
+        kind = offer["type"]
+        if kind == "Bank Loan":
+            grace = 0
+            if "Repay after release" in offer.get("conditions", ()):
+                year, month = movie["release_date"]
+                grace = max(0, calendar.month_index(year, month) - calendar.month_index())
+            rate = offer.get("interest_rate", self.studio.interest_rate * 100) / 100
+            loan = self.take_loan(offer["amount"], rate, calendar,
+                                  term_months=offer.get("term_months", DEFAULT_LOAN_TERM),
+                                  grace_months=grace, movie=movie)
+            term = len(loan["schedule"]) - grace
+            when = "after release" if grace else "from next month"
+            text = (f"🏦 Bank loan of ${offer['amount']:,.2f}M at {rate:.0%} for '{movie['title']}', "
+                    f"repaid over {term} months {when}.")
+        elif kind == "Private Investor":
+            self.add_investor(movie, offer["amount"], offer.get("profit_share", 0))
+            text = (f"🤝 Investor puts ${offer['amount']:,.2f}M into '{movie['title']}' "
+                    f"for {offer.get('profit_share', 0)}% of the profits.")
+        elif kind == "Crowdfunding":
+            self.studio.balance += offer["amount"]
+            self.raised += offer["amount"]
+            movie["buzz"] = movie.get("buzz", 0) + CROWDFUND_BUZZ
+            text = f"📣 Crowdfunding raised ${offer['amount']:,.2f}M for '{movie['title']}' (+{CROWDFUND_BUZZ} buzz)."
+        else:
+            raise ValueError(f"Unknown funding type: {kind}")
+        emit("financing", text)
+        return text
+
+    # === Loans ===
+    def take_loan(self, amount, annual_rate, calendar, term_months=DEFAULT_LOAN_TERM, grace_months=0, movie=None):
+        """Borrow now; the whole repayment schedule is laid out at signing."""
+        start = calendar.month_index() + 1  # first payment is due next month
+        schedule = amortization_schedule(amount, annual_rate, term_months, grace_months)
+        loan = {
+            "id": new_id("loan"),
+            "principal": amount,
+            "rate": annual_rate,
+            "start": start,
+            "schedule": schedule,
+            "movie_id": movie["id"] if movie else None,
+            "status": "active",
+        }
+        self.loans[loan["id"]] = loan
+        if self._serviced is None:
+            self._serviced = start - 1
+        for month, (interest, repaid, _) in enumerate(schedule, start=start):
+            due = self._due.setdefault(month, [0.0, 0.0])
+            due[0] += interest
+            due[1] += repaid
+            self.studio.cashflow.add_obligation(month, interest + repaid)
+        self._maturing.setdefault(start + len(schedule) - 1, []).append(loan["id"])
+
+        self.studio.balance += amount
+        self.studio.debt += amount
+        return loan
+
+    def loan_balance(self, loan, month_index):
+        """Principal still owed on a loan after the payment for month_index."""
+        k = month_index - loan["start"]
+        if k < 0:
+            return loan["principal"]
+        if k >= len(loan["schedule"]):
+            return 0.0
+        return loan["schedule"][k][2]
+
+    def payment_due(self, month_index):
+        """(interest, principal) owed across all loans in an absolute month."""
+        interest, principal = self._due.get(month_index, (0.0, 0.0))
+        return interest, principal
+
+    def service(self, month_index):
+        """
+        Settle the loan payments due up to month_index; returns (interest, principal).
+        Months already serviced are skipped, so each month's payment is taken once.
+        """
+        first = month_index if self._serviced is None else self._serviced + 1
+        interest = principal = 0.0
+        for month in range(first, month_index + 1):
+            due_interest, due_principal = self._due.pop(month, (0.0, 0.0))
+            interest += due_interest
+            principal += due_principal
+            for loan_id in self._maturing.pop(month, ()):
+                self.loans[loan_id]["status"] = "repaid"
+        self._serviced = max(month_index, first - 1)
+
+        self.interest_paid += interest
+        self.principal_paid += principal
+        self.studio.debt -= principal
+        if not self._due:  # every loan is paid off; clear float error
+            self.studio.debt = 0.0
+        return interest, principal
+
+    # === Investors ===
+    def add_investor(self, movie, amount, profit_share, investor="Private Investor"):
+        """Sell an investor a stake in one film: they recoup `amount`, then take profit_share % of revenue."""
+        waterfall = self.stakes.setdefault(movie["id"], {
+            "title": movie["title"],
+            "cost": movie["cost"],
+            "gross": 0.0,
+            "invested": 0.0,
+            "stakes": [],
+        })
+        share = profit_share / 100
+        if sum(s["share"] for s in waterfall["stakes"]) + share > 1:
+            raise ValueError("Profit shares on a film cannot exceed 100%.")
+        waterfall["stakes"].append({"investor": investor, "amount": amount, "share": share,
+                                    "recouped": 0.0, "paid": 0.0})
+        waterfall["invested"] += amount
+        self.studio.balance += amount
+        return waterfall
+
+    @staticmethod
+    def _takes(waterfall, gross, recouped, revenue):
+        """Each stake's (recoupment, profit) from `revenue`, given the gross and recoupment so far."""
+        recoup_pool = max(0.0, min(revenue, waterfall["cost"] - gross))
+        profit_pool = revenue - recoup_pool
+        base = max(waterfall["cost"], waterfall["invested"])
+        return [
+            (min(stake["amount"] - done, recoup_pool * stake["amount"] / base), profit_pool * stake["share"])
+            for stake, done in zip(waterfall["stakes"], recouped)
+        ]
+
+    def distribute(self, movie, revenue):
+        """Pay investors their cut of this month's revenue for a film; returns the total paid."""
+        waterfall = self.stakes.get(movie["id"])
+        if waterfall is None or revenue <= 0:
+            return 0.0
+        recouped = [s["recouped"] for s in waterfall["stakes"]]
+        paid = 0.0
+        for stake, (back, profit) in zip(waterfall["stakes"], self._takes(waterfall, waterfall["gross"], recouped, revenue)):
+            stake["recouped"] += back
+            stake["paid"] += back + profit
+            paid += back + profit
+        waterfall["gross"] += revenue
+        self.shares_paid += paid
+        return paid
+
+    def studio_share(self, movie, amounts):
+        """The studio's part of a projected revenue stream, after the film's waterfall."""
+        waterfall = self.stakes.get(movie["id"])
+        if waterfall is None:
+            return list(amounts)
+        gross = waterfall["gross"]
+        recouped = [s["recouped"] for s in waterfall["stakes"]]
+        kept = []
+        for revenue in amounts:
+            takes = self._takes(waterfall, gross, recouped, revenue)
+            recouped = [done + back for done, (back, _) in zip(recouped, takes)]
+            gross += revenue
+            kept.append(revenue - sum(back + profit for back, profit in takes))
+        return kept
+
+    # === Reporting ===
+    def open_loans(self):
+        return [loan for loan in self.loans.values() if loan["status"] == "active"]
+
+    def summary(self, month_index):
+        interest, principal = self.payment_due(month_index + 1)
+        return {
+            "debt": self.studio.debt,
+            "open_loans": len(self.open_loans()),
+            "next_payment": interest + principal,
+            "interest_paid": self.interest_paid,
+            "investor_payouts": self.shares_paid,
+            "crowdfunding": self.raised,
+        }
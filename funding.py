@@ -6,6 +6,7 @@ FUNDING_SOURCES = [
         "type": "Bank Loan",
         "base_amount": 0.5,  # % of budget
         "interest_range": (5, 12),
+        "term_range": (12, 36),  # months of repayment once the film is out
         "conditions": ["Repay after release", "Fixed interest rate"]
     },
     {
@@ -50,6 +51,8 @@ def generate_funding_offers(project_budget, studio_reputation):
         # Optional parameters
         if "interest_range" in source:
             offer["interest_rate"] = random.randint(*source["interest_range"])
+        if "term_range" in source:
+            offer["term_months"] = random.randint(*source["term_range"])
         if "profit_share_range" in source:
             offer["profit_share"] = random.randint(*source["profit_share_range"])
 
@@ -58,6 +61,16 @@ def generate_funding_offers(project_budget, studio_reputation):
     return offers
 
 
+def describe_offer(offer):
+    """One-line label for an offer, e.g. for a picker."""
+    text = f"{offer['type']} - ${offer['amount']:,.2f}M"
+    if "interest_rate" in offer:
+        text += f" at {offer['interest_rate']}% over {offer.get('term_months', '?')} months"
+    if "profit_share" in offer:
+        text += f" for {offer['profit_share']}% of profits"
+    return text
+
+
 def choose_funding_offer(offers, choice_index):
     """
     Selects a funding offer by index. 
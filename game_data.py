@@ -479,6 +479,11 @@ TITLE_STRUCTURES = [
     "{adjective} {noun}"
 ]
 
+# Formats used per genre by the title service; genres without an entry use "default"
+TITLE_FORMATS_BY_GENRE = {
+    "default": TITLE_STRUCTURES,
+}
+
 MID_PHRASES = ["of the", "in the", "from", "beyond", "within"]
 PLACES = ["Forest", "City", "Stars", "Night", "Hollow", "Past", "Future"]
 ADJECTIVES = ["Dark", "Silent", "Lonely", "Burning", "Golden", "Wicked"]
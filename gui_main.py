@@ -4,52 +4,72 @@
 
 import sys
 import os
+import time
 import traceback
+
+_LAUNCH_TIME = time.perf_counter()  # before Qt is imported, for --startup-benchmark
+
 from PySide6 import QtWidgets, QtGui, QtCore
 
 # --- Game Logic Imports ---
 from studio import Studio
 from calendar_1 import GameCalendar
-from market import init_market, refresh_market, adjust_market_prices, populate_initial_market
+from market import init_market, refresh_market, adjust_market_prices, populate_initial_market, end_of_year_cleanup
+from market_retention import new_game_archive
 from contracts import create_contract
 from scripts import generate_script, rewrite_script
 from rivals import RivalStudio
-from auction_dialog import AuctionDialog
 from personnel import CastingPool
 from library import get_script_resale_value
 from draft_production import draft_production
+from production import advance_productions
+from funding import generate_funding_offers, describe_offer
 from talent_tasks import assign_task, progress_tasks, TASKS
 from post_production import MARKETING_PLANS, RELEASE_STRATEGIES
 import events
+from profiling import PROFILER
+from messages import MESSAGES
 
 # --- UI Imports ---
+# Only the dashboard is needed for the first frame. Other pages are built on
+# first navigation and dialogs are imported by the handlers that open them.
 from dashboard_view import DashboardView
-from market_view import MarketView
-from calendar_view import CalendarView
-from finance_view import FinanceView
-from released_movies_view import ReleasedMoviesView
-from post_production_dialog import PostProductionDialog
-from end_of_year_dialog import EndOfYearDialog
+from log_view import GameLogView, QtLogSink
+
+PAGE_NAMES = ["Dashboard", "Market", "Calendar", "Finance", "Released"]
+
+# Monthly turn phases, in order; each is timed by the profiler when enabled
+TURN_PHASES = [
+    "_advance_time",
+    "_update_market",
+    "_process_rival_turns",
+    "_update_productions",
+    "_process_movie_releases",
+    "_update_finances",
+    "_update_talent_tasks",
+    "_run_random_events",
+    "_finalize_month",
+]
 
 
 class MainWindow(QtWidgets.QMainWindow):
     """Main application window for HollywoodSim."""
 
     # === Initialization & Setup ===
-    def __init__(self):
+    def __init__(self, box_office="monthly"):
         super().__init__()
         self.setWindowTitle("Movie Studio Tycoon")
         self.setGeometry(100, 100, 1400, 900)
 
         # Initialize models
-        self.studio = Studio()
+        self.studio = Studio(box_office=box_office)
         self.calendar = GameCalendar()
-        self.market_pool = init_market()
+        self.market_pool = init_market(new_game_archive())
         self.casting_pool = CastingPool()
         self.ledger = []  # Tracks financial records
+        self.debug_panel = None
 
-        # Populate initial market & rivals
-        populate_initial_market(self.market_pool, self.calendar)
+        # Rivals (the market is populated once the window is up)
         self.rival_studios = [
             RivalStudio("Silver Screen Studios", balance=150, prestige=10),
             RivalStudio("Golden Gate Films", balance=120, prestige=8),
@@ -61,10 +81,21 @@ class MainWindow(QtWidgets.QMainWindow):
         self._load_font()
         self._setup_ui()
 
+        # Core simulation messages go to the game log
+        self.message_sink = MESSAGES.subscribe(QtLogSink(self.log_message))
+
         # Initial log
         self.log_message("Welcome to Movie Studio Tycoon!")
         self.log_message(f"Competing against: {', '.join(r.name for r in self.rival_studios)}")
         self.update_all_views()
+        self.advance_month_btn.setEnabled(False)
+        QtCore.QTimer.singleShot(0, self._populate_market)
+
+    def _populate_market(self):
+        """Fill the starting market after first paint instead of before it."""
+        populate_initial_market(self.market_pool, self.calendar)
+        self.advance_month_btn.setEnabled(True)
+        self.update_all_views()
 
     def _load_font(self):
         """Load the game’s custom monospace font if available."""
@@ -113,21 +144,15 @@ class MainWindow(QtWidgets.QMainWindow):
         main_layout = QtWidgets.QGridLayout(main_widget)
         self.setCentralWidget(main_widget)
 
-        # Core pages
+        # Core pages: the dashboard now, the rest as placeholders until first shown
         self.main_content_area = QtWidgets.QStackedWidget()
         self.dashboard_page = DashboardView(self.studio, self.calendar)
-        self.market_page = MarketView(self.market_pool, self.studio)
-        self.calendar_page = CalendarView(self.calendar)
-        self.finance_page = FinanceView(self.studio, self.ledger)
-        self.released_page = ReleasedMoviesView(self.studio)
+        self.pages = {"Dashboard": self.dashboard_page}
 
         # Menubar & pages
         self._create_menubar()
-        self.main_content_area.addWidget(self.dashboard_page)
-        self.main_content_area.addWidget(self.market_page)
-        self.main_content_area.addWidget(self.calendar_page)
-        self.main_content_area.addWidget(self.finance_page)
-        self.main_content_area.addWidget(self.released_page)
+        for name in PAGE_NAMES:
+            self.main_content_area.addWidget(self.pages.get(name) or QtWidgets.QWidget())
 
         # Navigation / Logs / Controls
         nav_widget = self._create_navigation_panel()
@@ -151,16 +176,9 @@ class MainWindow(QtWidgets.QMainWindow):
         nav_layout = QtWidgets.QVBoxLayout(nav_widget)
         nav_widget.setFixedWidth(150)
 
-        nav_buttons = {
-            "Dashboard": 0,
-            "Market": 1,
-            "Calendar": 2,
-            "Finance": 3,
-            "Released": 4
-        }
-        for name, index in nav_buttons.items():
+        for name in PAGE_NAMES:
             button = QtWidgets.QPushButton(name)
-            button.clicked.connect(lambda checked=False, i=index: self.main_content_area.setCurrentIndex(i))
+            button.clicked.connect(lambda checked=False, n=name: self.show_page(n))
             nav_layout.addWidget(button)
 
         nav_layout.addStretch()
@@ -182,11 +200,16 @@ class MainWindow(QtWidgets.QMainWindow):
         assign_task_action.triggered.connect(self._handle_assign_task)
         talent_menu.addAction(assign_task_action)
 
+        # Debug
+        debug_menu = menubar.addMenu("Debug")
+        profiler_action = QtGui.QAction("Turn Profiler", self)
+        profiler_action.triggered.connect(self._show_debug_panel)
+        debug_menu.addAction(profiler_action)
+
     def _create_log_output(self):
         """Bottom log window for showing in-game events."""
-        log_output = QtWidgets.QTextEdit()
-        log_output.setReadOnly(True)
-        log_output.setMaximumHeight(150)
+        log_output = GameLogView()
+        log_output.setMaximumHeight(180)
         return log_output
 
     def _create_advance_month_button(self):
@@ -211,15 +234,45 @@ class MainWindow(QtWidgets.QMainWindow):
         self.dashboard_page.sell_all_requested.connect(self.handle_sell_all_scripts)
         self.dashboard_page.assign_task_requested.connect(self._handle_assign_task)
 
-        # Market signals
-        self.market_page.buy_script_signal.connect(self.handle_buy_script)
-        self.market_page.sign_talent_signal.connect(self.handle_sign_talent)
-        self.market_page.move_to_shelf_signal.connect(self.handle_move_to_shelf)
-        self.market_page.sell_script_signal.connect(self.handle_sell_script)
-        self.market_page.sell_all_signal.connect(self.handle_sell_all_scripts)
+    # === Lazy Pages ===
+    def show_page(self, name):
+        page = self.pages.get(name) or self._build_page(name)
+        self.main_content_area.setCurrentWidget(page)
+
+    def _build_page(self, name):
+        """Import and construct a page the first time it is navigated to."""
+        if name == "Market":
+            from market_view import MarketView
+            page = MarketView(self.market_pool, self.studio)
+            page.buy_script_signal.connect(self.handle_buy_script)
+            page.sign_talent_signal.connect(self.handle_sign_talent)
+            page.move_to_shelf_signal.connect(self.handle_move_to_shelf)
+            page.sell_script_signal.connect(self.handle_sell_script)
+            page.sell_all_signal.connect(self.handle_sell_all_scripts)
+        elif name == "Calendar":
+            from calendar_view import CalendarView
+            page = CalendarView(self.calendar)
+        elif name == "Finance":
+            from finance_view import FinanceView
+            page = FinanceView(self.studio, self.ledger)
+        elif name == "Released":
+            from released_movies_view import ReleasedMoviesView
+            page = ReleasedMoviesView(self.studio)
+        else:
+            raise ValueError(f"Unknown page: {name}")
+
+        index = PAGE_NAMES.index(name)
+        placeholder = self.main_content_area.widget(index)
+        self.main_content_area.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.main_content_area.insertWidget(index, page)
+        self.pages[name] = page
+        page.refresh_view()
+        return page
 
     # === Handlers (UI Actions) ===
     def handle_buy_script(self, script):
+        from auction_dialog import AuctionDialog
         dialog = AuctionDialog(script, self.studio, self.rival_studios, self)
         if dialog.exec():
             winner, price = dialog.get_result()
@@ -237,7 +290,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def handle_sign_talent(self, data):
         talent, role, months = data['talent'], data['role'], data['months']
         contract = create_contract(talent, role, months, talent.get("salary", 1.0))
-        self.studio.contracts[role].append(contract)
+        self.studio.sign_contract(contract)
         self.studio.hire(talent)
         if role in ["actors", "directors", "writers", "staff"]:
             getattr(self.market_pool, role).remove(talent)
@@ -250,10 +303,10 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "No Writers", "You must have a writer under contract to create a new script.")
             return
 
-        writer_names = [w['name'] for w in writers]
-        writer_name, ok = QtWidgets.QInputDialog.getItem(self, "Select Writer", "Choose a writer:", writer_names, 0, False)
-        if ok and writer_name:
-            writer = next(w for w in writers if w['name'] == writer_name)
+        writers_by_label = {f"{w['name']} (#{w['id']})": w for w in writers}
+        writer_label, ok = QtWidgets.QInputDialog.getItem(self, "Select Writer", "Choose a writer:", list(writers_by_label), 0, False)
+        if ok and writer_label:
+            writer = writers_by_label[writer_label]
             script = generate_script(self.calendar, writer)
             self.studio.scripts.append(script)
             self.log_message(f"📝 New script '{script['title']}' created by {writer['name']}.")
@@ -275,10 +328,9 @@ class MainWindow(QtWidgets.QMainWindow):
         writer = writer_contracts[0]["person"]
         rewritten_script = rewrite_script(script, writer, self.calendar)
         for i, s in enumerate(self.studio.scripts):
-            if s['title'] == rewritten_script['title']:
+            if s['id'] == rewritten_script['id']:
                 self.studio.scripts[i] = rewritten_script
                 break
-        self.log_message(f"✍️ Rewrote '{rewritten_script['title']}'. Potential Quality: {rewritten_script['potential_quality']}.")
         self.update_all_views()
 
     def handle_start_production(self, script):
@@ -302,23 +354,47 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "Invalid Script", "This script must be taken from your shelf to start production.")
             return
 
-        movie = self.studio.produce_movie(script, [actor], director, self.calendar, months_ahead=6)
+        offer = self._select_funding_dialog(script, actor, director)
+        if not offer:
+            return
+
+        movie = self.studio.produce_movie(script, [actor], director, self.calendar, months_ahead=6, funding=offer)
         if movie:
-            movie["status"] = "in_production"
-            movie["production_end_turn"] = self._get_turn_number() + 3
             self.studio.script_library.remove(script)
             lead_name = actor['name'] if actor else "Unknown"
-            self.log_message(f"🎬 Production started for '{movie['title']}' starring {lead_name}.")
+            year, month = movie["release_date"]
+            self.log_message(f"🎬 Production started for '{movie['title']}' starring {lead_name}. Release set for {month}/{year}.")
             self.update_all_views()
 
     def _select_talent_dialog(self, talent_contracts, role_name):
-        names = [c["person"]["name"] for c in talent_contracts]
-        selected_name, ok = QtWidgets.QInputDialog.getItem(self, f"Select {role_name}", f"Choose {role_name.lower()}:", names, 0, False)
-        if ok and selected_name:
-            return next(c for c in talent_contracts if c["person"]["name"] == selected_name)
+        now = self.calendar.month_index()
+        by_label = {}
+        for c in talent_contracts:
+            label = f"{c['person']['name']} (#{c['person']['id']})"
+            busy = self.studio.schedule.busy_until(c["person"], now)
+            if busy is not None:
+                year, month = self.calendar.date_of(busy)
+                label += f" - booked until {month}/{year}"
+            by_label[label] = c
+        selected_label, ok = QtWidgets.QInputDialog.getItem(self, f"Select {role_name}", f"Choose {role_name.lower()}:", list(by_label), 0, False)
+        if ok and selected_label:
+            return by_label[selected_label]
+        return None
+
+    def _select_funding_dialog(self, script, actor, director):
+        budget = self.studio.production_cost(script, [actor], director)
+        offers = generate_funding_offers(budget, self.studio.reputation)
+        by_label = {describe_offer(o): o for o in offers}
+        labels = list(by_label)
+        default = next(i for i, o in enumerate(offers) if o["type"] == "Self-Funding")
+        selected_label, ok = QtWidgets.QInputDialog.getItem(
+            self, "Finance Production", f"Budget ${budget:,.2f}M. Choose financing:", labels, default, False)
+        if ok and selected_label:
+            return by_label[selected_label]
         return None
 
     def handle_open_post_production(self, movie):
+        from post_production_dialog import PostProductionDialog
         dialog = PostProductionDialog(movie, self.studio.balance, self)
         if dialog.exec():
             choices = dialog.get_choices()
@@ -332,7 +408,6 @@ class MainWindow(QtWidgets.QMainWindow):
             movie["marketing_spend"] = cost
             movie["marketing_plan"] = plan_name
             movie["release_strategy"] = choices['release_strategy']
-            movie["status"] = "scheduled"
 
             self.log_message(
                 f"'{movie['title']}' marketing plan set to '{plan_name}'. "
@@ -376,37 +451,38 @@ class MainWindow(QtWidgets.QMainWindow):
             contract, task_name = dialog.get_selection()
             if contract and task_name:
                 if contract.get("task"):
-                    QtWidgets.QMessageBox.warning(self, "Already Busy", f"{contract['person']['name']} is already working on '{contract['task']['name']}' ({contract['task']['remaining']} month(s) left).")
+                    QtWidgets.QMessageBox.warning(self, "Already Busy", f"{contract['person']['name']} is already working on '{contract['task']['name']}' ({self.studio.task_engine.remaining(contract['task'])} month(s) left).")
                     return
                 try:
-                    assign_task(contract, task_name)
-                    self.log_message(f"📝 Assigned {contract['person']['name']} to {task_name}.")
+                    assign_task(self.studio.task_engine, contract, task_name)
                     self.update_all_views()
                 except Exception as e:
                     QtWidgets.QMessageBox.warning(self, "Error", str(e))
 
     # === Game Loop ===
     def run_monthly_turn(self):
+        self.log_output.begin_batch()  # one view update for the whole turn
         try:
             if not self._check_bankruptcy():
                 return
-            self._advance_time()
-            self._update_market()
-            self._process_rival_turns()
-            self._update_productions()
-            self._process_movie_releases()
-            self._update_finances()
-            self._update_talent_tasks()
-            self._run_random_events()
-            self._finalize_month()
+            with PROFILER.turn(self.calendar.display()):
+                for phase in TURN_PHASES:
+                    with PROFILER.phase(phase):
+                        getattr(self, phase)()
+            if self.debug_panel is not None and self.debug_panel.isVisible():
+                self.debug_panel.refresh_view()
             if self.calendar.month == 12:
+                end_of_year_cleanup(self.market_pool, self.calendar)
                 self._handle_end_of_year()
         except Exception as e:
             error_message = f"An unexpected error occurred: {e}"
             traceback_info = traceback.format_exc()
             self.log_message(error_message, is_error=True)
             print(traceback_info)
+            self.log_output.flush()
             QtWidgets.QMessageBox.critical(self, "Error", f"{error_message}\n\nSee console for details.")
+        finally:
+            self.log_output.end_batch()
 
     # === Monthly Turn Phases ===
     def _check_bankruptcy(self):
@@ -435,11 +511,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.log_message(f"   - {action}")
 
     def _update_productions(self):
-        for movie in self.studio.scheduled_movies:
-            if movie.get("status") == "in_production":
-                if self._get_turn_number() >= movie.get("production_end_turn", 0):
-                    movie["status"] = "post_production"
-                    self.log_message(f"'{movie['title']}' has finished photography and is in post-production.")
+        advance_productions(self.studio, self.calendar)  # stage changes reach the log via MESSAGES
 
     def _process_movie_releases(self):
         released_this_month = self.studio.check_for_releases(self.calendar)
@@ -451,16 +523,20 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _update_finances(self):
         before_balance = self.studio.balance
-        self.studio.update_revenue()
+        self.studio.update_revenue(self.calendar)
         revenue = self.studio.balance - before_balance
-        total_salaries = sum(c.get("salary", 1.0) for contracts in self.studio.contracts.values() for c in contracts)
+        total_salaries = self.studio.payroll.payroll()
         if total_salaries > 0:
             self.studio.balance -= total_salaries
             self.log_message(f"💰 Paid salaries: ${total_salaries:.2f}M.")
-        self.studio.record_financials(self.calendar, revenue=revenue, expenses=total_salaries, note="Monthly operations")
+        self.studio.record_financials(self.calendar, revenue=revenue, expenses=total_salaries, note="Monthly operations",
+                                     territories=self.studio.territory_take)
+        debt_service = self.studio.pay_interest(self.calendar)
+        if debt_service:
+            self.log_message(debt_service)
 
     def _update_talent_tasks(self):
-        completed = progress_tasks(self.studio.contracts, self.studio)
+        completed = progress_tasks(self.studio)
         for result in completed:
             person = result['person']['name']
             task = result['task']
@@ -477,10 +553,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _finalize_month(self):
         self.studio.renew_contracts()
-        self.update_all_views()
+        self.update_all_views()  # the dashboard refreshes the cash-flow forecast
+        warning = self.studio.cashflow.warning()
+        if warning:
+            self.log_message(warning, severity="warning")
         self.log_message("🔄 End of month summary complete.")
 
     def _handle_end_of_year(self):
+        from end_of_year_dialog import EndOfYearDialog
+        self.log_output.flush()
         dialog = EndOfYearDialog(self.studio, self.calendar.year, self)
         dialog.exec()
         self.log_message(f"📊 End of Year {self.calendar.year} report generated.")
@@ -489,11 +570,11 @@ class MainWindow(QtWidgets.QMainWindow):
     def _get_turn_number(self):
         return (self.calendar.year - 2025) * 12 + self.calendar.month
 
-    def log_message(self, msg, is_error=False):
+    def log_message(self, msg, is_error=False, severity=None):
         timestamp = self.calendar.display()
         prefix = "🔥" if is_error else f"[{timestamp}]"
-        self.log_output.append(f"{prefix} {msg}")
-        self.log_output.verticalScrollBar().setValue(self.log_output.verticalScrollBar().maximum())
+        severity = severity or ("error" if is_error else "info")
+        self.log_output.append(f"{prefix} {msg}", severity)
 
     def _record_transaction(self, description, amount):
         balance = self.studio.balance
@@ -505,15 +586,41 @@ class MainWindow(QtWidgets.QMainWindow):
         })
 
     def update_all_views(self):
-        self.dashboard_page.refresh_data()
-        self.market_page.refresh_view()
-        self.calendar_page.refresh_view()
-        self.finance_page.refresh_view()
-        self.released_page.refresh_view()
+        with PROFILER.phase("update_all_views"):
+            self.dashboard_page.refresh_data()
+            for page in self.pages.values():
+                if page is not self.dashboard_page:
+                    page.refresh_view()
+
+    def _show_debug_panel(self):
+        if self.debug_panel is None:
+            from debug_panel import DebugPanel
+            self.debug_panel = DebugPanel(PROFILER, self)
+        self.debug_panel.refresh_view()
+        self.debug_panel.show()
+        self.debug_panel.raise_()
+
+    def closeEvent(self, event):
+        MESSAGES.unsubscribe(self.message_sink)
+        if self.market_pool.archive is not None:
+            self.market_pool.archive.flush()  # keep evicted listings buffered since the last flush
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
-    window = MainWindow()
+    if "--profile" in sys.argv:
+        PROFILER.enabled = True  # same as ticking "Enabled" under Debug > Turn Profiler
+    # --weekly / --daily resolve box-office runs below a month
+    window = MainWindow("daily" if "--daily" in sys.argv else "weekly" if "--weekly" in sys.argv else "monthly")
     window.show()
+    if "--startup-benchmark" in sys.argv:
+        # Report launch -> first paint and launch -> playable market, then exit
+        window.repaint()  # paint now, before the deferred market population runs
+        first_paint = time.perf_counter() - _LAUNCH_TIME
+        QtCore.QTimer.singleShot(0, app.quit)
+        app.exec()
+        ready = time.perf_counter() - _LAUNCH_TIME
+        print(f"STARTUP first_paint_ms={first_paint * 1000:.1f} ready_ms={ready * 1000:.1f}")
+        sys.exit(0)
     sys.exit(app.exec())
@@ -0,0 +1,232 @@
+# HollywoodSim/game/log_view.py
+
+"""
+Game Log
+--------
+The in-game message log. Entries live in a fixed-capacity ring buffer, so
+a long campaign costs the same per message as a new one: the oldest lines
+fall off the front. A QListView only paints the rows on screen, messages
+from one turn can be flushed in a single batch, and the view can filter by
+severity and export to a text file.
+"""
+
+from PySide6 import QtWidgets, QtCore, QtGui
+
+SEVERITIES = ("info", "warning", "error")
+SEVERITY_COLORS = {"info": "#e0e0e0", "warning": "#ffcc66", "error": "#ff6b6b"}
+SEVERITY_ROLE = QtCore.Qt.UserRole + 1
+DEFAULT_CAPACITY = 5000
+
+
+class RingBuffer:
+    """Fixed-size buffer with O(1) append, front-drop and indexed reads."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._items = [None] * capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, i):
+        if not 0 <= i < self._size:
+            raise IndexError(i)
+        return self._items[(self._start + i) % self.capacity]
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self._items[(self._start + i) % self.capacity]
+
+    def append(self, item):
+        """Add an item, overwriting the oldest one when full."""
+        end = (self._start + self._size) % self.capacity
+        self._items[end] = item
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def drop_front(self, n):
+        n = min(n, self._size)
+        for i in range(n):
+            self._items[(self._start + i) % self.capacity] = None
+        self._start = (self._start + n) % self.capacity
+        self._size -= n
+
+
+class GameLogModel(QtCore.QAbstractListModel):
+    """List model over a RingBuffer of (severity, text) entries."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, parent=None):
+        super().__init__(parent)
+        self.entries = RingBuffer(capacity)
+        self._pending = []
+        self._batch_depth = 0
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        severity, text = self.entries[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return text
+        if role == QtCore.Qt.ForegroundRole:
+            return QtGui.QColor(SEVERITY_COLORS.get(severity, SEVERITY_COLORS["info"]))
+        if role == SEVERITY_ROLE:
+            return severity
+        return None
+
+    # === Writing ===
+    def add(self, text, severity="info"):
+        self._pending.append((severity, text))
+        if not self._batch_depth:
+            self.flush()
+
+    def begin_batch(self):
+        """Hold messages until the matching end_batch()."""
+        self._batch_depth += 1
+
+    def end_batch(self):
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self):
+        """Insert pending messages as one block, dropping the oldest on overflow."""
+        batch = self._pending[-self.entries.capacity:]
+        self._pending = []
+        if not batch:
+            return
+
+        overflow = len(self.entries) + len(batch) - self.entries.capacity
+        if overflow > 0:
+            # Trim a chunk at a time; each removal makes views remap every row
+            drop = min(len(self.entries), max(overflow, self.entries.capacity // 20))
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, drop - 1)
+            self.entries.drop_front(drop)
+            self.endRemoveRows()
+
+        first = len(self.entries)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(batch) - 1)
+        for entry in batch:
+            self.entries.append(entry)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.entries = RingBuffer(self.entries.capacity)
+        self._pending = []
+        self.endResetModel()
+
+
+class SeverityFilter(QtCore.QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.shown = set(SEVERITIES)
+
+    def set_shown(self, severity, shown):
+        if shown:
+            self.shown.add(severity)
+        else:
+            self.shown.discard(severity)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.sourceModel().entries[source_row][0] in self.shown
+
+
+class QtLogSink:
+    """messages.MESSAGES sink that forwards core messages to a log function."""
+
+    def __init__(self, log_fn):
+        self.log_fn = log_fn  # called as log_fn(text, severity=...)
+
+    def write(self, message):
+        self.log_fn(message.text, severity=message.severity)
+
+
+class GameLogView(QtWidgets.QWidget):
+    """Log panel: severity toggles, export button and a virtualized list."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, parent=None):
+        super().__init__(parent)
+        self.model = GameLogModel(capacity, self)
+        self.proxy = SeverityFilter(self)
+        self.proxy.setSourceModel(self.model)
+        self._stick_to_bottom = True
+        self._scroll_pending = False
+        self._setup_ui()
+
+    def _setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(2)
+
+        # --- Filters & Export ---
+        toolbar = QtWidgets.QHBoxLayout()
+        for severity in SEVERITIES:
+            box = QtWidgets.QCheckBox(severity.capitalize())
+            box.setChecked(True)
+            box.toggled.connect(lambda shown, s=severity: self.proxy.set_shown(s, shown))
+            toolbar.addWidget(box)
+        toolbar.addStretch()
+        export_btn = QtWidgets.QPushButton("Export Log")
+        export_btn.clicked.connect(lambda: self.export())
+        toolbar.addWidget(export_btn)
+        layout.addLayout(toolbar)
+
+        # --- Messages ---
+        self.list_view = QtWidgets.QListView()
+        self.list_view.setModel(self.proxy)
+        self.list_view.setUniformItemSizes(True)  # lets Qt skip measuring every row
+        self.list_view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.list_view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.list_view.setStyleSheet("QListView { background-color: #0d0d0d; font-family: monospace; }")
+        layout.addWidget(self.list_view)
+
+        self.proxy.rowsAboutToBeInserted.connect(self._remember_scroll)
+        self.proxy.rowsInserted.connect(self._follow_new_rows)
+
+    # === Logging ===
+    def append(self, text, severity="info"):
+        self.model.add(text, severity)
+
+    def begin_batch(self):
+        self.model.begin_batch()
+
+    def end_batch(self):
+        self.model.end_batch()
+
+    def flush(self):
+        self.model.flush()
+
+    def _remember_scroll(self, *args):
+        bar = self.list_view.verticalScrollBar()
+        self._stick_to_bottom = bar.value() >= bar.maximum()
+
+    def _follow_new_rows(self, *args):
+        # scrollToBottom forces a layout pass, so do it once per event-loop turn
+        if self._stick_to_bottom and not self._scroll_pending:
+            self._scroll_pending = True
+            QtCore.QTimer.singleShot(0, self._scroll_to_end)
+
+    def _scroll_to_end(self):
+        self._scroll_pending = False
+        self.list_view.scrollToBottom()
+
+    # === Export ===
+    def export(self, path=None):
+        """Write every buffered message (regardless of filters) to a text file."""
+        if path is None:
+            path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Log", "game_log.txt", "Text Files (*.txt)")
+            if not path:
+                return None
+        self.model.flush()
+        with open(path, "w", encoding="utf-8") as f:
+            for _, text in self.model.entries:
+                f.write(f"{text}\n")
+        return path
@@ -36,11 +36,15 @@ from market import (
     refresh_market,
     adjust_market_prices,
     visit_market,
+    end_of_year_cleanup,
 )
+from market_retention import new_game_archive
+from messages import MESSAGES, ConsoleSink
 
 # --- Production ---
 from draft_production import draft_production
 from post_production import run_post_production_phase
+from production import advance_productions
 
 
 # --- Utility Functions ---
@@ -254,21 +258,20 @@ def print_filmography(movies):
         print(f"     ✍️ Writer: {writer} 🎬 Director: {director} 🎭 Lead: {lead}")
 
 
-def print_actor_recap(actors):
+def print_actor_recap(actors, credits):
     print("\n🎭 Actor Career Recap:")
     for actor in actors:
-        films = actor.get("film_history", [])
-        if not films:
+        stats = credits.stats_for(actor)
+        if not stats:
             continue
-        avg_quality = sum(f["quality"] for f in films) / len(films)
-        avg_box_office = sum(f["box_office"] for f in films) / len(films)
         print(f"\n🧑 {actor['name']} — Age: {actor['age']} | Debut: {actor['debut_year']}")
-        print(f"🎬 Films: {len(films)} | Avg Quality: {avg_quality:.1f} | Avg Box Office: ${avg_box_office:.1f}M")
+        print(f"🎬 Films: {stats.count} | Avg Quality: {stats.avg_quality:.1f} | Avg Box Office: ${stats.avg_box_office:.1f}M")
 
-def print_talent_recap(talent_list, icon, role_name):
+def print_talent_recap(talent_list, icon, role_name, credits):
     """
     Print a simple recap for a list of talent (writers/directors).
     Expects talent_list to be an iterable of dicts with 'name', 'fame' optionally.
+    Credit counts come from the studio's shared credits table.
     """
     if not talent_list:
         print(f"\n{icon} No {role_name}s to recap.")
@@ -278,8 +281,8 @@ def print_talent_recap(talent_list, icon, role_name):
     for person in talent_list:
         name = person.get("name", "Unknown")
         fame = person.get("fame", 0)
-        credits = len(person.get("film_history", [])) if person.get("film_history") else 0
-        print(f" • {name} — Fame: {fame} | Credits: {credits}")
+        credit_count = credits.credit_count(person)
+        print(f" • {name} — Fame: {fame} | Credits: {credit_count}")
 
 
 def end_of_year_report(studio, casting_pool):
@@ -291,27 +294,24 @@ def end_of_year_report(studio, casting_pool):
 
     print_studio_summary(studio)
 
-    seen = set()
-    used_actors = []
+    used_actors = {}
     for m in studio.released_movies:
         for actor in m.get("cast", []):
-            if actor["name"] not in seen:
-                seen.add(actor["name"])
-                used_actors.append(actor)
+            used_actors.setdefault(actor["id"], actor)
 
     print_filmography(studio.released_movies)
-    print_actor_recap(used_actors)
-    print_talent_recap(casting_pool.writers, "🖋️", "Writer")
-    print_talent_recap(casting_pool.directors, "🎬", "Director")
+    print_actor_recap(used_actors.values(), studio.credits)
+    print_talent_recap(casting_pool.writers, "🖋️", "Writer", studio.credits)
+    print_talent_recap(casting_pool.directors, "🎬", "Director", studio.credits)
 
 
 # --- Main Loop ---
-def hollywood_sim():
+def hollywood_sim(box_office="monthly"):
     calendar = GameCalendar()
     casting_pool = CastingPool()
-    studio = Studio(year=calendar.year)
-    casting_manager = CastingManager()
-    market_pool = init_market()
+    studio = Studio(year=calendar.year, box_office=box_office)
+    casting_manager = CastingManager(studio.credits)
+    market_pool = init_market(new_game_archive())
     game_setup(calendar, studio, market_pool, casting_pool)
 
     rival_studios = [
@@ -363,14 +363,15 @@ def hollywood_sim():
                 studio.scripts.append(script)
                 print(f"✅ New script '{script['title']}' written by {selected_writer['name']}!")
 
-        scheduled_titles = {m["title"] for m in studio.scheduled_movies}
-        released_titles = {m["title"] for m in studio.released_movies}
-        managed_scripts = [s for s in studio.scripts if s["title"] not in scheduled_titles and s["title"] not in released_titles]
+        produced_ids = {m["script_id"] for m in studio.scheduled_movies}
+        produced_ids.update(m["script_id"] for m in studio.released_movies)
+        managed_scripts = [s for s in studio.scripts if s["id"] not in produced_ids]
         manage_scripts(managed_scripts, casting_pool, calendar, studio)
 
         print("\n🎬 Drafting Production...")
         draft_production(studio, calendar, casting_pool, market_pool)
 
+        advance_productions(studio, calendar)
         run_post_production_phase(studio, calendar)
 
         releases = studio.check_for_releases(calendar)
@@ -384,14 +385,23 @@ def hollywood_sim():
             score, review = studio.generate_review(movie)
             print(f"📝 Critics: {score}/100 — {review}")
 
-        studio.update_revenue()
+        studio.update_revenue(calendar)
         print("\n📈 Revenue Update:")
         for movie in studio.released_movies:
             if movie.get("monthly_revenue"):
                 print(f"• {movie['title']}: ${movie['monthly_revenue'][0]:.2f}M")
+        overseas = sum(studio.territory_take.values()) - studio.territory_take["Domestic"]
+        if overseas > 0:
+            print(f"🌍 Overseas box office: ${overseas:.2f}M")
+        catalog = studio.ancillary.monthly_income()
+        if catalog > 0:
+            print(f"📼 Catalog (home video, streaming, TV): ${catalog:.2f}M")
 
         expense = studio.expenses()
         print(f"💸 Expenses: Total ${expense['total']:.2f}M")
+        debt_service = studio.pay_interest(calendar)
+        if debt_service:
+            print(debt_service)
 
         events.run_random_events(studio, calendar)
         if studio.newsfeed:
@@ -399,10 +409,17 @@ def hollywood_sim():
             for story in studio.newsfeed[-3:]:
                 print(f"• {story}")
 
+        warning = studio.cashflow.refresh(calendar).warning()
+        if warning:
+            print(warning)
+
         calendar.advance()
 
+    end_of_year_cleanup(market_pool, calendar)
     end_of_year_report(studio, casting_pool)
 
 
 if __name__ == "__main__":
-    hollywood_sim()
+    MESSAGES.subscribe(ConsoleSink())
+    # --weekly / --daily resolve box-office runs below a month
+    hollywood_sim("daily" if "--daily" in sys.argv else "weekly" if "--weekly" in sys.argv else "monthly")
@@ -155,7 +155,7 @@ def main():
 
             # Display the choices (Corrected loop indentation)
             for i, a in enumerate(actors, 1):
-                memory = casting_manager.get_history(a["name"])
+                memory = casting_manager.get_history(a)
                 if memory:
                     history_note = f"🎞️  Past: {memory['count']}x | Avg Q: {memory['avg_quality']} | Box: ${memory['avg_box_office']}M"
                 else:
@@ -6,31 +6,44 @@ from personnel import generate_actor, generate_writer, generate_director, genera
 from scripts import generate_script
 from contracts import create_contract
 from game_data import SEASONS, STAFF_SPECIALTIES
+from econ_tables import GENRE_NAMES, demand_row, genre_id
+from profiling import PROFILER
+from messages import emit
+from market_retention import MARKET_CAPS, enforce_market_caps, retire_aged_talent
 
 # market.py
 
 class MarketPool:
-    def __init__(self):
+    def __init__(self, caps=None, archive=None):
         self.scripts = []
         self.actors = []
         self.directors = []
         self.writers = []
         self.staff = []
+        self.caps = dict(caps or MARKET_CAPS)  # list name -> max entries kept
+        self.archive = archive                 # MarketArchive for evicted entries, or None
+        self.month = 0                         # calendar.month_index() of the last refresh
 
     # --- Convenience add methods ---
+    # Entries are stamped with the month they were listed, for retention
     def add_actor(self, actor):
+        actor.setdefault("listed_month", self.month)
         self.actors.append(actor)
 
     def add_director(self, director):
+        director.setdefault("listed_month", self.month)
         self.directors.append(director)
 
     def add_writer(self, writer):
+        writer.setdefault("listed_month", self.month)
         self.writers.append(writer)
 
     def add_staff(self, staff):
+        staff.setdefault("listed_month", self.month)
         self.staff.append(staff)
 
     def add_script(self, script):
+        script.setdefault("listed_month", self.month)
         self.scripts.append(script)
 
 
@@ -42,11 +55,12 @@ class MarketPool:
         self.staff.clear()
 
 
-def init_market():
-    return MarketPool()
+def init_market(archive=None):
+    return MarketPool(archive=archive)
 
 def populate_initial_market(pool, calendar):
     """Fills the market pool with a larger starting set of talent and scripts."""
+    pool.month = calendar.month_index()
     # Generate a healthy number of starting professionals
     for _ in range(15): pool.add_actor(generate_actor(calendar.year))
     for _ in range(8): pool.add_director(generate_director(calendar.year))
@@ -64,25 +78,13 @@ def populate_initial_market(pool, calendar):
 
     # Set initial prices
     adjust_market_prices(pool, calendar)
-    print("Initial market populated.")
+    emit("market", "Initial market populated.")
 
 
 def get_demand_modifiers(calendar):
     """Calculates genre demand multipliers based on trends and events."""
-    modifiers = {}
-    for genre in calendar.trending_genres:
-        modifiers[genre] = modifiers.get(genre, 1.0) * 1.25
-
-    event = calendar.get_current_event()
-    if event in ["Awards Season Kick-off", "Oscars Buzz"]:
-        modifiers["Drama"] = modifiers.get("Drama", 1.0) * 1.5
-    elif event == "Summer Blockbuster Season":
-        for g in ["Action", "Sci-Fi"]:
-            modifiers[g] = modifiers.get(g, 1.0) * 1.4
-    elif event == "Holiday Movie Rush":
-        for g in ["Family", "Musical"]:
-            modifiers[g] = modifiers.get(g, 1.0) * 1.3
-    return modifiers
+    row = demand_row(calendar.trending_genres, calendar.get_current_event())
+    return {g: row[gid] for gid, g in enumerate(GENRE_NAMES) if row[gid] != 1.0}
 
 
 def adjust_market_prices(pool, calendar):
@@ -93,36 +95,46 @@ def adjust_market_prices(pool, calendar):
     if len(pool.actors) < 5:
         scarcity_factor *= 1.15
 
-    demand_mods = get_demand_modifiers(calendar)
+    demand = demand_row(calendar.trending_genres, calendar.get_current_event())
 
     for script in pool.scripts:
         base_value = script.get("potential_quality", 50) * 0.25
-        genre_mod = demand_mods.get(script["genre"], 1.0)
+        genre_mod = demand[genre_id(script["genre"])]
         script["value"] = round(base_value * scarcity_factor * genre_mod, 2)
 
+    action_in_demand = demand[genre_id("Action")] != 1.0
     for actor in pool.actors:
-        if "Action Hero" in actor.get("tags", []) and "Action" in demand_mods:
+        if action_in_demand and "Action Hero" in actor.get("tags", []):
             actor["salary"] = round(actor["salary"] * 1.1, 2)
 
 
 def refresh_market(pool, casting_pool, calendar, studio):
-    """Generate new scripts/talent and rebalance prices."""
+    """Generate new scripts/talent, evict what no longer fits and rebalance prices."""
+    pool.month = calendar.month_index()
+
     # Actors, writers, directors
-    pool.actors.append(generate_actor(calendar.year))
-    pool.directors.append(generate_director(calendar.year))
-    pool.writers.append(generate_writer(calendar.year))
+    pool.add_actor(generate_actor(calendar.year))
+    pool.add_director(generate_director(calendar.year))
+    pool.add_writer(generate_writer(calendar.year))
+    PROFILER.count("talent_generated", 3)
 
     # Generate new scripts
     if pool.writers:
         for writer in random.sample(pool.writers, min(2, len(pool.writers))):
             script = generate_script(calendar, writer)
             script["value"] = round(script["potential_quality"] * 0.25, 2)
-            pool.scripts.append(script)
+            pool.add_script(script)
+            PROFILER.count("scripts_generated")
 
     # Staff (limit)
     if len(pool.staff) < 20:
         role = random.choice(list(STAFF_SPECIALTIES.keys()))
-        pool.staff.append(generate_staff_member(role, calendar.year))
+        pool.add_staff(generate_staff_member(role, calendar.year))
+        PROFILER.count("talent_generated")
+
+    # Keep every list within its cap so market scans stay bounded
+    evicted = enforce_market_caps(pool, pool.month)
+    PROFILER.count("market_evicted", sum(evicted.values()))
 
     # Always rebalance after refresh
     adjust_market_prices(pool, calendar)
@@ -264,7 +276,7 @@ def sign_talent_from_market(pool, studio):
         return
 
     contract = create_contract(selected, role, int(months), selected.get("salary", 1.0))
-    studio.contracts[role].append(contract)
+    studio.sign_contract(contract)
     studio.hire(selected)
     pool.__getattribute__(role).remove(selected)
 
@@ -299,14 +311,14 @@ def adjust_market_values_by_season(pool, season):
 
 def handle_talent_transfer(studio_from, studio_to, talent, fee):
     if studio_to.balance < fee:
-        print(f"❌ {studio_to.name} cannot afford to transfer {talent['name']} for ${fee}M.")
+        emit("market", f"❌ {studio_to.name} cannot afford to transfer {talent['name']} for ${fee}M.", "warning")
         return
 
     studio_to.balance -= fee
     studio_from.balance += fee
     studio_to.hire(talent)
     studio_from.release(talent)
-    print(f"✅ {talent['name']} transferred from {studio_from.name} to {studio_to.name} for ${fee}M.")
+    emit("market", f"✅ {talent['name']} transferred from {studio_from.name} to {studio_to.name} for ${fee}M.")
 
 
 def estimate_pre_release_value(movie, season):
@@ -345,7 +357,7 @@ def select_auction_scripts(pool):
         if "High Concept" in script.get("tags", []):
             candidates.append(script)
             break
-    return list({s['title']: s for s in candidates}.values())[:2]
+    return list({s['id']: s for s in candidates}.values())[:2]
 
 def run_script_auction(pool, studio, rivals):
     auctioned = select_auction_scripts(pool)
@@ -410,13 +422,14 @@ def calculate_market_index(pool, trends):
 
 
 # End of year cleanup
-def end_of_year_cleanup(pool):
-    """Removes older scripts and talent to keep market fresh."""
-    pool.scripts = [s for s in pool.scripts if s.get("age", 0) < 12]
-    pool.actors = [a for a in pool.actors if a.get("age", 0) < 70]
-    pool.directors = [d for d in pool.directors if d.get("age", 0) < 75]
-    pool.writers = [w for w in pool.writers if w.get("age", 0) < 70]
-    pool.staff = [s for s in pool.staff if s.get("age", 0) < 65]
-    print("🧹 End of year cleanup completed."
-        )
+def end_of_year_cleanup(pool, calendar):
+    """Retires aged talent and stale listings to keep market fresh."""
+    now = calendar.month_index()
+    removed = retire_aged_talent(pool, now)
+    for kind, n in enforce_market_caps(pool, now).items():
+        removed[kind] = removed.get(kind, 0) + n
+    if pool.archive is not None:
+        pool.archive.flush()
+    emit("market", f"🧹 End of year cleanup completed ({sum(removed.values())} listings archived).")
+    return removed
     
@@ -0,0 +1,178 @@
+# HollywoodSim/game/market_retention.py
+
+"""
+Market Retention
+----------------
+Keeps the MarketPool bounded. Every list has a capacity cap; when a
+refresh pushes a list past it, the least attractive entries are evicted,
+where attractiveness is appeal (fame, or a script's potential quality)
+minus a penalty for every month the entry has sat unsold on the market.
+Entries that linger past MAX_LISTING_MONTHS are retired regardless.
+Evicted entries are written to an append-only MarketArchive so the
+market's history survives without staying in memory. Each game writes
+its own archive under the project's saves/ folder (archive_path), so two
+games never share, or read back, each other's history. Starting a game
+(new_game_archive) prunes all but the last ARCHIVES_KEPT archives, so the
+folder does not grow with every launch.
+"""
+
+import json
+import os
+import time
+import uuid
+
+MARKET_CAPS = {"actors": 60, "directors": 30, "writers": 30, "staff": 20, "scripts": 40}
+MAX_LISTING_MONTHS = {"actors": 48, "directors": 48, "writers": 48, "staff": 36, "scripts": 24}
+STALE_PENALTY = 2.0  # appeal lost per month on the market
+SAVE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "saves")
+ARCHIVES_KEPT = 3  # market archives from past games left in SAVE_DIR
+
+# People retire from the market at these real ages (staff have no age)
+RETIREMENT_AGE = {"actors": 70, "directors": 75, "writers": 70}
+
+
+def new_session_id():
+    """A key for one game: start time plus a random suffix, so same-second starts don't collide."""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+def archive_path(session=None, save_dir=SAVE_DIR):
+    """Where a game's market archive lives; a fresh session id if none is given."""
+    return os.path.join(save_dir, f"market_archive_{session or new_session_id()}.jsonl")
+
+
+def prune_archives(keep=ARCHIVES_KEPT, save_dir=SAVE_DIR):
+    """Delete all but the `keep` most recently written market archives; returns how many went."""
+    if not os.path.isdir(save_dir):
+        return 0
+    paths = [os.path.join(save_dir, name) for name in os.listdir(save_dir)
+             if name.startswith("market_archive_") and name.endswith(".jsonl")]
+    paths.sort(key=os.path.getmtime, reverse=True)
+    for path in paths[keep:]:
+        os.remove(path)
+    return len(paths[keep:])
+
+
+def new_game_archive(keep=ARCHIVES_KEPT, save_dir=SAVE_DIR):
+    """A MarketArchive for a new game, after rotating out old games' archives."""
+    prune_archives(max(0, keep - 1), save_dir)  # leave room for this game's
+    return MarketArchive(archive_path(save_dir=save_dir))
+
+
+def months_listed(entry, now):
+    return now - entry.get("listed_month", now)
+
+
+def appeal(kind, entry):
+    if kind == "scripts":
+        return entry.get("potential_quality", entry.get("quality", 0))
+    return entry.get("fame", 0)
+
+
+def retention_score(kind, entry, now):
+    """Higher is worth keeping; fresh, well-known or high-quality entries score best."""
+    return appeal(kind, entry) - STALE_PENALTY * months_listed(entry, now)
+
+
+class MarketArchive:
+    """
+    Append-only JSON-lines store of entries that left the market unsold.
+    Each line is a compact array; see FIELDS. With path=None records are
+    only counted, which is what headless runs and benchmarks use.
+    """
+
+    FIELDS = ("kind", "id", "name", "category", "appeal", "price", "listed", "archived", "reason")
+
+    def __init__(self, path=None, buffer_size=64):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._buffer = []
+
+    def add(self, kind, entry, now, reason):
+        self.count += 1
+        if self.path is None:
+            return
+        self._buffer.append([
+            kind,
+            entry.get("id"),
+            entry.get("title") if kind == "scripts" else entry.get("name"),
+            entry.get("genre") if kind == "scripts" else entry.get("role", kind[:-1]),
+            appeal(kind, entry),
+            entry.get("value") if kind == "scripts" else entry.get("salary"),
+            entry.get("listed_month", now),
+            now,
+            reason,
+        ])
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer or self.path is None:
+            return
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for row in self._buffer:
+                f.write(json.dumps(row, separators=(",", ":")) + "\n")
+        self._buffer = []
+
+    def records(self, kind=None):
+        """Yield archived entries as dicts, oldest first."""
+        self.flush()
+        if self.path is None or not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                record = dict(zip(self.FIELDS, json.loads(line)))
+                if kind is None or record["kind"] == kind:
+                    yield record
+
+
+# === Enforcement ===
+def _evict(pool, kind, keep, now, reason):
+    """Keep entries for which keep(entry) is true, archiving the rest; preserves order."""
+    items = getattr(pool, kind)
+    kept = []
+    for entry in items:
+        if keep(entry):
+            kept.append(entry)
+        elif pool.archive is not None:
+            pool.archive.add(kind, entry, now, reason)
+    evicted = len(items) - len(kept)
+    items[:] = kept
+    return evicted
+
+
+def enforce_market_caps(pool, now):
+    """Retire stale listings, then trim every list back to its cap. Returns evictions per list."""
+    evicted = {}
+    for kind, cap in pool.caps.items():
+        items = getattr(pool, kind)
+        for entry in items:
+            entry.setdefault("listed_month", now)
+
+        max_months = MAX_LISTING_MONTHS.get(kind)
+        removed = 0
+        if max_months is not None:
+            removed += _evict(pool, kind, lambda e: months_listed(e, now) < max_months, now, "expired")
+
+        if len(items) > cap:
+            ranked = sorted(items, key=lambda e: retention_score(kind, e, now), reverse=True)
+            keep_ids = {id(e) for e in ranked[:cap]}
+            removed += _evict(pool, kind, lambda e: id(e) in keep_ids, now, "evicted")
+
+        if removed:
+            evicted[kind] = removed
+    return evicted
+
+
+def retire_aged_talent(pool, now):
+    """Year-end pass: people past retirement age leave; staff and scripts go by listing age."""
+    retired = {}
+    for kind, limit in RETIREMENT_AGE.items():
+        n = _evict(pool, kind, lambda e: e.get("age", 0) < limit, now, "retired")
+        if n:
+            retired[kind] = n
+    return retired
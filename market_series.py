@@ -0,0 +1,163 @@
+# HollywoodSim/game/market_series.py
+
+"""
+Market Time Series
+------------------
+Pre-generated paths for the calendar's market: sentiment, streaming impact,
+economy regime, special events, the combined market modifier and the
+market index. Paths come from their own seeded RNG and are extended a year
+at a time, so any month (past or future) is an array read. The calendar
+replays them as it advances; forecasts and AI planners can look ahead
+without stepping the calendar.
+
+Months are addressed by index from the calendar's start: t = 0 is January
+of the start year.
+"""
+
+import random
+from array import array
+
+ECONOMY_STATES = ("stable", "boom", "recession")
+ECONOMY_MODIFIERS = (1.0, 1.1, 0.9)
+ECONOMY_CODES = {name: code for code, name in enumerate(ECONOMY_STATES)}
+
+SPECIAL_EVENTS = [
+    {"name": "Streaming Wars Intensify", "impact": -0.1, "duration": 3},
+    {"name": "New Tech Breakthrough", "impact": 0.15, "duration": 2},
+    {"name": "Major Scandal Hits Competitor", "impact": -0.2, "duration": 2},
+    {"name": "Prestigious Festival Buzz", "impact": 0.1, "duration": 1},
+]
+SPECIAL_EVENT_CHANCE = 0.2
+
+
+def roll_economy(rng):
+    roll = rng.random()
+    if roll < 0.15:
+        return "recession"
+    if roll < 0.30:
+        return "boom"
+    return "stable"
+
+
+class MarketSeries:
+    def __init__(self, start_year, annual_events, seed=None, horizon_years=10,
+                 sentiment=1.0, streaming=0.0, index=100.0, economy="stable"):
+        """
+        annual_events: callable year -> {month: event dict} (see
+        GameCalendar.generate_annual_events).
+        """
+        self.start_year = start_year
+        self.annual_events = annual_events
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        self.sentiment = array("d")     # t -> market sentiment
+        self.streaming = array("d")     # t -> streaming impact
+        self.economy = array("B")       # year offset -> ECONOMY_STATES code
+        self.modifier = array("d")      # t -> combined market modifier
+        self.index = array("d")         # t -> market index
+        self.event_starts = {}          # t -> [special events starting that month]
+        self.events_by_month = {}       # t -> [special events in effect that month]
+
+        self._state = (sentiment, streaming, index)
+        self._economy_start = ECONOMY_CODES.get(economy, 0)
+        self.extend_to(horizon_years * 12 - 1)
+
+    def __len__(self):
+        return len(self.modifier)
+
+    def month_index(self, year, month):
+        return (year - self.start_year) * 12 + (month - 1)
+
+    def date(self, t):
+        year, month0 = divmod(t, 12)
+        return self.start_year + year, month0 + 1
+
+    # === Generation ===
+    def extend_to(self, t):
+        """Generate whole years until month t is covered."""
+        while len(self.modifier) <= t:
+            self._generate_year()
+
+    def _generate_year(self):
+        rng = self.rng
+        year_offset = len(self.economy)
+        year = self.start_year + year_offset
+        self.economy.append(self._economy_start if year_offset == 0 else ECONOMY_CODES[roll_economy(rng)])
+        economy_mod = ECONOMY_MODIFIERS[self.economy[-1]]
+        events = self.annual_events(year)
+        sentiment, streaming, index = self._state
+
+        for month in range(1, 13):
+            t = len(self.modifier)
+            if t > 0:
+                if rng.random() < SPECIAL_EVENT_CHANCE:
+                    e = rng.choice(SPECIAL_EVENTS).copy()
+                    e["start"] = (year, month)
+                    e["end"] = (year, min(12, month + e["duration"]))
+                    self.event_starts[t] = [e]
+                    for covered in range(t, t + e["end"][1] - month + 1):
+                        self.events_by_month.setdefault(covered, []).append(e)
+                sentiment = round(max(0.5, min(1.5, sentiment + rng.uniform(-0.05, 0.05))), 2)
+                streaming = round(max(-0.3, min(0.3, streaming + rng.uniform(-0.02, 0.02))), 2)
+
+            mod = sentiment * economy_mod
+            event = events.get(month)
+            if event:
+                mod *= event.get("market_boost", 1.0)
+            for e in self.active_events(t):
+                mod *= (1 + e["impact"])
+            mod = round(mod, 2)
+
+            if t > 0:
+                index = round(max(50, min(150, index + (mod - 1.0) * rng.uniform(5, 10))), 2)
+
+            self.sentiment.append(sentiment)
+            self.streaming.append(streaming)
+            self.modifier.append(mod)
+            self.index.append(index)
+
+        self._state = (sentiment, streaming, index)
+
+    # === Queries ===
+    def active_events(self, t):
+        """Special events in effect at month t."""
+        return self.events_by_month.get(t, ())
+
+    def economy_at(self, t):
+        self.extend_to(t)
+        return ECONOMY_STATES[self.economy[t // 12]]
+
+    def modifier_at(self, t):
+        self.extend_to(t)
+        return self.modifier[t]
+
+    def sentiment_at(self, t):
+        self.extend_to(t)
+        return self.sentiment[t]
+
+    def streaming_at(self, t):
+        self.extend_to(t)
+        return self.streaming[t]
+
+    def index_at(self, t):
+        self.extend_to(t)
+        return self.index[t]
+
+    def window(self, t, months):
+        """Per-month snapshots for t .. t + months - 1."""
+        self.extend_to(t + months - 1)
+        out = []
+        for i in range(t, t + months):
+            year, month = self.date(i)
+            out.append({
+                "year": year,
+                "month": month,
+                "sentiment": self.sentiment[i],
+                "streaming_impact": self.streaming[i],
+                "economy": ECONOMY_STATES[self.economy[i // 12]],
+                "market_modifier": self.modifier[i],
+                "market_index": self.index[i],
+                "special_events": [e["name"] for e in self.active_events(i)],
+            })
+        return out
@@ -2,6 +2,7 @@
 
 from PySide6 import QtWidgets, QtCore
 from library import get_script_resale_value
+from profiling import PROFILER
 
 class MarketView(QtWidgets.QWidget):
     buy_script_signal = QtCore.Signal(dict)
@@ -163,6 +164,7 @@ class MarketView(QtWidgets.QWidget):
             return
 
         self.scripts_table.setRowCount(len(scripts))
+        PROFILER.count("rows_rendered", len(scripts))
         for row, s in enumerate(scripts):
             values = [
                 s.get("title", "Untitled"),
@@ -182,6 +184,7 @@ class MarketView(QtWidgets.QWidget):
             return
 
         self.library_table.setRowCount(len(shelf))
+        PROFILER.count("rows_rendered", len(shelf))
         for row, s in enumerate(shelf):
             resale = get_script_resale_value(s, getattr(self, "calendar", None))
             values = [
@@ -200,6 +203,7 @@ class MarketView(QtWidgets.QWidget):
             return
 
         table.setRowCount(len(talent_list))
+        PROFILER.count("rows_rendered", len(talent_list))
         for row, t in enumerate(talent_list):
             for col, key in enumerate(keys):
                 value = t.get(key, "")
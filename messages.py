@@ -0,0 +1,85 @@
+# HollywoodSim/game/messages.py
+
+"""
+Message Sinks
+-------------
+Core simulation code reports what happened with emit() instead of print().
+Messages go to every sink subscribed to the MESSAGES bus: the console CLI
+subscribes a ConsoleSink, the GUI a log_view.QtLogSink, and headless or
+Monte Carlo runs subscribe nothing (or a BufferedSink), so they do no
+terminal I/O at all. A sink is anything with a write(message) method.
+"""
+
+import contextlib
+import sys
+from collections import deque, namedtuple
+
+# topic groups messages by subsystem ("contracts", "scripts", "market", ...)
+Message = namedtuple("Message", "topic text severity")
+
+
+class NullSink:
+    def write(self, message):
+        pass
+
+
+class BufferedSink:
+    """Collects messages in memory; keeps only the newest maxlen if given."""
+
+    def __init__(self, maxlen=None):
+        self.messages = deque(maxlen=maxlen)
+
+    def write(self, message):
+        self.messages.append(message)
+
+    def drain(self):
+        """Return the buffered messages and empty the buffer."""
+        messages = list(self.messages)
+        self.messages.clear()
+        return messages
+
+
+class ConsoleSink:
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def write(self, message):
+        print(message.text, file=self.stream or sys.stdout)
+
+
+class MessageBus:
+    def __init__(self, sinks=()):
+        self.sinks = list(sinks)
+
+    def subscribe(self, sink):
+        if sink not in self.sinks:
+            self.sinks.append(sink)
+        return sink
+
+    def unsubscribe(self, sink):
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+
+    def emit(self, topic, text, severity="info"):
+        if not self.sinks:
+            return
+        message = Message(topic, text, severity)
+        for sink in self.sinks:
+            sink.write(message)
+
+    @contextlib.contextmanager
+    def only(self, *sinks):
+        """Send messages to just these sinks (none for silence) inside the block."""
+        saved = self.sinks
+        self.sinks = list(sinks)
+        try:
+            yield self
+        finally:
+            self.sinks = saved
+
+
+MESSAGES = MessageBus()
+
+
+def emit(topic, text, severity="info"):
+    MESSAGES.emit(topic, text, severity)
@@ -0,0 +1,156 @@
+# HollywoodSim/game/payroll.py
+
+"""
+Payroll Ledger
+--------------
+Running salary totals and an expiry-ordered index over a studio's
+contracts. Contracts go on and off the books only through the ledger:
+sign() (Studio.sign_contract), release() (Studio.release) and expire()
+(Studio.renew_contracts). The monthly payroll is read from a total
+instead of summed over every contract.
+
+A signed contract stores the absolute month it runs out ("expires", on
+the ledger's own clock) in place of a months-remaining counter, so a
+monthly renewal only touches the contracts that actually expire;
+remaining(contract) derives the months left. Each role keeps its
+contracts in a list sorted by expiry, which gives roster ordering for
+free and answers "who expires in the next N months" with a bisect.
+Salaries are recorded at signing, so later edits to a contract dict
+can't knock the totals out of step.
+"""
+
+from bisect import bisect_right, insort
+from itertools import count
+
+ROLES = ("actors", "writers", "directors", "staff")
+
+
+def _order(entry):
+    return entry[:2]
+
+
+class PayrollLedger:
+    def __init__(self, contracts):
+        self.contracts = contracts  # the studio's {role: [contract]} mapping; mutate it via the ledger
+        self.month = 0              # renewals so far; expiries are kept in this clock
+        self._seq = count()
+        self.by_role = dict.fromkeys(ROLES, 0.0)  # role -> monthly salary total
+        self.total = 0.0
+        self._expiry = {role: [] for role in ROLES}  # role -> sorted [(expires, seq, contract)]
+        self._booked = {}     # id(contract) -> ((expires, seq), salary)
+        self._by_person = {}  # person id -> [contract], oldest signing first
+        self._expiring = {}   # expiry month -> [salary total, contracts]
+        for role, contracts in self.contracts.items():
+            for contract in contracts:
+                self._add(role, contract)
+
+    # === Updates ===
+    def _add(self, role, contract):
+        if "expires" not in contract:
+            contract["expires"] = self.month + contract.get("duration", 0)
+        key = (contract["expires"], next(self._seq))
+        insort(self._expiry.setdefault(role, []), key + (contract,), key=_order)
+        salary = contract.get("salary", 1.0)
+        self._booked[id(contract)] = (key, salary)
+        expiring = self._expiring.setdefault(key[0], [0.0, 0])
+        expiring[0] += salary
+        expiring[1] += 1
+        person = contract.get("person")
+        if person and "id" in person:
+            self._by_person.setdefault(person["id"], []).append(contract)
+        self.by_role[role] = self.by_role.get(role, 0.0) + salary
+        self.total += salary
+
+    def _drop(self, role, contract):
+        key, salary = self._booked.pop(id(contract))
+        entries = self._expiry[role]
+        del entries[bisect_right(entries, key, key=_order) - 1]
+        expiring = self._expiring[key[0]]
+        expiring[0] -= salary
+        expiring[1] -= 1
+        if not expiring[1]:
+            del self._expiring[key[0]]
+        person = contract.get("person")
+        signed = self._by_person.get(person.get("id")) if person else None
+        if signed:
+            signed[:] = [c for c in signed if c is not contract]
+            if not signed:
+                del self._by_person[person["id"]]
+        self.by_role[role] -= salary
+        self.total -= salary
+        if not self._booked:  # don't let float error linger on an empty roster
+            self.by_role = dict.fromkeys(self.by_role, 0.0)
+            self.total = 0.0
+
+    def sign(self, contract):
+        if id(contract) in self._booked:
+            raise ValueError(f"Contract for {contract['person'].get('name', 'talent')} is already signed.")
+        self.contracts.setdefault(contract["type"], []).append(contract)
+        self._add(contract["type"], contract)
+
+    def release(self, contract):
+        """Drop a contract before it runs out."""
+        if id(contract) in self._booked:
+            role = contract["type"]
+            self._drop(role, contract)
+            self.contracts[role] = [c for c in self.contracts[role] if c is not contract]
+
+    def expire(self):
+        """Advance one month; drop and return the contracts that just ran out."""
+        self.month += 1
+        expired = []
+        for role, entries in self._expiry.items():
+            n = bisect_right(entries, (self.month, float("inf")), key=_order)
+            if not n:
+                continue
+            done = [contract for _, _, contract in entries[:n]]
+            for contract in done:
+                self._drop(role, contract)
+            ids = {id(c) for c in done}
+            self.contracts[role] = [c for c in self.contracts[role] if id(c) not in ids]
+            expired.extend(done)
+        return expired
+
+    # === Queries ===
+    def remaining(self, contract):
+        """Months left on a contract."""
+        return max(0, contract.get("expires", self.month) - self.month)
+
+    def payroll(self, role=None):
+        """Monthly salary total, for one role or the whole studio."""
+        return self.total if role is None else self.by_role.get(role, 0.0)
+
+    def salary_schedule(self, months):
+        """Salary paid in each of the next `months` months, from the totals expiring each month."""
+        schedule = []
+        paying = self.total
+        for k in range(months):
+            expiring = self._expiring.get(self.month + k)
+            if expiring:
+                paying -= expiring[0]
+            schedule.append(max(0.0, paying))
+        return schedule
+
+    def roster(self, role):
+        """A role's contracts, soonest to expire first."""
+        return [contract for _, _, contract in self._expiry.get(role, ())]
+
+    def expiring_within(self, months, role=None):
+        """Contracts with at most `months` left, soonest first."""
+        limit = (self.month + months, float("inf"))
+        roles = ROLES if role is None else (role,)
+        found = []
+        for r in roles:
+            entries = self._expiry.get(r, ())
+            found.extend(entries[:bisect_right(entries, limit, key=_order)])
+        found.sort(key=_order)
+        return [contract for _, _, contract in found]
+
+    def contracts_for(self, person):
+        """Every contract a person holds, oldest signing first."""
+        return list(self._by_person.get(person.get("id"), ()))
+
+    def contract_for(self, person):
+        """A person's most recent contract, or None."""
+        signed = self._by_person.get(person.get("id"))
+        return signed[-1] if signed else None
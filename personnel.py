@@ -3,6 +3,8 @@
 import random
 import game_data
 from game_data import FIRST_NAMES, LAST_NAMES
+from credits import CreditsTable
+from registry import new_id
 
 GENRES = game_data.GENRES
 
@@ -20,13 +22,13 @@ def generate_actor(current_year):
     tags = random.sample(TAG_POOL, k=random.choice([1, 2]))
 
     return {
+        "id": new_id("person"),
         "name": name,
         "fame": fame,
         "salary": salary,
         "tags": tags,
         "age": random.randint(20, 35),
         "debut_year": current_year,
-        "film_history": []  # Each entry: {title, year, month, role, genre, quality, box_office}
     }
 
 
@@ -55,6 +57,7 @@ def generate_writer(current_year=2025):
     debut_year = current_year - random.randint(0, age - 22)
 
     return {
+        "id": new_id("person"),
         "name": name,
         "age": age,
         "debut_year": debut_year,
@@ -67,7 +70,6 @@ def generate_writer(current_year=2025):
         "notable_script": None,
         "fame": fame,
         "salary": round(0.3 + fame * 0.02, 2),
-        "film_history": [],
         "awards": [],
         "reputation": "Rising Star" if fame < 40 else "Established",
         "prestige": 0
@@ -80,13 +82,13 @@ def generate_director(current_year=2025):
     TAGS = ["visual", "blockbuster", "methodical", "actor-friendly", "gritty", "stylized", "experimental"]
     fame = random.randint(20, 75)
     return {
+        "id": new_id("person"),
         "name": name,
         "age": random.randint(30, 60),
         "fame": fame,
         "salary": round(0.5 + fame * 0.03, 2),
         "debut_year": current_year - random.randint(0, 10),
         "education": random.choice(["Film School", "MFA", "Self-Taught"]),
-        "film_history": [],
         "genre_focus": random.choice(list(GENRES.keys())),
         "tags": random.sample(TAGS, k=2)
     }
@@ -131,6 +133,7 @@ def generate_staff_member(role, year):
         raise ValueError(f"Unsupported staff role: {role}")
 
     return {
+        "id": new_id("person"),
         "name": random_name(),
         "role": role,
         "experience": random.randint(1, 30),
@@ -139,7 +142,6 @@ def generate_staff_member(role, year):
         "tags": STAFF_TAGS.get(role, []),
         "year_joined": year,
         "education": random.choice(["Film School", "Apprenticeship", "Self-Taught", "Conservatory"]),
-        "film_history": []  # keep staff trackable like others
     }
 
 
@@ -176,67 +178,53 @@ class CastingPool:
 
 
 class CastingManager:
-    def __init__(self):
-        self.collaborations = {}
+    """Collaboration lookups backed by the studio's career stats cache."""
+
+    def __init__(self, credits=None):
+        self.credits = credits if credits is not None else CreditsTable()
 
     def record_collaboration(self, actor, movie):
         """Record collaborations between actor–writer and actor–director pairs."""
-        actor_key = actor["name"]
-        self.collaborations.setdefault(actor_key, []).append({
-            "title": movie["title"],
-            "quality": movie["quality"],
-            "box_office": movie["box_office"]
-        })
-
-        # Actor–Writer pair
-        if movie.get("writer"):
-            writer = movie["writer"]
-            pair_key = (actor["name"], writer["name"])
-            self.collaborations.setdefault(pair_key, []).append({
-                "title": movie["title"],
-                "quality": movie["quality"],
-                "box_office": movie["box_office"]
-            })
-
-        # Actor–Director pair
-        if movie.get("director"):
-            director = movie["director"]
-            pair_key = (actor["name"], director["name"])
-            self.collaborations.setdefault(pair_key, []).append({
-                "title": movie["title"],
-                "quality": movie["quality"],
-                "box_office": movie["box_office"]
-            })
-
-    def get_history(self, actor_name):
-        records = self.collaborations.get(actor_name, [])
-        if not records:
+        self.credits.record_release(movie)
+
+    def get_history(self, actor):
+        stats = self.credits.stats_for(actor)
+        if not stats:
             return None
-        avg_quality = sum(r["quality"] for r in records) / len(records)
-        avg_box_office = sum(r["box_office"] for r in records) / len(records)
         return {
-            "count": len(records),
-            "avg_quality": round(avg_quality, 1),
-            "avg_box_office": round(avg_box_office, 1)
+            "count": stats.count,
+            "avg_quality": round(stats.avg_quality, 1),
+            "avg_box_office": round(stats.avg_box_office, 1)
         }
 
     def get_collaboration_count(self, actor, writer):
-        key = (actor["name"], writer["name"])
-        return len(self.collaborations.get(key, []))
+        stats = self.credits.pair_stats(actor, writer)
+        return stats.count if stats else 0
 
     def get_average_quality(self, actor, writer):
-        key = (actor["name"], writer["name"])
-        history = self.collaborations.get(key, [])
-        if not history:
+        stats = self.credits.pair_stats(actor, writer)
+        if not stats:
             return None
-        return round(sum(f["quality"] for f in history) / len(history), 2)
+        return round(stats.avg_quality, 2)
 
     def get_average_box_office(self, actor, writer):
-        key = (actor["name"], writer["name"])
-        history = self.collaborations.get(key, [])
-        if not history:
+        stats = self.credits.pair_stats(actor, writer)
+        if not stats:
             return None
-        return round(sum(f["box_office"] for f in history) / len(history), 2)
+        return round(stats.avg_box_office, 2)
+
+    def top_partners(self, person, k=5, by="count"):
+        """Who this person has worked with most (or best), as (person, stats) pairs."""
+        if "id" not in person:
+            return []
+        return [(self.credits.people[pid], stats)
+                for pid, stats in self.credits.graph.top_partners(person["id"], k, by)]
+
+    def best_trios(self, k=5, by="quality", min_films=1):
+        """Best-performing actor–writer–director trios as (actor, writer, director, stats)."""
+        people = self.credits.people
+        return [(people[a], people[w], people[d], stats)
+                for (a, w, d), stats in self.credits.graph.best_trios(k, by, min_films)]
 
     def describe_pairing(self, actor, writer):
         count = self.get_collaboration_count(actor, writer)
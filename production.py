@@ -0,0 +1,152 @@
+# HollywoodSim/game/production.py
+
+"""
+Production Pipeline
+-------------------
+Every film goes through pre-production, shooting and post-production
+before it is release-ready. Stage lengths come from the film's budget
+class and are shortened by the crew: a Producer speeds up pre-production,
+a seasoned director the shoot, an Editor the cut.
+
+When a film starts, its whole timeline is laid out at once and each stage
+end is queued in a bucket keyed by the absolute month it is due, the same
+way talent_tasks buckets tasks. A monthly advance() only touches the
+films whose stage ends that month, so the studio can run any number of
+productions side by side without scanning them all every turn.
+"""
+
+from messages import emit
+
+STAGES = ("pre_production", "shooting", "post_production", "release_ready")
+STAGE_LABELS = {
+    "pre_production": "Pre-Production",
+    "shooting": "Shooting",
+    "post_production": "Post-Production",
+    "release_ready": "Release-Ready",
+    "released": "Released",
+}
+
+# Months spent in each working stage, by budget class
+STAGE_MONTHS = {
+    "Low": {"pre_production": 1, "shooting": 1, "post_production": 1},
+    "Mid": {"pre_production": 1, "shooting": 2, "post_production": 1},
+    "High": {"pre_production": 2, "shooting": 3, "post_production": 2},
+}
+
+# The crew member who takes a month off each stage
+STAGE_CREW = {"pre_production": "Producer", "post_production": "Editor"}
+VETERAN_DIRECTOR = 60  # fame + 5 * experience needed to shoot a month faster
+
+
+def _staff_roles(movie):
+    staff = movie.get("staff") or []
+    if isinstance(staff, dict):
+        staff = staff.values()
+    return {member.get("role") for member in staff if isinstance(member, dict)}
+
+
+def stage_durations(movie):
+    """[(stage, months)] for the working stages of a film."""
+    months = dict(STAGE_MONTHS.get(movie.get("budget_class", "Mid"), STAGE_MONTHS["Mid"]))
+    roles = _staff_roles(movie)
+    for stage, role in STAGE_CREW.items():
+        if role in roles:
+            months[stage] -= 1
+    director = movie.get("director") or {}
+    if director.get("fame", 0) + 5 * director.get("experience", 0) >= VETERAN_DIRECTOR:
+        months["shooting"] -= 1
+    return [(stage, max(1, months[stage])) for stage in STAGES[:-1]]
+
+
+class ProductionPipeline:
+    """Films in production for one studio, bucketed by the month their current stage ends."""
+
+    def __init__(self):
+        self.month = None  # absolute calendar month of the last advance
+        self.due = {}      # absolute month -> [(movie, stage ending then)]
+        self.active = 0
+
+    def start(self, movie, calendar, delay=0, durations=None):
+        """
+        Lay out a film's timeline from next month on; returns the month it is release-ready.
+        A delay (waiting for a soundstage or cast) lengthens pre-production.
+        """
+        now = calendar.month_index()
+        if self.month is None:
+            self.month = now
+        timeline = []
+        start = now + 1
+        for stage, months in durations or stage_durations(movie):
+            if stage == "pre_production":
+                months += delay
+            timeline.append((stage, start, start + months - 1))
+            start += months
+        timeline.append(("release_ready", start, None))
+
+        movie["status"] = STAGES[0]
+        movie["timeline"] = timeline
+        self._queue(movie, 0)
+        self.active += 1
+        return start
+
+    def _queue(self, movie, k):
+        stage, _, end = movie["timeline"][k]
+        movie["stage_index"] = k
+        self.due.setdefault(end, []).append((movie, stage))
+
+    def ready_month(self, movie):
+        """Absolute month a film becomes release-ready."""
+        return movie["timeline"][-1][1]
+
+    def remaining(self, movie, month_index):
+        """Months until a film is release-ready."""
+        return max(0, self.ready_month(movie) - month_index)
+
+    def advance(self, calendar):
+        """
+        Move every film whose stage ended before this month into its next stage.
+        Returns [(movie, new stage)].
+        """
+        now = calendar.month_index()
+        last = now - 1 if self.month is None else self.month
+        self.month = max(now, last)
+
+        moved = []
+        for month in range(last, now):
+            for movie, stage in self.due.pop(month, ()):
+                # Films dropped or finished early are skipped
+                k = movie.get("stage_index")
+                if k is None or movie["status"] != stage:
+                    continue
+                k += 1
+                next_stage = movie["timeline"][k][0]
+                movie["status"] = next_stage
+                if next_stage == "release_ready":
+                    movie.pop("stage_index")
+                    self.active -= 1
+                else:
+                    self._queue(movie, k)
+                moved.append((movie, next_stage))
+        return moved
+
+    def finish(self, movie):
+        """Make a film release-ready now, skipping what is left of its timeline."""
+        if movie.pop("stage_index", None) is not None:
+            self.active -= 1
+        movie["status"] = "release_ready"
+
+    def drop(self, movie):
+        """Take a film out of the pipeline (e.g. cancelled)."""
+        if movie.pop("stage_index", None) is not None:
+            self.active -= 1
+
+
+def advance_productions(studio, calendar):
+    """Monthly tick: move productions along and announce each stage change."""
+    moved = studio.production.advance(calendar)
+    for movie, stage in moved:
+        if stage == "release_ready":
+            emit("production", f"🎞️ '{movie['title']}' wrapped post-production and is ready for release.")
+        else:
+            emit("production", f"🎬 '{movie['title']}' moved into {STAGE_LABELS[stage].lower()}.")
+    return moved
@@ -0,0 +1,167 @@
+# HollywoodSim/game/profiling.py
+
+"""
+Turn Profiler
+-------------
+Lightweight instrumentation for the monthly turn. Phases are timed with
+`with PROFILER.phase(name):`, counters are bumped with PROFILER.count(),
+and every Nth turn can optionally be captured under cProfile and
+tracemalloc. Disabled (the default), phase() hands back one shared null
+context and count() returns straight away, so the hooks can stay in hot
+code. Phase times are inclusive: a phase that runs inside another (views
+refreshed during the month-end phase) is counted in both.
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from collections import deque
+
+_NULL = contextlib.nullcontext()
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class TurnProfiler:
+    """Per-phase timings, counters and optional deep captures for the turn loop."""
+
+    def __init__(self, history=120, capture_every=0, top=25):
+        self.enabled = False
+        self.capture_every = capture_every  # 0: never run cProfile/tracemalloc
+        self.top = top                      # rows kept from each capture
+        self.turns = deque(maxlen=history)  # recent turn records, oldest first
+        self.reset()
+
+    def reset(self):
+        self.turns.clear()
+        self.phases = {}      # name -> {"calls", "total_ms", "max_ms"}
+        self.counters = {}    # name -> running total
+        self.turn_count = 0
+        self.last_capture = None
+        self._current = None
+
+    # === Hooks ===
+    def phase(self, name):
+        if not self.enabled:
+            return _NULL
+        return _Phase(self, name)
+
+    def count(self, name, n=1):
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + n
+        if self._current is not None:
+            counts = self._current["counters"]
+            counts[name] = counts.get(name, 0) + n
+
+    def turn(self, label):
+        """Context for one whole turn; records its phases as a single entry."""
+        if not self.enabled:
+            return _NULL
+        return self._turn(label)
+
+    @contextlib.contextmanager
+    def _turn(self, label):
+        self.turn_count += 1
+        capture = self.capture_every and self.turn_count % self.capture_every == 0
+        record = {"turn": self.turn_count, "label": label, "phases": {}, "counters": {}, "captured": bool(capture)}
+        self._current = record
+
+        profile = None
+        if capture:
+            profile = cProfile.Profile()
+            tracing = tracemalloc.is_tracing()
+            if not tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            profile.enable()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["total_ms"] = (time.perf_counter() - start) * 1000
+            if profile:
+                profile.disable()
+                self.last_capture = self._capture(record, profile)
+                if not tracing:
+                    tracemalloc.stop()
+            self._current = None
+            self.turns.append(record)
+
+    def _record(self, name, seconds):
+        ms = seconds * 1000
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = {"calls": 0, "total_ms": 0.0, "max_ms": 0.0}
+        stats["calls"] += 1
+        stats["total_ms"] += ms
+        if ms > stats["max_ms"]:
+            stats["max_ms"] = ms
+        if self._current is not None:
+            phases = self._current["phases"]
+            phases[name] = phases.get(name, 0.0) + ms
+
+    def _capture(self, record, profile):
+        out = io.StringIO()
+        pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(self.top)
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        top_lines = [str(stat) for stat in snapshot.statistics("lineno")[:self.top]]
+        return {
+            "turn": record["turn"],
+            "label": record["label"],
+            "profile": out.getvalue(),
+            "peak_kb": peak / 1024,
+            "top_allocations": top_lines,
+        }
+
+    # === Reporting ===
+    def summary(self):
+        """Rows of (phase, calls, last_ms, avg_ms, max_ms), slowest average first."""
+        last = self.turns[-1]["phases"] if self.turns else {}
+        rows = [
+            (name, s["calls"], last.get(name, 0.0), s["total_ms"] / s["calls"], s["max_ms"])
+            for name, s in self.phases.items()
+        ]
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows
+
+    def to_dict(self):
+        return {
+            "enabled": self.enabled,
+            "capture_every": self.capture_every,
+            "turns_recorded": self.turn_count,
+            "phases": self.phases,
+            "counters": self.counters,
+            "recent_turns": list(self.turns),
+            "last_capture": self.last_capture,
+        }
+
+    def dump_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+
+PROFILER = TurnProfiler()
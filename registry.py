@@ -0,0 +1,31 @@
+# HollywoodSim/game/registry.py
+
+"""
+ID Registry
+-----------
+Hands out stable integer ids for people, scripts, movies and loans at the moment
+they are generated. Ids are dense per kind, so they work as dict keys and
+as indexes into arrays. The registry only counts; owners keep their own
+id -> object maps, so nothing here holds talent or scripts in memory.
+"""
+
+from itertools import count
+
+ID_KINDS = ("person", "script", "movie", "loan")
+
+_counters = {kind: count(1) for kind in ID_KINDS}
+
+
+def new_id(kind):
+    """Return the next id for a kind (one of ID_KINDS)."""
+    try:
+        return next(_counters[kind])
+    except KeyError:
+        raise ValueError(f"Unknown id kind: {kind}") from None
+
+
+def ensure_id(obj, kind):
+    """Return obj['id'], assigning one if the object was built without it."""
+    if "id" not in obj:
+        obj["id"] = new_id(kind)
+    return obj["id"]
@@ -1,6 +1,9 @@
 # HollywoodSim/game/released_movies_view.py
 
 from PySide6 import QtWidgets, QtGui
+from profiling import PROFILER
+from territories import territory_split
+from audience import audience_text
 
 class ReleasedMoviesView(QtWidgets.QWidget):
     def __init__(self, studio):
@@ -67,6 +70,7 @@ class ReleasedMoviesView(QtWidgets.QWidget):
 
         # Populate table
         self.table.setRowCount(len(movies))
+        PROFILER.count("rows_rendered", len(movies))
         for row, m in enumerate(movies):
             values = [
                 m.get("title", "N/A"),
@@ -120,9 +124,18 @@ class ReleasedMoviesView(QtWidgets.QWidget):
             f"Writer: {movie.get('writer', {}).get('name') if isinstance(movie.get('writer'), dict) else movie.get('writer', 'N/A')}",
             f"Cast: {', '.join(cast) if cast else 'N/A'}",
             f"Box Office: ${movie.get('box_office', 0):.2f}M",
+            f"Territories: {self._territory_text(movie)}",
+            f"Audience: {audience_text(movie.get('audience'))}",
             f"Marketing Plan: {movie.get('marketing_plan', 'None')}",
             f"Release Strategy: {movie.get('release_strategy', 'N/A')}",
             f"Awards: {movie.get('awards', 'None')}",            
         ]
 
         self.detail_panel.setText("\n".join(details))
+
+    @staticmethod
+    def _territory_text(movie):
+        if not movie.get("territory_shares"):
+            return "N/A"
+        split = territory_split(movie.get("box_office", 0), movie["territory_shares"])
+        return " · ".join(f"{name} ${amount:.1f}M" for name, amount in split.items() if amount >= 0.05)
@@ -2,6 +2,8 @@
 
 import random
 
+from cashflow import spending_limit
+
 class RivalStudio:
     def __init__(self, name, balance=100, prestige=0):
         self.name = name
@@ -9,6 +11,11 @@ class RivalStudio:
         self.prestige = prestige
         self.released_movies = []
 
+    def spending_limit(self):
+        """What the rival will spend now, by the same rule as the player's cash-flow forecast."""
+        # Rivals earn and pay nothing month to month, so their projected balance is flat
+        return spending_limit(self.balance)
+
     def act_month(self, market_pool, calendar):
         """Simple AI to simulate rival activity."""
         actions = []
@@ -19,7 +26,7 @@ class RivalStudio:
             trending_scripts = [s for s in market_pool.scripts if s['genre'] in calendar.trending_genres]
             script_to_buy = random.choice(trending_scripts) if trending_scripts else random.choice(market_pool.scripts)
             
-            if self.balance >= script_to_buy.get("value", 5):
+            if script_to_buy.get("value", 5) <= self.spending_limit():
                 self.balance -= script_to_buy["value"]
                 market_pool.scripts.remove(script_to_buy)
                 actions.append(f"{self.name} acquired script '{script_to_buy['title']}'.")
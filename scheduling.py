@@ -0,0 +1,249 @@
+# HollywoodSim/game/scheduling.py
+
+"""
+Resource Scheduling
+-------------------
+Booking calendars for the things a production ties up: soundstages,
+talent and crew. Time is measured in absolute calendar months
+(GameCalendar.month_index), and every calendar has a capacity - one for a
+person, the number of soundstages for the lot.
+
+Each calendar keeps its bookings twice:
+  - a MonthLoad tree (a segment tree over the month axis holding how many
+    bookings cover each month), which answers "is [a, b] free?" and "when
+    is the next free window of n months?" in O(log n);
+  - a list of bookings sorted by start month, for "who holds it then?".
+
+A ResourceSchedule ties the calendars to films: a production books a
+soundstage plus its cast and director for the shoot, and its crew for
+the shoot and the edit. produce_movie asks it for the earliest start at
+which everything is free, so a film waits for a stage (or for its star)
+instead of double-booking.
+"""
+
+from bisect import bisect_right, insort
+from itertools import count
+
+SOUNDSTAGES = 3
+MAX_WAIT = 12  # months a production will wait for its resources
+
+
+class MonthLoad:
+    """Bookings per month over [0, size): range add, range max, and first-month searches."""
+
+    def __init__(self, size=64):
+        self.size = size
+        self.hi = [0] * (2 * size)   # max load in the node's range, including its own add
+        self.lo = [0] * (2 * size)   # min load likewise
+        self.add = [0] * (2 * size)  # amount added to the node's whole range
+
+    def update(self, a, b, delta):
+        """Add delta to every month in [a, b] (b < size)."""
+        self._update(a, b, delta, 1, 0, self.size - 1)
+
+    def max(self, a, b):
+        """Highest load in [a, b]; months past the end have no bookings."""
+        if a >= self.size:
+            return 0
+        return self._max(a, min(b, self.size - 1), 1, 0, self.size - 1)
+
+    def first_at_least(self, a, b, level):
+        """First month in [a, b] with load >= level, or None."""
+        return self._first(a, min(b, self.size - 1), lambda carry, node: carry + self.hi[node] < level,
+                           1, 0, self.size - 1, 0)
+
+    def first_below(self, a, level):
+        """First month >= a with load < level; months past the end are free."""
+        if a >= self.size:
+            return a
+        found = self._first(a, self.size - 1, lambda carry, node: carry + self.lo[node] >= level,
+                            1, 0, self.size - 1, 0)
+        return self.size if found is None else found
+
+    # === Tree walks ===
+    def _update(self, a, b, delta, node, lo, hi):
+        if b < lo or hi < a:
+            return
+        if a <= lo and hi <= b:
+            self.add[node] += delta
+            self.hi[node] += delta
+            self.lo[node] += delta
+            return
+        mid = (lo + hi) // 2
+        self._update(a, b, delta, 2 * node, lo, mid)
+        self._update(a, b, delta, 2 * node + 1, mid + 1, hi)
+        left, right = 2 * node, 2 * node + 1
+        self.hi[node] = self.add[node] + max(self.hi[left], self.hi[right])
+        self.lo[node] = self.add[node] + min(self.lo[left], self.lo[right])
+
+    def _max(self, a, b, node, lo, hi):
+        if a <= lo and hi <= b:
+            return self.hi[node]
+        mid = (lo + hi) // 2
+        best = float("-inf")
+        if a <= mid:
+            best = self._max(a, b, 2 * node, lo, mid)
+        if b > mid:
+            best = max(best, self._max(a, b, 2 * node + 1, mid + 1, hi))
+        return self.add[node] + best
+
+    def _first(self, a, b, skip, node, lo, hi, carry):
+        """Leftmost month in [a, b] under a node that skip() doesn't rule out."""
+        if b < lo or hi < a or skip(carry, node):
+            return None
+        if lo == hi:
+            return lo
+        carry += self.add[node]
+        mid = (lo + hi) // 2
+        found = self._first(a, b, skip, 2 * node, lo, mid, carry)
+        if found is None:
+            found = self._first(a, b, skip, 2 * node + 1, mid + 1, hi, carry)
+        return found
+
+
+class ResourceCalendar:
+    def __init__(self, name, capacity=1):
+        self.name = name
+        self.capacity = capacity
+        self.bookings = {}   # booking id -> (start, end, holder)
+        self._by_start = []  # sorted [(start, booking id)]
+        self._longest = 0    # longest booking, bounds the look-back in holders()
+        self._ids = count(1)
+        self.load = MonthLoad()
+
+    def _grow(self, month):
+        size = self.load.size
+        while size <= month:
+            size *= 2
+        self.load = MonthLoad(size)
+        for start, end, _ in self.bookings.values():
+            self.load.update(start, end, 1)
+
+    # === Queries ===
+    def is_free(self, start, end):
+        return self.load.max(start, end) < self.capacity
+
+    def next_free(self, start, months):
+        """First month >= start that begins `months` free months in a row."""
+        while True:
+            blocked = self.load.first_at_least(start, start + months - 1, self.capacity)
+            if blocked is None:
+                return start
+            start = self.load.first_below(blocked, self.capacity)
+
+    def holders(self, start, end):
+        """Whoever has a booking overlapping [start, end], earliest first."""
+        i = bisect_right(self._by_start, (end, float("inf")))
+        found = []
+        while i > 0:
+            i -= 1
+            b_start, booking_id = self._by_start[i]
+            if b_start + self._longest < start:
+                break
+            if self.bookings[booking_id][1] >= start:
+                found.append(self.bookings[booking_id][2])
+        found.reverse()
+        return found
+
+    def busy_until(self, month):
+        """End of the last booking running to `month` or later, or None."""
+        if not self._by_start:
+            return None
+        if self.capacity == 1:  # bookings never overlap, so the last to start ends last
+            last = self.bookings[self._by_start[-1][1]][1]
+        else:
+            last = max(end for _, end, _ in self.bookings.values())
+        return last if last >= month else None
+
+    # === Updates ===
+    def book(self, start, end, holder):
+        if not self.is_free(start, end):
+            raise ValueError(f"{self.name} is fully booked between months {start} and {end}.")
+        if end >= self.load.size:
+            self._grow(end)
+        booking_id = next(self._ids)
+        self.bookings[booking_id] = (start, end, holder)
+        insort(self._by_start, (start, booking_id))
+        self._longest = max(self._longest, end - start)
+        self.load.update(start, end, 1)
+        return booking_id
+
+    def cancel(self, booking_id):
+        start, end, _ = self.bookings.pop(booking_id)
+        del self._by_start[bisect_right(self._by_start, (start, booking_id)) - 1]
+        self.load.update(start, end, -1)
+
+
+class ResourceSchedule:
+    """The soundstages, talent and crew calendars of one studio."""
+
+    def __init__(self, soundstages=SOUNDSTAGES):
+        self.stages = ResourceCalendar("Soundstages", soundstages)
+        self.people = {}    # person id -> ResourceCalendar
+        self.by_movie = {}  # movie id -> [(calendar, booking id)]
+
+    def calendar_for(self, person):
+        calendar = self.people.get(person["id"])
+        if calendar is None:
+            calendar = self.people[person["id"]] = ResourceCalendar(person.get("name", "Talent"))
+        return calendar
+
+    def busy_until(self, person, month):
+        """Last month a person is booked from `month` on, or None if they are free."""
+        calendar = self.people.get(person.get("id"))
+        return calendar.busy_until(month) if calendar else None
+
+    def needs(self, movie, durations):
+        """
+        [(calendar, first month, last month)] a production books, counted from
+        the first day of the shoot: the stage, cast and director for the shoot,
+        the crew for the shoot and the edit.
+        """
+        months = dict(durations)
+        shoot = months["shooting"]
+        staff = movie.get("staff") or []
+        if isinstance(staff, dict):
+            staff = list(staff.values())
+        crew_last = shoot + months["post_production"] - 1
+
+        wanted = [(self.stages, 0, shoot - 1)]
+        seen = set()
+        for person, last in [(p, shoot - 1) for p in list(movie.get("cast") or []) + [movie.get("director")]] + \
+                            [(p, crew_last) for p in staff]:
+            if isinstance(person, dict) and "id" in person and person["id"] not in seen:
+                seen.add(person["id"])
+                wanted.append((self.calendar_for(person), 0, last))
+        return wanted
+
+    def first_delay(self, movie, durations, shoot_start, max_wait=MAX_WAIT):
+        """Fewest months the shoot must wait for everything to be free, or None if over max_wait."""
+        wanted = self.needs(movie, durations)
+        delay = 0
+        while delay <= max_wait:
+            start = shoot_start + delay
+            for calendar, first, last in wanted:
+                free = calendar.next_free(start + first, last - first + 1)
+                if free > start + first:
+                    delay += free - (start + first)
+                    break
+            else:
+                return delay
+        return None
+
+    def conflicts(self, movie, durations, shoot_start):
+        """Names of whatever is already booked during the proposed shoot."""
+        clashes = []
+        for calendar, first, last in self.needs(movie, durations):
+            if not calendar.is_free(shoot_start + first, shoot_start + last):
+                clashes.append(calendar.name)
+        return clashes
+
+    def book(self, movie, durations, shoot_start):
+        booked = self.by_movie.setdefault(movie["id"], [])
+        for calendar, first, last in self.needs(movie, durations):
+            booked.append((calendar, calendar.book(shoot_start + first, shoot_start + last, movie["title"])))
+
+    def release(self, movie):
+        """Drop every booking a film holds."""
+        for calendar, booking_id in self.by_movie.pop(movie["id"], ()):
+            calendar.cancel(booking_id)
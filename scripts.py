@@ -1,6 +1,9 @@
 # HollywoodSim/game/scripts.py
 import random
 import game_data
+from registry import new_id
+from titles import TITLES
+from messages import emit
 
 # --- Ratings system ---
 RATINGS = {
@@ -60,51 +63,152 @@ def assign_rating(tags, genre):
 
 
 # --- Script Description Generator ---
-def generate_script_description(script):
-    """Generate a flavourful description for a script market listing."""
-    # Genre-based moods (defensive: supply fallback mood)
-    moods = {
-        "Drama": ["an intense character study", "an emotional journey", "a gritty exploration of truth"],
-        "Comedy": ["a light-hearted romp", "a clever satire", "an offbeat misadventure"],
-        "Action": ["a high-octane thrill ride", "an explosive adventure", "an adrenaline-fuelled spectacle"],
-        "Horror": ["a chilling nightmare", "a slow-burning terror", "a twisted tale of fear"],
-        "Romance": ["a sweeping love story", "a bittersweet romance", "an unexpected connection"],
-        "Sci-Fi": ["a mind-bending odyssey", "a futuristic vision", "a speculative adventure"],
-        "Fantasy": ["a sprawling epic", "a magical journey", "a mythic tale"],
-    }
-
-    q = script.get("quality", 0)
-    if q >= 80:
-        quality_desc = random.choice(["festival-ready draft", "polished and ambitious script", "award-bait material"])
-    elif q >= 60:
-        quality_desc = random.choice(["solid working draft", "promising rewrite", "refined treatment"])
-    else:
-        quality_desc = random.choice(["rough outline", "uneven draft", "early concept"])
+# Descriptions are stored as a small integer code (one pick per phrase
+# list below) and only turned into text when someone reads them.
+DESCRIPTION_MOODS = {
+    "Drama": ["an intense character study", "an emotional journey", "a gritty exploration of truth"],
+    "Comedy": ["a light-hearted romp", "a clever satire", "an offbeat misadventure"],
+    "Action": ["a high-octane thrill ride", "an explosive adventure", "an adrenaline-fuelled spectacle"],
+    "Horror": ["a chilling nightmare", "a slow-burning terror", "a twisted tale of fear"],
+    "Romance": ["a sweeping love story", "a bittersweet romance", "an unexpected connection"],
+    "Sci-Fi": ["a mind-bending odyssey", "a futuristic vision", "a speculative adventure"],
+    "Fantasy": ["a sprawling epic", "a magical journey", "a mythic tale"],
+}
+DEFAULT_MOODS = ["a unique story"]
+
+# (min quality, phrases), best band first
+QUALITY_PHRASES = (
+    (80, ["festival-ready draft", "polished and ambitious script", "award-bait material"]),
+    (60, ["solid working draft", "promising rewrite", "refined treatment"]),
+    (0, ["rough outline", "uneven draft", "early concept"]),
+)
+BUZZ_PHRASES = (
+    (8, ["Producers are buzzing about it.", "Studios are already circling.", "Hot topic at industry mixers."]),
+    (5, ["Industry whispers suggest potential.", "A script with quiet momentum.", "Some critics are curious."]),
+    (0, ["Mostly ignored for now.", "Still waiting for attention.", "Unnoticed in the market — so far."]),
+)
+SOURCE_FLAIR = {
+    "original": "entirely original concept",
+    "adaptation": "based on existing material",
+    "remake": "a bold reimagining",
+    "sequel": "a continuation of a known story",
+}
+PICKS = 3  # phrases per list; description codes are base-3 digits
+
+
+def _band(bands, value):
+    return next(i for i, (floor, _) in enumerate(bands) if value >= floor or floor == 0)
+
+
+def draw_description_code(script):
+    """Roll a description for the script's current quality and buzz, as a code < 243."""
+    code = _band(QUALITY_PHRASES, script.get("quality", 0))
+    code = code * PICKS + random.randrange(PICKS)
+    code = code * PICKS + _band(BUZZ_PHRASES, script.get("buzz", 0))
+    code = code * PICKS + random.randrange(PICKS)
+    moods = DESCRIPTION_MOODS.get(script.get("genre", "Unknown"), DEFAULT_MOODS)
+    return code * PICKS + random.randrange(len(moods))
 
-    b = script.get("buzz", 0)
-    if b >= 8:
-        buzz_desc = random.choice(["Producers are buzzing about it.", "Studios are already circling.", "Hot topic at industry mixers."])
-    elif b >= 5:
-        buzz_desc = random.choice(["Industry whispers suggest potential.", "A script with quiet momentum.", "Some critics are curious."])
-    else:
-        buzz_desc = random.choice(["Mostly ignored for now.", "Still waiting for attention.", "Unnoticed in the market — so far."])
 
-    source_flair = {
-        "original": "entirely original concept",
-        "adaptation": "based on existing material",
-        "remake": "a bold reimagining",
-        "sequel": "a continuation of a known story",
-    }
+def render_description(script, code):
+    code, mood_i = divmod(code, PICKS)
+    code, buzz_i = divmod(code, PICKS)
+    code, buzz_band = divmod(code, PICKS)
+    quality_band, quality_i = divmod(code, PICKS)
 
     genre = script.get("genre", "Unknown")
-    mood = random.choice(moods.get(genre, ["a unique story"]))
+    moods = DESCRIPTION_MOODS.get(genre, DEFAULT_MOODS)
+    mood = moods[mood_i]
+    quality_desc = QUALITY_PHRASES[quality_band][1][quality_i]
+    buzz_desc = BUZZ_PHRASES[buzz_band][1][buzz_i]
+    source = SOURCE_FLAIR.get(script.get("source", "").lower(), "an original idea")
 
     return (
         f"A {script.get('length', 'feature')} {genre} — {mood}, "
-        f"{quality_desc}. It’s {source_flair.get(script.get('source', '').lower(), 'an original idea')}, {buzz_desc}"
+        f"{quality_desc}. It’s {source}, {buzz_desc}"
     )
 
 
+def generate_script_description(script):
+    """Generate a flavourful description for a script market listing."""
+    return render_description(script, draw_description_code(script))
+
+
+# --- Lazy Script Record ---
+# field -> (the stored code it is rendered from, function(script) that renders it)
+LAZY_FIELDS = {
+    "title": ("title_code", lambda s: TITLES.render(s["genre"], s["title_code"])),
+    "description": ("description_code", lambda s: render_description(s, s["description_code"])),
+}
+
+
+class Script(dict):
+    """
+    A script dict whose title and description are rendered on first read
+    (script["title"] or script.get("title")) and then cached in place.
+    Until then only title_code / description_code are stored, so scripts
+    generated in bulk and never shown cost no string work.
+
+    Membership and len() count the unrendered fields without rendering them.
+    Anything that walks the whole record (iteration, keys/items/values, and
+    so dict(script) and {**script}) renders them first, so a copy is always
+    complete. copy() stays lazy; to_dict() gives a plain, fully rendered dict.
+    """
+
+    __slots__ = ()
+
+    def _pending(self):
+        return [key for key, (code, _) in LAZY_FIELDS.items()
+                if not dict.__contains__(self, key) and dict.__contains__(self, code)]
+
+    def __missing__(self, key):
+        lazy = LAZY_FIELDS.get(key)
+        if lazy is None or not dict.__contains__(self, lazy[0]):
+            raise KeyError(key)
+        value = self[key] = lazy[1](self)
+        return value
+
+    def __contains__(self, key):
+        if dict.__contains__(self, key):
+            return True
+        lazy = LAZY_FIELDS.get(key)
+        return lazy is not None and dict.__contains__(self, lazy[0])
+
+    def __len__(self):
+        return dict.__len__(self) + len(self._pending())
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def render(self):
+        """Render every lazy field now; returns the script."""
+        for key in self._pending():
+            self[key]
+        return self
+
+    def __iter__(self):
+        return dict.__iter__(self.render())
+
+    def keys(self):
+        return dict.keys(self.render())
+
+    def items(self):
+        return dict.items(self.render())
+
+    def values(self):
+        return dict.values(self.render())
+
+    def copy(self):
+        return Script(dict.items(self))
+
+    def to_dict(self):
+        """A plain dict with every field rendered."""
+        return dict(dict.items(self.render()))
+
+
 # --- Script Generation ---
 def generate_script(calendar, writer, source_key=None):
     """Generate a new script from a contracted writer.
@@ -136,26 +240,8 @@ def generate_script(calendar, writer, source_key=None):
 
     genre_data = getattr(game_data, "GENRES", {}).get(genre, {"common_tags": [], "budget_affinity": ["Low", "Medium", "High"]})
 
-    # Title generation (resilient)
-    title_formats = getattr(game_data, "TITLE_FORMATS_BY_GENRE", {"default": ["{prefix} {noun}", "{noun} of the {noun2}"]})
-    title_parts = getattr(game_data, "SCRIPT_TITLES_BY_GENRE", {}).get(genre, {
-        "prefixes": ["The"],
-        "nouns": ["Story"],
-        "noun2": ["Dream"],
-    })
-    structure = random.choice(title_formats.get(genre, title_formats.get("default", ["{prefix} {noun}"])))
-    title_data = {
-        "prefix": random.choice(title_parts.get("prefixes", ["The"])),
-        "noun": random.choice(title_parts.get("nouns", ["Story"])),
-        "noun2": random.choice(title_parts.get("noun2", ["Dream"])),
-        "mid_phrase": random.choice(getattr(game_data, "MID_PHRASES", ["of the Ages"])),
-        "place": random.choice(getattr(game_data, "PLACES", ["Nowhere"])),
-        "adjective": random.choice(getattr(game_data, "ADJECTIVES", ["Lonely"])),
-    }
-    try:
-        title = structure.format(**title_data).title()
-    except Exception:
-        title = f"{title_data['prefix']} {title_data['noun']}"
+    # Title: drawn without replacement so titles never repeat; rendered on first read
+    title_code = TITLES.draw_code(genre)
 
     # Tags & theme
     genre_tags = random.sample(genre_data.get("common_tags", []), k=min(2, max(1, len(genre_data.get("common_tags", [])))))
@@ -181,8 +267,9 @@ def generate_script(calendar, writer, source_key=None):
     budget_class = random.choice(genre_data.get("budget_affinity", ["Low", "Medium", "High"]))
 
     # Build script dict
-    script = {
-        "title": title,
+    script = Script({
+        "id": new_id("script"),
+        "title_code": title_code,
         "genre": genre,
         "source": source_data.get("name", source_key),
         "rating": rating,
@@ -199,7 +286,7 @@ def generate_script(calendar, writer, source_key=None):
         "base_buzz": source_data.get("base_buzz", 0),
         "budget_class": budget_class,
         "length": random.choice(getattr(game_data, "POSSIBLE_LENGTHS", ["feature"])),
-    }
+    })
 
     # Buzz calc (defensively)
     buzz = 10 + int(potential_quality / 10)
@@ -212,8 +299,8 @@ def generate_script(calendar, writer, source_key=None):
     buzz += random.randint(-3, 3)
     script["buzz"] = max(0, buzz)
 
-    # Description
-    script["description"] = generate_script_description(script)
+    # Description (rendered on first read)
+    script["description_code"] = draw_description_code(script)
 
     return script
 
@@ -250,8 +337,7 @@ def rewrite_script(script, writer, calendar=None):
         buzz += 5
     script["buzz"] = max(0, buzz)
 
-    # Optionally print a debug line when running from command line tools
-    print(f"'{script.get('title')}' rewritten by {writer.get('name','Unknown')}. Quality is now {script['quality']}.")
+    emit("scripts", f"✍️ '{script.get('title')}' rewritten by {writer.get('name','Unknown')}. Quality is now {script['quality']}.")
     return script
 
 
@@ -270,5 +356,5 @@ def finalize_script(script, studio, calendar, draft_pool=None):
         except ValueError:
             pass
 
-    print(f"\n✅ Script '{script.get('title','Untitled')}' has been finalized and is ready for production!")
+    emit("scripts", f"✅ Script '{script.get('title','Untitled')}' has been finalized and is ready for production!")
     return script
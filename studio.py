@@ -2,14 +2,27 @@
 
 import random
 from personnel import generate_actor, STAFF_SPECIALTIES
-from scripts import assign_rating, RATINGS
-from genres import seasonal_bonus
-from contracts import find_active_contracts
-from post_production import apply_distribution_effects
+from scripts import assign_rating
+from econ_tables import (SEASONAL_BONUS, STRATEGY_LONGEVITY,
+                         STRATEGY_CURVES, MAX_ROLLOUT, genre_id, rating_id, strategy_id)
+from talent_tasks import TaskEngine
+from cashflow import CashFlowForecast
+from payroll import PayrollLedger
+from financing import FinanceBook
+from production import ProductionPipeline, stage_durations
+from scheduling import ResourceSchedule, MAX_WAIT
+from box_office_ticks import TickBoxOffice
+from ancillary import AncillaryMarket
+from territories import TERRITORY_NAMES, DOMESTIC_ONLY, run_profile
+from audience import DEMAND, segment_shares
+from credits import CreditsTable
+from registry import new_id, ensure_id
+from profiling import PROFILER
+from messages import emit
 
 
 class Studio:
-    def __init__(self, name="Player Studio", starting_balance=150.0, year=2025):
+    def __init__(self, name="Player Studio", starting_balance=150.0, year=2025, box_office="monthly"):
         self.name = name
         self.balance = starting_balance  # in millions
         self.ledger = []  # 📒 store monthly financial records
@@ -18,6 +31,7 @@ class Studio:
         self.scheduled_movies = []
         self.released_movies = []   # currently released movies (active in year)
         self.movie_history = []     # NEW: permanent archive of all released movies
+        self.history_by_id = {}     # movie id -> movie_history snapshot
         self.prestige = 0
         self.reputation = 0
         self.total_earnings = 0.0
@@ -26,16 +40,26 @@ class Studio:
         self.interest_rate = 0.05
         self.highest_grossing = None
         self.newsfeed = []
-        
+        self.credits = CreditsTable()  # shared film credits for all talent
 
         # Talent pools
         self.actor_pool = [generate_actor(year) for _ in range(15)]
         self.staff_pool = []
         self.contracts = {"actors": [], "writers": [], "directors": [], "staff": []}
+        self.payroll = PayrollLedger(self.contracts)  # salary totals + contracts by expiry
+        self.task_engine = TaskEngine()  # talent tasks bucketed by completion month
+        self.cashflow = CashFlowForecast(self)  # balance projection, refreshed each turn
+        self.financing = FinanceBook(self)      # loans, investor stakes and crowdfunding
+        self.production = ProductionPipeline()  # films in production, bucketed by stage end
+        self.schedule = ResourceSchedule()      # soundstage, talent and crew bookings
+        self.box_office = TickBoxOffice(box_office)  # "weekly"/"daily" resolve runs below a month
+        self.ancillary = AncillaryMarket()      # home video, streaming and TV after the run
+        self.territory_gross = dict.fromkeys(TERRITORY_NAMES, 0.0)  # box office by territory, all time
+        self.territory_take = dict.fromkeys(TERRITORY_NAMES, 0.0)   # this month's, by territory
 
     # ---- Financials ----
-    def record_financials(self, calendar, revenue=0.0, expenses=0.0, note=""):
-            """Record monthly revenues and expenses into the ledger."""
+    def record_financials(self, calendar, revenue=0.0, expenses=0.0, note="", territories=None):
+            """Record monthly revenues and expenses into the ledger, optionally split by territory."""
             net = revenue - expenses
             self.balance += net
             self.total_earnings += revenue
@@ -49,6 +73,8 @@ class Studio:
                 "balance": self.balance,
                 "note": note
             }
+            if territories:
+                entry["territories"] = dict(territories)
             self.ledger.append(entry)
             return entry
 
@@ -66,22 +92,13 @@ class Studio:
         net = revenue - expenses
         return {"year": year, "revenue": revenue, "expenses": expenses, "net": net}
 
-    def pay_interest(self):
-        """Charge monthly interest on outstanding debt."""
-        if self.debt > 0:
-            interest = round(self.debt * self.interest_rate / 12, 2)
-            self.balance -= interest
-            self.total_expenses += interest
-            self.ledger.append({
-                "year": getattr(self, "calendar_year", 2025),
-                "month": getattr(self, "calendar_month", 1),
-                "revenue": 0,
-                "expenses": interest,
-                "net": -interest,
-                "balance": self.balance,
-                "note": "Debt interest"
-            })
-            return f"💸 Paid interest of ${interest}M on debt."
+    def pay_interest(self, calendar):
+        """Pay this month's scheduled loan interest and principal."""
+        interest, principal = self.financing.service(calendar.month_index())
+        payment = round(interest + principal, 2)
+        if payment > 0:
+            self.record_financials(calendar, expenses=payment, note="Debt service")
+            return f"💸 Paid ${payment:,.2f}M on loans (${interest:,.2f}M interest). Debt left: ${self.debt:,.2f}M."
         return None
 
     # ---- Talent Management ----
@@ -93,37 +110,29 @@ class Studio:
         elif role in STAFF_SPECIALTIES:
             self.staff_pool.append(talent)
 
+    def sign_contract(self, contract):
+        """Put a contract on the books (see contracts.create_contract)."""
+        self.payroll.sign(contract)
+
     def release(self, talent):
-        """Release a talent from the roster."""
-        kind = talent.get("role")
-        if kind == "actor" and talent in self.contracts["actors"]:
-            self.contracts["actors"].remove(talent)
-            if talent in self.actor_pool:
-                self.actor_pool.remove(talent)
-        elif kind == "director" and talent in self.contracts["directors"]:
-            self.contracts["directors"].remove(talent)
-        elif kind == "writer" and talent in self.contracts["writers"]:
-            self.contracts["writers"].remove(talent)
-        elif kind in STAFF_SPECIALTIES and talent in self.contracts["staff"]:
-            self.contracts["staff"].remove(talent)
-            if talent in self.staff_pool:
-                self.staff_pool.remove(talent)
+        """Release a talent from the roster, ending their contract early."""
+        for contract in self.payroll.contracts_for(talent):
+            self.payroll.release(contract)
+        if talent in self.actor_pool:
+            self.actor_pool.remove(talent)
+        if talent in self.staff_pool:
+            self.staff_pool.remove(talent)
 
     def list_signed_talent(self, role):
         """Return a list of currently signed talent of a given role."""
-        return find_active_contracts(self.contracts, role)
+        return self.payroll.roster(role)
 
     def renew_contracts(self):
-        """Reduce remaining time on contracts, expire if needed."""
-        for role in ["actors", "writers", "directors", "staff"]:
-            new_list = []
-            for contract in self.contracts.get(role, []):
-                contract["remaining"] -= 1
-                if contract["remaining"] > 0:
-                    new_list.append(contract)
-                else:
-                    print(f"📄 Contract expired: {contract['person']['name']} ({role[:-1]})")
-            self.contracts[role] = new_list
+        """Advance contracts a month and expire the ones that run out."""
+        # Contracts keep their expiry month, so only the ones expiring now are touched
+        for contract in self.payroll.expire():
+            contract.pop("task", None)  # an unfinished task leaves with the contract
+            emit("contracts", f"📄 Contract expired: {contract['person']['name']} ({contract['type'][:-1]})")
 
     # ---- Script & Movie Evaluation ----
     def evaluate_script(self, script):
@@ -139,19 +148,27 @@ class Studio:
         scored = [(self.evaluate_script(s), s) for s in script_pool]
         scored.sort(reverse=True, key=lambda x: x[0])
         best_score, best_script = scored[0]
-        print(f"📝 {best_script['title']} selected for optioning (Score: {best_score})")
+        emit("scripts", f"📝 {best_script['title']} selected for optioning (Score: {best_score})")
         return best_script
 
     # ---- Movie Production ----
-    def produce_movie(self, script, actors, director, calendar, staff=None, months_ahead=1):
+    def production_cost(self, script, actors, director):
+        budget_class = script.get("budget_class", "Mid")
+        budget_multiplier = {"Low": 10, "Mid": 30, "High": 60}
+        actor_cost = sum(a.get("salary", 0) for a in actors)
+        director_cost = director.get("salary", 0)
+        return budget_multiplier.get(budget_class, 30) + actor_cost + director_cost
+
+    def produce_movie(self, script, actors, director, calendar, staff=None, months_ahead=1, funding=None):
         """
         Schedule a new movie for production.
         - actors: list of actor dicts
         - director: single director dict
         - staff: list of staff dicts (optional)
+        - funding: an accepted offer from funding.generate_funding_offers (optional)
         """
         if script.get("status") != "approved":
-            print(f"❌ Script '{script['title']}' must be approved before production.")
+            emit("production", f"❌ Script '{script['title']}' must be approved before production.", "warning")
             return None
 
         final_quality = script.get('quality', 50)
@@ -171,27 +188,15 @@ class Studio:
 
         # Production cost
         budget_class = script.get("budget_class", "Mid")
-        budget_multiplier = {"Low": 10, "Mid": 30, "High": 60}
-        actor_cost = sum(a.get("salary", 0) for a in actors)
-        director_cost = director.get("salary", 0)
-        production_cost = budget_multiplier.get(budget_class, 30) + actor_cost + director_cost
+        production_cost = self.production_cost(script, actors, director)
 
-        if self.balance < production_cost:
-            print(f"❌ Not enough funds to produce {script['title']}! Needed ${production_cost}M, have ${self.balance}M")
+        if self.balance + self.financing.cash_from(funding) < production_cost:
+            emit("production", f"❌ Not enough funds to produce {script['title']}! Needed ${production_cost}M, have ${self.balance}M", "warning")
             return None
 
-        self.balance -= production_cost
-        self.total_expenses += production_cost
-
-        # Schedule release
-        release_month = calendar.month + months_ahead
-        release_year = calendar.year
-        if release_month > 12:
-            release_month -= 12
-            release_year += 1
-        release_date = (release_year, release_month)
-
         movie = {
+            "id": new_id("movie"),
+            "script_id": ensure_id(script, "script"),
             "title": script["title"],
             "genre": script["genre"],
             "budget_class": budget_class,
@@ -201,7 +206,7 @@ class Studio:
             "writer": script.get("writer"),
             "staff": staff or [],        # ⬅️ Always a list
             "cost": production_cost,
-            "release_date": release_date,
+            "release_date": None,
             "box_office": 0.0,
             "monthly_revenue": [],
             "remaining_revenue": 0,
@@ -209,6 +214,30 @@ class Studio:
             "script": script,
         }
 
+        # The shoot waits until a soundstage, the cast and the crew are all free
+        durations = stage_durations(movie)
+        shoot_start = calendar.month_index() + 1 + durations[0][1]
+        delay = self.schedule.first_delay(movie, durations, shoot_start)
+        if delay is None:
+            busy = ", ".join(self.schedule.conflicts(movie, durations, shoot_start))
+            emit("production", f"❌ Can't schedule {script['title']} within {MAX_WAIT} months: {busy} booked.", "warning")
+            return None
+        if delay:
+            busy = ", ".join(self.schedule.conflicts(movie, durations, shoot_start))
+            emit("production", f"⏳ '{movie['title']}' waits {delay} months in pre-production for {busy}.")
+        self.schedule.book(movie, durations, shoot_start + delay)
+
+        # Schedule release: no earlier than the film can be finished
+        ready = self.production.start(movie, calendar, delay, durations)
+        release_index = max(calendar.month_index() + months_ahead, ready)
+        if release_index > calendar.month_index() + months_ahead:
+            emit("production", f"📆 '{movie['title']}' needs {ready - calendar.month_index()} months to make; release pushed back.")
+        movie["release_date"] = calendar.date_of(release_index)
+
+        self.financing.accept(funding, movie, calendar)
+        self.balance -= production_cost
+        self.total_expenses += production_cost
+
         self.scheduled_movies.append(movie)
         return movie
 
@@ -219,40 +248,18 @@ class Studio:
         remaining = []
 
         for movie in self.scheduled_movies:
-            if (calendar.year, calendar.month) == movie["release_date"]:
+            if (calendar.year, calendar.month) == movie["release_date"] and "stage_index" in movie:
+                # Not finished yet: the release slips a month
+                year, month = movie["release_date"] = calendar.date_of(calendar.month_index() + 1)
+                emit("production", f"⏳ '{movie['title']}' isn't finished; release slips to {month}/{year}.", "warning")
+                remaining.append(movie)
+            elif (calendar.year, calendar.month) == movie["release_date"]:
+                movie["status"] = "released"
                 # Setup box office revenue stream
                 self.simulate_box_office(movie, calendar)
 
-                # Update talent film history
-                for actor in movie.get("cast", []):
-                    actor.setdefault("film_history", []).append({
-                        "title": movie["title"],
-                        "year": calendar.year,
-                        "month": calendar.month,
-                        "genre": movie["genre"],
-                        "quality": movie["quality"],
-                        "box_office": 0
-                    })
-
-                if movie.get("director"):
-                    movie["director"].setdefault("film_history", []).append({
-                        "title": movie["title"],
-                        "year": calendar.year,
-                        "month": calendar.month,
-                        "genre": movie["genre"],
-                        "quality": movie["quality"],
-                        "box_office": 0
-                    })
-
-                if movie.get("writer"):
-                    movie["writer"].setdefault("film_history", []).append({
-                        "title": movie["title"],
-                        "year": calendar.year,
-                        "month": calendar.month,
-                        "genre": movie["genre"],
-                        "quality": movie["quality"],
-                        "box_office": 0
-                    })
+                # Credit cast and crew in the shared table
+                self.credits.record_release(movie)
 
                 if self.highest_grossing is None:
                     self.highest_grossing = movie
@@ -260,6 +267,8 @@ class Studio:
                 # Generate news
                 score, review = self.generate_review(movie)
                 self.newsfeed.append(f"{movie['title']} released to {score}/100 reviews — {review}")
+                if "opening_week" in movie:
+                    self.newsfeed.append(f"{movie['title']} opened to ${movie['opening_week']:,.2f}M in its first week")
                 self.newsfeed = self.newsfeed[-10:]
 
                 # Prestige
@@ -267,6 +276,7 @@ class Studio:
                     self.prestige += 1
 
                 snapshot = {
+                    "id": movie["id"],
                     "title": movie["title"],
                     "genre": movie["genre"],
                     "budget_class": movie["budget_class"],
@@ -276,20 +286,36 @@ class Studio:
                     "director": movie.get("director", {}).get("name") if movie.get("director") else None,
                     "actors": [a.get("name") for a in movie.get("cast", [])] if movie.get("cast") else [],
                     "box_office": movie.get("box_office", 0),
+                    "territory_shares": movie.get("territory_shares"),
+                    "audience": movie.get("audience"),
                     "prestige": self.prestige,
                     "year": calendar.year
                 }
 
                 self.movie_history.append(snapshot)
+                self.history_by_id[movie["id"]] = snapshot
                 self.released_movies.append(movie)
                 released.append(movie)
             else:
                 remaining.append(movie)
 
         self.scheduled_movies = remaining
+        PROFILER.count("releases_processed", len(released))
         return released
 
     def simulate_box_office(self, movie, calendar):
+        revenue_curve = self.revenue_curve(movie, calendar.month, calendar.trending_genres)
+        if self.box_office.enabled:
+            revenue_curve = self.box_office.start_run(movie, revenue_curve)
+        movie["monthly_revenue"] = revenue_curve
+        movie["remaining_revenue"] = sum(revenue_curve)
+        movie["territory_shares"] = self.territory_profile(movie, calendar.month, len(revenue_curve))[1]
+        movie["audience"] = segment_shares(genre_id(movie["genre"]), rating_id(movie.get("rating", "PG-13")),
+                                           calendar.month)
+        movie["box_office"] = 0.0
+
+    def revenue_curve(self, movie, month, trending_genres=None, rollout_months=None):
+        """Monthly revenue for a film opening in `month`; rollout is rolled unless given."""
         quality = movie.get("quality", 50)
         buzz = movie.get("buzz", 0)
 
@@ -304,81 +330,122 @@ class Studio:
         fame_director = movie["director"].get("fame", 0)
         talent_boost = 1.0 + ((fame_actor + fame_director) / 300.0)
 
-        dist_multiplier, dist_longevity = apply_distribution_effects(movie)
+        strategy = strategy_id(movie.get("release_strategy", "Wide"))
+        dist_longevity = STRATEGY_LONGEVITY[strategy]
 
-        bonus_pct = seasonal_bonus(movie["genre"], calendar.month)
+        gid = genre_id(movie["genre"])
+        bonus_pct = SEASONAL_BONUS[gid][month]
 
-        rating = movie.get("rating", "PG-13")
-        rating_cap = RATINGS.get(rating, {}).get("max_audience", 1.0)
+        # Who can see it and who wants to, this month (audience.DEMAND)
+        audience = DEMAND[month][gid][rating_id(movie.get("rating", "PG-13"))]
 
-        genre_bonus = 1.15 if calendar.trending_genres and movie["genre"] in calendar.trending_genres else 1.0
+        genre_bonus = 1.15 if trending_genres and movie["genre"] in trending_genres else 1.0
 
         marketing_spend = movie.get("marketing_spend", 0)
         marketing_boost = 1.0 + (marketing_spend * 0.04)
 
+        # The strategy's multiplier comes in per territory (see territory_profile)
         total_potential = (
             base * talent_boost * genre_bonus * marketing_boost
-        ) * (1 + bonus_pct) * rating_cap
-
-        total_potential *= dist_multiplier
+        ) * (1 + bonus_pct) * audience
 
-        rollout_months = max(2, round(random.randint(3, 5) * (1 + dist_longevity)))
+        if rollout_months is None:
+            rollout_months = random.randint(3, 5)
+        rollout_months = min(MAX_ROLLOUT, max(2, round(rollout_months * (1 + dist_longevity))))
 
         if rollout_months > 0:
             monthly_base = round(total_potential / rollout_months / 2.0, 2)
         else:
             monthly_base = 0
 
-        revenue_curve = []
-        for i in range(rollout_months):
-            if movie.get("release_strategy") == "Wide":
-                factor = 1.5 if i == 0 else (1.0 - (i * 0.15))
-            elif movie.get("release_strategy") == "Limited":
-                factor = 0.5 + (i * 0.2)
-            elif movie.get("release_strategy") == "Streaming":
-                factor = 1.0
-            elif movie.get("release_strategy") == "International":
-                factor = 1.2 - (i * 0.05)
-            else:
-                factor = 1.0
-
-            factor = max(0.3, factor)
-            revenue_curve.append(round(monthly_base * factor, 2))
+        # A movie with no strategy set earns like Wide but runs a flat curve
+        curve = STRATEGY_CURVES[strategy_id(movie.get("release_strategy"))]
+        multipliers, _ = self.territory_profile(movie, month, rollout_months)
+        return [round(monthly_base * factor * m, 2) for factor, m in zip(curve, multipliers)]
 
-        movie["monthly_revenue"] = revenue_curve
-        movie["remaining_revenue"] = sum(revenue_curve)
-        movie["box_office"] = 0.0
+    def territory_profile(self, movie, month, rollout_months):
+        """(world multiplier per month of the run, territory shares) for a film opening in `month`."""
+        return run_profile(strategy_id(movie.get("release_strategy", "Wide")),
+                           strategy_id(movie.get("release_strategy")),
+                           genre_id(movie["genre"]), rating_id(movie.get("rating", "PG-13")),
+                           month, rollout_months)
 
-    def update_revenue(self):
+    def update_revenue(self, calendar=None):
+        """
+        Collect this month's box office. With a calendar, tick-resolved runs also feel
+        competition, the back catalog pays out and finished runs open their ancillary windows.
+        """
+        weights = span = None
+        now = None
+        if calendar is not None:
+            now = calendar.month_index()
+            if self.box_office.enabled:
+                weights = self.box_office.vectors(calendar)
+                span = self.box_office.advance(calendar)  # the rest of the month, from the calendar's week/day
+            catalog = round(sum(self.ancillary.collect(now).values()), 2)
+            self.balance += catalog
+            self.total_earnings += catalog
+        by_split = {}  # territory shares -> this month's take of the films with them
         for movie in self.released_movies:
             if movie.get("monthly_revenue"):
                 this_month_earning = movie["monthly_revenue"].pop(0)
+                if "tick_revenue" in movie:
+                    # Weekly/daily run: the month's ticks, summed after competition
+                    this_month_earning = round(self.box_office.month_take(movie, weights, span), 2)
                 self.balance += this_month_earning
                 self.total_earnings += this_month_earning
+                split = movie.get("territory_shares") or DOMESTIC_ONLY
+                by_split[split] = by_split.get(split, 0.0) + this_month_earning
+
+                # Investors take their cut as the money comes in
+                payout = self.financing.distribute(movie, this_month_earning)
+                if payout:
+                    self.balance -= payout
+                    self.total_expenses += payout
 
                 movie["box_office"] = movie.get("box_office", 0.0) + this_month_earning
+                if movie["monthly_revenue"]:
+                    self.credits.refresh(movie)
+                else:
+                    self.credits.settle(movie)
+                    if now is not None:
+                        self.ancillary.open(movie, now)
 
                 # Keep movie_history in sync
-                for m in self.movie_history:
-                    if m["title"] == movie["title"] and m["release_date"] == movie["release_date"]:
-                        m["box_office"] = movie["box_office"]
+                snapshot = self.history_by_id.get(movie["id"])
+                if snapshot is not None:
+                    snapshot["box_office"] = movie["box_office"]
 
                 if self.highest_grossing and movie["box_office"] > self.highest_grossing.get("box_office", 0):
                     self.highest_grossing = movie
 
+        # Films share a handful of territory splits, so the rollup is per split, not per film
+        take = [0.0] * len(TERRITORY_NAMES)
+        for split, amount in by_split.items():
+            for t, share in enumerate(split):
+                take[t] += amount * share
+        self.territory_take = dict(zip(TERRITORY_NAMES, take))
+        for name, amount in self.territory_take.items():
+            self.territory_gross[name] += amount
+
     # ---- Utilities ----
     def is_bankrupt(self):
         return self.balance < 0
 
-    def expenses(self):
+    def operating_costs(self):
+        """This month's overhead breakdown, without charging it."""
         base = 15.0
         staff_cost = len(self.staff_pool) * 0.5
         in_production = len(self.scheduled_movies) * 1.0
         prestige_cost = self.prestige * 0.1
         total = round(base + staff_cost + in_production + prestige_cost, 2)
-        self.total_expenses += total
         return {"base": base, "staff": staff_cost, "in_production": in_production, "prestige": prestige_cost, "total": total}
 
+    def expenses(self):
+        costs = self.operating_costs()
+        self.total_expenses += costs["total"]
+        return costs
+
     def generate_review(self, movie):
         quality = movie["quality"]
         score = round(min(100, max(10, quality + random.randint(-10, 10))))
@@ -408,62 +475,22 @@ class Studio:
         return winners
 
     # ---- Post-Production ----
-    def apply_post_production(self, movie, year, month):
+    def apply_post_production(self, movie):
         """
-        Finalize post-production for a movie and update film histories.
-        Adds film history entries for actors, writer, director, and staff.
+        Finalize post-production for a movie and credit everyone who worked on it.
+        Credits for actors, writer, director, and staff go to the shared table.
         """
         log = []
 
-        # === Actors ===
-        for actor in movie.get("cast", []):
-            actor["film_history"].append({
-                "title": movie["title"],
-                "year": year,
-                "month": month,
-                "role": "Actor",
-                "genre": movie.get("genre"),
-                "quality": movie.get("quality"),
-                "box_office": movie.get("box_office", 0)
-            })
-
-        # === Writer ===
-        if movie.get("writer"):
-            writer = movie["writer"]
-            writer["film_history"].append({
-                "title": movie["title"],
-                "year": year,
-                "month": month,
-                "role": "Writer",
-                "genre": movie.get("genre"),
-                "quality": movie.get("quality"),
-                "box_office": movie.get("box_office", 0)
-            })
-
-        # === Director ===
-        if movie.get("director"):
-            director = movie["director"]
-            director["film_history"].append({
-                "title": movie["title"],
-                "year": year,
-                "month": month,
-                "role": "Director",
-                "genre": movie.get("genre"),
-                "quality": movie.get("quality"),
-                "box_office": movie.get("box_office", 0)
-            })
-
-        # === Staff ===
-        for staff in movie.get("staff", []):
-            staff["film_history"].append({
-                "title": movie["title"],
-                "year": year,
-                "month": month,
-                "role": staff.get("role", "Staff"),
-                "genre": movie.get("genre"),
-                "quality": movie.get("quality"),
-                "box_office": movie.get("box_office", 0)
-            })
+        self.credits.record_release(movie)
+
+        # Staff may be stored as a list or as a {role: person} mapping from the draft
+        staff_members = movie.get("staff") or []
+        if isinstance(staff_members, dict):
+            staff_members = list(staff_members.values())
+
+        for staff in staff_members:
+            self.credits.add_credit(movie, staff, staff.get("role", "Staff"))
 
             role = staff.get("role")
             exp = staff.get("experience", 1)
@@ -484,6 +511,7 @@ class Studio:
 
         movie.setdefault("quality", 0)
         movie.setdefault("buzz", 0)
+        self.credits.refresh(movie)
 
         return log
 
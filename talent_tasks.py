@@ -6,9 +6,18 @@ Talent Task System
 This module manages tasks that can be assigned to talent (actors, writers,
 directors, staff). Tasks consume time and give benefits or risks.
 They integrate with the monthly turn loop and contracts system.
+
+TASKS is compiled once into opcode tables, risks included: burnout and
+injury add stress (an injury also keeps the person from starting another
+task for a while), and every point of stress makes burnout likelier
+until a Vacation clears it. A scandal costs fame, prestige_loss costs the
+studio prestige and a failure voids the task's effects. Active tasks sit in buckets
+keyed by the month they finish, so a monthly tick only touches the tasks
+that are actually due and applies studio-wide effects in one batch.
 """
 
 import random
+from messages import emit
 
 # === TASK DEFINITIONS ===
 # These can later be expanded or pulled from game_data.py
@@ -108,119 +117,254 @@ TASKS = {
 }
 
 
-# === TASK ASSIGNMENT & RESOLUTION ===
+# === TASK COMPILATION ===
+# Effect names map to opcodes; an unknown name in TASKS fails at import
+# instead of being skipped at runtime.
+EFFECT_OPS = (
+    "fame", "cash", "prestige", "buzz", "quality_boost", "script_quality",
+    "theme_unlock", "script_concept", "experience", "synergy", "stress_relief",
+)
+OPCODES = {name: code for code, name in enumerate(EFFECT_OPS)}
+STUDIO_TOTALS = ("cash", "prestige", "synergy")  # summed and applied once per tick
 
-def assign_task(contract, task_name):
-    """
-    Assigns a task to a contracted person.
-    Stores active task on the contract itself.
-    """
-    role = contract["type"]
-    person = contract["person"]
+# Risks compile the same way; the value in TASKS is the chance it fires.
+RISK_OPS = ("burnout", "injury", "scandal", "prestige_loss", "failure")
+RISK_OPCODES = {name: code for code, name in enumerate(RISK_OPS)}
+FAILURE = RISK_OPCODES["failure"]  # a failed task yields none of its effects
+BURNOUT = RISK_OPCODES["burnout"]
+BURNOUT_PER_STRESS = 0.05          # burnout chance added by each point of stress
+INJURY_MONTHS = 2                  # months an injured person can't start a new task
+SCANDAL_FAME = 2
 
-    available = [t for t in TASKS.get(role, []) if t["name"] == task_name]
-    if not available:
-        raise ValueError(f"No such task '{task_name}' for role {role}")
 
-    task = available[0].copy()
-    contract["task"] = {
-        "name": task["name"],
-        "remaining": task["duration"],
-        "effect": task["effect"],
-        "risk": task.get("risk", {}),
-        "desc": task["desc"],
-    }
+class CompiledTask:
+    __slots__ = ("role", "name", "duration", "effects", "risks", "penalties", "desc")
 
-    print(f"📝 Assigned {person['name']} ({role[:-1]}) to task: {task['name']}")
+    def __init__(self, role, task):
+        self.role = role
+        self.name = task["name"]
+        self.duration = max(1, int(task.get("duration", 1)))
+        self.desc = task.get("desc", "")
+        self.effects = tuple(_compile_op(key, value, self.name) for key, value in task.get("effect", {}).items())
+        # Risk entries are either a chance (injury: 0.1) or, when the key is an
+        # effect, a penalty applied if any risk fires (cash: -2 = overrun).
+        risks, penalties = [], []
+        for key, value in task.get("risk", {}).items():
+            if key in OPCODES:
+                penalties.append(_compile_op(key, value, self.name))
+            elif key in RISK_OPCODES:
+                risks.append((RISK_OPCODES[key], float(value)))
+            else:
+                raise ValueError(f"Task '{self.name}' has unknown risk '{key}'")
+        self.risks = tuple(risks)
+        self.penalties = tuple(penalties)
 
 
-def progress_tasks(contracts_by_type, studio):
-    """
-    Progresses all active tasks by one month.
-    Applies effects when tasks are completed.
-    """
-    completed = []
+def _compile_op(key, value, task_name):
+    if key not in OPCODES:
+        raise ValueError(f"Task '{task_name}' has unknown effect '{key}'")
+    return OPCODES[key], value
+
+
+def compile_tasks(tasks):
+    """Return {(role, task name): CompiledTask} for a TASKS-style table."""
+    return {(role, t["name"]): CompiledTask(role, t) for role, entries in tasks.items() for t in entries}
+
+
+COMPILED_TASKS = compile_tasks(TASKS)
+
+
+# === EFFECT HANDLERS ===
+# Each takes (person, contract, studio, value, task_name, totals) and returns
+# a log line. Studio-wide numbers go into `totals` and are applied in batch.
+
+def _fame(person, contract, studio, value, task_name, totals):
+    person["fame"] = person.get("fame", 0) + value
+    return f"{person['name']} gained {value} Fame"
+
+
+def _cash(person, contract, studio, value, task_name, totals):
+    totals["cash"] += value
+    if value < 0:
+        return f"Studio lost ${-value}M to overruns"
+    return f"Studio earned ${value}M from endorsements"
+
+
+def _prestige(person, contract, studio, value, task_name, totals):
+    totals["prestige"] += value
+    return f"Studio Prestige {value:+}"
+
+
+def _buzz(person, contract, studio, value, task_name, totals):
+    studio.newsfeed.append(f"{person['name']} generated {value} buzz with {task_name}")
+    return f"Buzz +{value}"
+
+
+def _quality_boost(person, contract, studio, value, task_name, totals):
+    # Store a temporary boost on the contract (applies to next production)
+    contract["quality_boost"] = contract.get("quality_boost", 0) + value
+    return f"{person['name']} gained a +{value:.1f} Quality Boost for future roles"
+
+
+def _script_quality(person, contract, studio, value, task_name, totals):
+    # Writers improve next script they work on
+    contract["script_bonus"] = contract.get("script_bonus", 0) + value
+    return f"{person['name']} will improve next script by +{value} Quality"
+
+
+def _theme_unlock(person, contract, studio, value, task_name, totals):
+    studio.unlocked_themes = getattr(studio, "unlocked_themes", set())
+    studio.unlocked_themes.add("new_theme")  # placeholder; could be randomized
+    return f"{person['name']} unlocked a new theme for scripts"
+
+
+def _script_concept(person, contract, studio, value, task_name, totals):
+    # Director creates a pitch for a new script
+    studio.concept_pool = getattr(studio, "concept_pool", [])
+    studio.concept_pool.append({"origin": person["name"], "concept": "Director Pitch"})
+    return f"{person['name']} developed a new script concept"
+
+
+def _experience(person, contract, studio, value, task_name, totals):
+    person["experience"] = person.get("experience", 0) + value
+    return f"{person['name']} gained {value} Experience"
+
+
+def _synergy(person, contract, studio, value, task_name, totals):
+    totals["synergy"] += value
+    return f"Studio Team Synergy increased by {value}"
+
 
-    for role, contracts in contracts_by_type.items():
-        for contract in contracts:
-            task = contract.get("task")
-            if not task:
+def _stress_relief(person, contract, studio, value, task_name, totals):
+    person["stress"] = 0
+    return f"{person['name']} came back rested; stress cleared"
+
+
+EFFECT_HANDLERS = (
+    _fame, _cash, _prestige, _buzz, _quality_boost, _script_quality,
+    _theme_unlock, _script_concept, _experience, _synergy, _stress_relief,
+)
+
+
+# === RISK HANDLERS ===
+# Each takes (person, contract, studio, task_name, totals) once the engine has
+# rolled the chance, and returns a log line like the effects.
+
+def _burnout(person, contract, studio, task_name, totals):
+    person["stress"] = person.get("stress", 0) + 1
+    return f"⚠️ {person['name']} burned out on {task_name}; stress now {person['stress']}"
+
+
+def _injury(person, contract, studio, task_name, totals):
+    person["stress"] = person.get("stress", 0) + 1
+    contract["injured_until"] = studio.task_engine.month + INJURY_MONTHS
+    return f"⚠️ {person['name']} was injured during {task_name} and is out for {INJURY_MONTHS} months"
+
+
+def _scandal(person, contract, studio, task_name, totals):
+    person["fame"] = max(0, person.get("fame", 0) - SCANDAL_FAME)
+    return f"⚠️ Scandal! {person['name']} lost {SCANDAL_FAME} Fame after {task_name}"
+
+
+def _prestige_loss(person, contract, studio, task_name, totals):
+    totals["prestige"] -= 1
+    return f"⚠️ {task_name} cheapened the studio's image: Prestige -1"
+
+
+def _failure(person, contract, studio, task_name, totals):
+    return f"⚠️ {task_name} failed; {person['name']} has nothing to show for it"
+
+
+RISK_HANDLERS = (_burnout, _injury, _scandal, _prestige_loss, _failure)
+
+
+# === TASK ENGINE ===
+
+class TaskEngine:
+    """Active tasks for one studio, bucketed by the month they complete."""
+
+    def __init__(self):
+        self.month = 0     # number of monthly ticks so far
+        self.due = {}      # month -> [(contract, task)]
+
+    def assign(self, contract, task_name):
+        role = contract["type"]
+        compiled = COMPILED_TASKS.get((role, task_name))
+        if compiled is None:
+            raise ValueError(f"No such task '{task_name}' for role {role}")
+
+        # An injured person starts once they've recovered
+        due = max(self.month, contract.get("injured_until", 0)) + compiled.duration
+        task = {"name": compiled.name, "desc": compiled.desc, "due": due, "compiled": compiled}
+        contract["task"] = task
+        self.due.setdefault(due, []).append((contract, task))
+        return task
+
+    def remaining(self, task):
+        """Months left on an assigned task."""
+        return max(0, task["due"] - self.month)
+
+    def injured(self, contract):
+        """Months until an injured person can start work again (0 if fit)."""
+        return max(0, contract.get("injured_until", 0) - self.month)
+
+    def progress(self, studio):
+        """Advance one month and resolve every task that is now due."""
+        self.month += 1
+        bucket = self.due.pop(self.month, None)
+        if not bucket:
+            return []
+
+        totals = dict.fromkeys(STUDIO_TOTALS, 0)
+        completed = []
+        for contract, task in bucket:
+            # Tasks dropped with their contract (or replaced) are skipped
+            if contract.get("task") is not task:
                 continue
+            contract.pop("task")
+            completed.append(self._resolve(contract, task["compiled"], studio, totals))
+
+        studio.balance += totals["cash"]
+        studio.prestige += totals["prestige"]
+        if totals["synergy"]:
+            studio.synergy = getattr(studio, "synergy", 0) + totals["synergy"]
+        return completed
+
+    def _resolve(self, contract, compiled, studio, totals):
+        person = contract["person"]
+        stress = person.get("stress", 0)
+        fired = [op for op, chance in compiled.risks
+                 if random.random() < (chance + BURNOUT_PER_STRESS * stress if op == BURNOUT else chance)]
+        effects = []
+        if FAILURE not in fired:
+            effects.extend(EFFECT_HANDLERS[op](person, contract, studio, value, compiled.name, totals)
+                           for op, value in compiled.effects)
+        effects.extend(RISK_HANDLERS[op](person, contract, studio, compiled.name, totals) for op in fired)
+        if fired:
+            effects.extend(EFFECT_HANDLERS[op](person, contract, studio, value, compiled.name, totals)
+                           for op, value in compiled.penalties)
 
-            task["remaining"] -= 1
-            if task["remaining"] <= 0:
-                result = resolve_task(contract, task, studio)
-                completed.append(result)
-                contract.pop("task")  # clear task after completion
+        return {
+            "person": person,
+            "task": compiled.name,
+            "outcome": effects,
+        }
 
-    return completed
 
+# === TASK ASSIGNMENT & RESOLUTION ===
 
-def resolve_task(contract, task, studio):
+def assign_task(engine, contract, task_name):
     """
-    Resolves the outcome of a finished task, applying effects to
-    the person, the studio, or future scripts/movies.
+    Assigns a task to a contracted person.
+    Stores active task on the contract itself.
+    """
+    engine.assign(contract, task_name)
+    emit("tasks", f"📝 Assigned {contract['person']['name']} ({contract['type'][:-1]}) to task: {task_name}")
+
+
+def progress_tasks(studio):
+    """
+    Progresses all active tasks by one month.
+    Applies effects when tasks are completed.
     """
-    person = contract["person"]
-    effects = []
-
-    # Apply guaranteed effects
-    for key, value in task["effect"].items():
-        if key == "fame":
-            person["fame"] = person.get("fame", 0) + value
-            effects.append(f"{person['name']} gained {value} Fame")
-
-        elif key == "cash":
-            studio.balance += value
-            effects.append(f"Studio earned ${value}M from endorsements")
-
-        elif key == "prestige":
-            studio.prestige += value
-            effects.append(f"Studio Prestige +{value}")
-
-        elif key == "buzz":
-            studio.newsfeed.append(f"{person['name']} generated {value} buzz with {task['name']}")
-            effects.append(f"Buzz +{value}")
-
-        elif key == "quality_boost":
-            # Store a temporary boost on the contract (applies to next production)
-            contract["quality_boost"] = contract.get("quality_boost", 0) + value
-            effects.append(f"{person['name']} gained a +{value:.1f} Quality Boost for future roles")
-
-        elif key == "script_quality":
-            # Writers improve next script they work on
-            contract["script_bonus"] = contract.get("script_bonus", 0) + value
-            effects.append(f"{person['name']} will improve next script by +{value} Quality")
-
-        elif key == "theme_unlock":
-            studio.unlocked_themes = getattr(studio, "unlocked_themes", set())
-            studio.unlocked_themes.add("new_theme")  # placeholder; could be randomized
-            effects.append(f"{person['name']} unlocked a new theme for scripts")
-
-        elif key == "script_concept":
-            # Director creates a pitch for a new script
-            studio.concept_pool = getattr(studio, "concept_pool", [])
-            studio.concept_pool.append({"origin": person["name"], "concept": "Director Pitch"})
-            effects.append(f"{person['name']} developed a new script concept")
-
-        elif key == "experience":
-            person["experience"] = person.get("experience", 0) + value
-            effects.append(f"{person['name']} gained {value} Experience")
-
-        elif key == "synergy":
-            studio.synergy = getattr(studio, "synergy", 0) + value
-            effects.append(f"Studio Team Synergy increased by {value}")
-
-        else:
-            effects.append(f"(Unhandled effect: {key} {value})")
-
-    # Check risks
-    for risk_type, chance in task.get("risk", {}).items():
-        if random.random() < chance:
-            effects.append(f"⚠️ Risk triggered: {person['name']} suffered {risk_type}")
-
-    return {
-        "person": person,
-        "task": task["name"],
-        "outcome": effects,
-    }
+    return studio.task_engine.progress(studio)
@@ -0,0 +1,163 @@
+# HollywoodSim/game/territories.py
+
+"""
+Territories
+-----------
+Box office split across world markets. Each territory has a size (its
+share of world box office), an exchange-rate factor for turning local
+takings into dollars, genre affinities, rating restrictions and its own
+seasonal calendar. A release strategy decides how far into each
+territory a film reaches.
+
+A film's run is a territory x month matrix:
+
+    take[t][i] = reach[t] * size[t] * fx[t] * genre[t] * rating[t] * season[t][month i] * curve[i]
+
+The per-territory weights are compiled into dense tables at import, the
+same way econ_tables does for genres and ratings. Summing the matrix over
+territories leaves one multiplier per month of the run, and summing it
+over months leaves each territory's share of the gross. Both depend only
+on (strategy, genre, rating, opening month, run length), so they are
+computed once per combination and cached. Pricing a film costs one table
+lookup on top of the single-market curve.
+
+Overall scale is left to the strategy's multiplier (RELEASE_STRATEGIES):
+averaged over every genre, rating and month, a film earns exactly that
+multiplier, and the territory mix decides which genres, ratings and
+release months beat the average. The scale is one number per strategy,
+so a rating a territory restricts simply loses that territory's money. Territory seasons average 1 over the year and
+the home market has none of its own (the audience model's attendance
+covers it), so they shift money between months without stacking on top
+of the genre's peak-season bonus.
+"""
+
+from functools import lru_cache
+
+from econ_tables import (GENRE_NAMES, RATING_NAMES, STRATEGY_NAMES, STRATEGY_MULTIPLIERS,
+                         STRATEGY_CURVES, MONTHS)
+
+TERRITORIES = {
+    "Domestic": {
+        "size": 0.45, "fx": 1.0,
+        "genres": {},
+        "ratings": {},
+        "seasons": {},  # the home audience's year is audience.SEGMENTS' attendance
+    },
+    "Europe": {
+        "size": 0.22, "fx": 1.05,
+        "genres": {"Drama": 1.2, "Documentary": 1.1, "Animation": 1.15, "Comedy": 0.9, "Western": 0.8},
+        "ratings": {"NC-17": 0.8},
+        "seasons": {7: 0.85, 8: 0.8, 10: 1.1, 12: 1.2},
+    },
+    "China": {
+        "size": 0.15, "fx": 0.85,
+        "genres": {"Action": 1.4, "Sci-Fi": 1.3, "Fantasy": 1.2, "Animation": 1.2, "Adventure": 1.2,
+                   "Drama": 0.6, "Comedy": 0.5, "Romance": 0.8, "Western": 0.3, "Horror": 0.1,
+                   "Documentary": 0.3},
+        # Strict censorship: R is heavily cut, NC-17 doesn't get in
+        "ratings": {"R": 0.3, "NC-17": 0.0},
+        # Spring Festival and Golden Week; summer blackout for imports
+        "seasons": {2: 1.4, 7: 0.6, 8: 0.8, 10: 1.3},
+    },
+    "Japan": {
+        "size": 0.07, "fx": 0.9,
+        "genres": {"Animation": 1.6, "Family": 1.2, "Fantasy": 1.2, "Comedy": 0.6, "Western": 0.4},
+        "ratings": {"R": 0.8, "NC-17": 0.5},
+        "seasons": {4: 1.15, 5: 1.2, 8: 1.2, 12: 1.1},
+    },
+    "Latin America": {
+        "size": 0.06, "fx": 0.75,
+        "genres": {"Horror": 1.3, "Animation": 1.3, "Action": 1.2, "Family": 1.2, "Drama": 0.8,
+                   "Documentary": 0.6},
+        "ratings": {"NC-17": 0.6},
+        "seasons": {1: 1.1, 7: 1.2, 12: 0.8},
+    },
+    "Rest of World": {
+        "size": 0.05, "fx": 0.8,
+        "genres": {"Action": 1.2, "Adventure": 1.1, "Drama": 0.9},
+        "ratings": {"R": 0.7, "NC-17": 0.3},
+        "seasons": {},
+    },
+}
+
+# Release strategy -> how far into each territory a film reaches (0-1); unknown strategies go Wide
+STRATEGY_REACH = {
+    "Wide": {"Domestic": 1.0, "Europe": 0.6, "China": 0.3, "Japan": 0.4, "Latin America": 0.6, "Rest of World": 0.5},
+    "Limited": {"Domestic": 1.0, "Europe": 0.4, "China": 0.0, "Japan": 0.1, "Latin America": 0.1, "Rest of World": 0.1},
+    "Streaming": {"Domestic": 1.0, "Europe": 0.8, "China": 0.0, "Japan": 0.6, "Latin America": 0.8, "Rest of World": 0.7},
+    "International": {"Domestic": 0.8, "Europe": 1.0, "China": 1.0, "Japan": 1.0, "Latin America": 1.0, "Rest of World": 1.0},
+}
+
+TERRITORY_NAMES = tuple(TERRITORIES)
+DOMESTIC_ONLY = (1.0,) + (0.0,) * (len(TERRITORY_NAMES) - 1)
+
+
+def _reach_row(strategy):
+    reach = STRATEGY_REACH.get(strategy, STRATEGY_REACH["Wide"])
+    return tuple(reach.get(t, 0.0) * TERRITORIES[t]["size"] * TERRITORIES[t]["fx"] for t in TERRITORY_NAMES)
+
+
+# Rows have one extra trailing entry for unknown strategies, genres and ratings, as in econ_tables
+_REACH = tuple(_reach_row(s) for s in STRATEGY_NAMES + (None,))
+_GENRE = tuple(tuple(TERRITORIES[t]["genres"].get(g, 1.0) for g in GENRE_NAMES) + (1.0,) for t in TERRITORY_NAMES)
+_RATING = tuple(tuple(TERRITORIES[t]["ratings"].get(r, 1.0) for r in RATING_NAMES) + (1.0,) for t in TERRITORY_NAMES)
+
+
+def _season_row(seasons):
+    row = [seasons.get(m, 1.0) for m in MONTHS]
+    mean = sum(row) / len(row)
+    return (1.0,) + tuple(f / mean for f in row)
+
+
+# TERRITORY_SEASONS[territory index][month] -> seasonal factor (index 0 unused). Rows average 1,
+# so a territory's calendar moves takings around the year without adding to them.
+TERRITORY_SEASONS = tuple(_season_row(TERRITORIES[t]["seasons"]) for t in TERRITORY_NAMES)
+
+
+def territory_weights(sid, gid, rid):
+    """Per-territory weight of a film before the season, in dollars of world box office."""
+    reach = _REACH[sid]
+    return tuple(reach[t] * _GENRE[t][gid] * _RATING[t][rid] for t in range(len(TERRITORY_NAMES)))
+
+
+def _scale(sid):
+    """
+    Make the average film, over every genre, rating and month, earn the strategy's old
+    multiplier. A rating a territory restricts earns less than that; nothing makes it up.
+    """
+    total = 0.0
+    for gid in range(len(GENRE_NAMES)):
+        for rid in range(len(RATING_NAMES)):
+            weights = territory_weights(sid, gid, rid)
+            total += sum(w * sum(season[1:]) for w, season in zip(weights, TERRITORY_SEASONS))
+    mean = total / (len(GENRE_NAMES) * len(RATING_NAMES) * len(MONTHS))
+    return STRATEGY_MULTIPLIERS[sid] / mean if mean else 0.0
+
+
+# SCALE[strategy id] -> factor turning territory weights into the strategy's multiplier
+SCALE = tuple(_scale(sid) for sid in range(len(STRATEGY_NAMES) + 1))
+
+
+@lru_cache(maxsize=None)
+def run_profile(sid, curve_sid, gid, rid, month, months):
+    """
+    (multiplier for each month of the run, each territory's share of the gross)
+    for a film opening in calendar `month`. curve_sid picks the run's shape.
+    """
+    weights = territory_weights(sid, gid, rid)
+    scale = SCALE[sid]
+    shape = STRATEGY_CURVES[curve_sid][:months]
+
+    # take[t][i] without the film's monthly base, which cancels out of both results
+    take = [[w * season[(month - 1 + i) % 12 + 1] * s for i, s in enumerate(shape)]
+            for w, season in zip(weights, TERRITORY_SEASONS)]
+    multipliers = tuple(scale * sum(column) / s if s else 0.0 for column, s in zip(zip(*take), shape))
+    totals = [sum(row) for row in take]
+    gross = sum(totals)
+    shares = tuple(t / gross for t in totals) if gross else DOMESTIC_ONLY
+    return multipliers, shares
+
+
+def territory_split(amount, shares):
+    """{territory: part of amount} for a film's territory shares."""
+    return {name: amount * share for name, share in zip(TERRITORY_NAMES, shares or DOMESTIC_ONLY)}
@@ -0,0 +1,100 @@
+# HollywoodSim/tests/test_ancillary.py
+
+"""AncillaryMarket's running window totals against per-film closed forms and a brute-force sum."""
+
+import random
+
+import pytest
+
+from ancillary import WINDOWS, AncillaryMarket
+
+
+def brute_income(market, month):
+    """{window: amount} every open stream pays in `month`, summed stream by stream."""
+    paid = dict.fromkeys(WINDOWS, 0.0)
+    for streams in market.streams.values():
+        for window, start, amount in streams:
+            spec = WINDOWS[window]
+            if start <= month < start + spec["months"]:
+                paid[window] += amount * spec["decay"] ** (month - start)
+    return paid
+
+
+def _catalog(rng, market, month, n):
+    films = []
+    for i in range(n):
+        movie = {
+            "id": f"movie_{month}_{i}",
+            "box_office": rng.uniform(1.0, 200.0),
+            "release_strategy": rng.choice(["Wide", "Limited", "Streaming", "International"]),
+        }
+        market.open(movie, month + rng.randrange(0, 3))
+        films.append(movie)
+    return films
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_collect_matches_film_earnings(seed):
+    rng = random.Random(seed)
+    market = AncillaryMarket()
+    films = []
+    month = 0
+    while month < 200:
+        if month < 80:
+            films += _catalog(rng, market, month, rng.randrange(0, 4))
+        step = rng.randrange(1, 4)  # collect sometimes skips months
+        expected = dict.fromkeys(WINDOWS, 0.0)
+        for m in range(month + 1, month + step + 1):
+            for window, amount in brute_income(market, m).items():
+                expected[window] += amount
+        month += step
+        paid = market.collect(month)
+        assert paid == pytest.approx(expected, abs=1e-6)
+
+        by_film = dict.fromkeys(WINDOWS, 0.0)
+        for movie in films:
+            for window, amount in market.film_earnings(movie, month).items():
+                by_film[window] += amount
+        assert market.earned == pytest.approx(by_film, rel=1e-9, abs=1e-6)
+        assert market.monthly_income() == pytest.approx(sum(brute_income(market, month).values()), abs=1e-6)
+
+
+def test_projection_matches_later_collection():
+    rng = random.Random(7)
+    market = AncillaryMarket()
+    for month in range(0, 30, 3):
+        _catalog(rng, market, month, 3)
+        market.collect(month)
+    market.collect(30)
+
+    projected = market.projection(30, 48)
+    collected = [sum(market.collect(m).values()) for m in range(31, 79)]
+    assert projected == pytest.approx(collected, abs=1e-6)
+
+
+def test_projection_from_a_stale_collection():
+    rng = random.Random(3)
+    market = AncillaryMarket()
+    _catalog(rng, market, 0, 5)
+    market.collect(2)
+
+    # Months 3-5 are not collected yet; the projection steps over them
+    projected = market.projection(5, 24)
+    market.collect(5)
+    assert projected == pytest.approx([sum(market.collect(m).values()) for m in range(6, 30)], abs=1e-6)
+
+
+def test_collecting_a_month_twice_pays_once():
+    market = AncillaryMarket()
+    market.open({"id": "m", "box_office": 100.0}, 0)
+    first = market.collect(3)
+    assert sum(first.values()) > 0
+    assert sum(market.collect(3).values()) == 0.0
+
+
+def test_streaming_releases_skip_home_video():
+    market = AncillaryMarket()
+    streams = market.open({"id": "m", "box_office": 50.0, "release_strategy": "Streaming"}, 10)
+    windows = {window: (start, amount) for window, start, amount in streams}
+    assert "home_video" not in windows
+    assert windows["streaming"] == (11, pytest.approx(50.0 * WINDOWS["streaming"]["rate"] * 1.5))
@@ -0,0 +1,40 @@
+# HollywoodSim/tests/test_box_office_ticks.py
+
+"""Tick box office driven by the calendar's week/day."""
+
+import pytest
+
+from box_office_ticks import RESOLUTIONS, TickBoxOffice
+from calendar_1 import GameCalendar
+
+
+@pytest.mark.parametrize("resolution", ["monthly", "weekly", "daily"])
+def test_calendar_ticks_cover_the_month_once(resolution):
+    n = RESOLUTIONS[resolution]
+    calendar = GameCalendar(market_seed=1)
+    crossed = []
+    for _ in range(n + 2):
+        first, end = calendar.advance_ticks(1, n)
+        crossed.extend(range(first, end))
+    assert crossed == list(range(n))
+    assert calendar.tick_of(n) == n and calendar.week == 4
+
+    calendar.advance()
+    assert (calendar.week, calendar.day) == (1, 1) and calendar.tick_of(n) == 0
+
+
+@pytest.mark.parametrize("resolution", ["weekly", "daily"])
+def test_a_partly_played_month_pays_the_rest(resolution):
+    box_office = TickBoxOffice(resolution)
+    whole = {"title": "A", "genre": "Drama", "release_strategy": "Wide"}
+    split = dict(whole)
+    box_office.start_run(whole, [10.0, 5.0])
+    box_office.start_run(split, [10.0, 5.0])
+
+    calendar = GameCalendar(market_seed=1)
+    taken = box_office.month_take(split, span=calendar.advance_ticks(1, box_office.ticks))
+    assert calendar.week == (2 if resolution == "weekly" else 1)
+    assert len(split["tick_revenue"]) == 2  # the month is not used up yet
+    taken += box_office.month_take(split, span=box_office.advance(calendar))
+    assert taken == pytest.approx(box_office.month_take(whole))
+    assert len(split["tick_revenue"]) == len(whole["tick_revenue"]) == 1
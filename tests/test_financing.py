@@ -0,0 +1,95 @@
+# HollywoodSim/tests/test_financing.py
+
+"""Loan amortization and the investor waterfall."""
+
+import pytest
+
+from financing import FinanceBook, amortization_schedule
+from studio import Studio
+
+
+@pytest.mark.parametrize("principal, rate, term, grace", [
+    (10.0, 0.06, 24, 0),
+    (50.0, 0.12, 12, 5),
+    (7.5, 0.0, 10, 3),
+    (1.0, 0.3, 1, 0),
+])
+def test_amortization_repays_principal(principal, rate, term, grace):
+    rows = amortization_schedule(principal, rate, term, grace)
+    assert len(rows) == grace + term
+    assert sum(repaid for _, repaid, _ in rows) == pytest.approx(principal)
+    assert rows[-1][2] == pytest.approx(0.0, abs=1e-9)
+
+    balance = principal
+    for k, (interest, repaid, after) in enumerate(rows):
+        assert interest == pytest.approx(balance * rate / 12)
+        if k < grace:
+            assert repaid == 0.0
+        assert after == pytest.approx(balance - repaid)
+        balance = after
+
+
+def test_amortization_payments_are_level():
+    rows = amortization_schedule(24.0, 0.08, 24, grace_months=2)
+    payments = [interest + repaid for interest, repaid, _ in rows[2:]]
+    assert max(payments) == pytest.approx(min(payments))
+    assert rows[0] == rows[1] == (24.0 * 0.08 / 12, 0.0, 24.0)
+
+
+def _film(cost=20.0):
+    return {"id": "movie_test", "title": "Test Picture", "cost": cost}
+
+
+def test_investors_recoup_then_share_profit():
+    book = FinanceBook(Studio())
+    movie = _film(cost=20.0)
+    book.add_investor(movie, 10.0, 50)
+
+    # Until the film's cost is back, investors recoup pro rata to their stake in it
+    assert book.distribute(movie, 10.0) == pytest.approx(5.0)
+    assert book.distribute(movie, 10.0) == pytest.approx(5.0)
+    # Then they take their profit share of every dollar
+    assert book.distribute(movie, 10.0) == pytest.approx(5.0)
+    stake = book.stakes[movie["id"]]["stakes"][0]
+    assert stake["recouped"] == pytest.approx(10.0)
+    assert stake["paid"] == pytest.approx(15.0)
+    assert book.shares_paid == pytest.approx(15.0)
+
+
+def test_recoupment_is_capped_at_the_stake():
+    book = FinanceBook(Studio())
+    movie = _film(cost=20.0)
+    book.add_investor(movie, 4.0, 10, investor="A")
+    book.add_investor(movie, 6.0, 0, investor="B")
+    book.distribute(movie, 100.0)  # recoups the whole cost and runs into profit in one month
+    a, b = book.stakes[movie["id"]]["stakes"]
+    assert a["recouped"] <= 4.0 and b["recouped"] <= 6.0
+    assert a["paid"] == pytest.approx(a["recouped"] + 0.1 * 80.0)
+    assert b["paid"] == pytest.approx(b["recouped"])
+
+
+def test_studio_share_matches_monthly_distribution():
+    book = FinanceBook(Studio())
+    movie = _film(cost=30.0)
+    book.add_investor(movie, 12.0, 25, investor="A")
+    book.add_investor(movie, 8.0, 15, investor="B")
+    book.distribute(movie, 6.0)
+
+    months = [9.0, 0.0, 14.0, 3.5, 20.0, 1.0]
+    projected = book.studio_share(movie, months)
+    kept = [revenue - book.distribute(movie, revenue) for revenue in months]
+    assert projected == pytest.approx(kept)
+
+
+def test_profit_shares_cannot_exceed_the_film():
+    book = FinanceBook(Studio())
+    movie = _film()
+    book.add_investor(movie, 5.0, 60)
+    with pytest.raises(ValueError):
+        book.add_investor(movie, 5.0, 50)
+
+
+def test_films_without_investors_keep_everything():
+    book = FinanceBook(Studio())
+    assert book.distribute(_film(), 10.0) == 0.0
+    assert book.studio_share(_film(), [1.0, 2.0]) == [1.0, 2.0]
@@ -0,0 +1,37 @@
+# HollywoodSim/tests/test_market_retention.py
+
+"""Per-game market archives and their rotation."""
+
+import os
+
+from market_retention import archive_path, new_game_archive
+
+
+def _write(archive):
+    archive.add("actors", {"id": 1, "name": "A", "fame": 5}, 3, "expired")
+    archive.flush()
+
+
+def test_each_game_reads_only_its_own_archive(tmp_path):
+    first = new_game_archive(save_dir=str(tmp_path))
+    second = new_game_archive(save_dir=str(tmp_path))
+    assert first.path != second.path
+    _write(first)
+    assert [r["name"] for r in first.records()] == ["A"]
+    assert list(second.records()) == []
+
+
+def test_new_games_rotate_out_old_archives(tmp_path):
+    paths = []
+    for k in range(6):
+        archive = new_game_archive(keep=3, save_dir=str(tmp_path))
+        _write(archive)
+        os.utime(archive.path, (k, k))  # mtimes in launch order
+        paths.append(archive.path)
+    left = sorted(os.listdir(tmp_path))
+    assert left == sorted(os.path.basename(p) for p in paths[-3:])
+
+
+def test_archive_path_is_not_cwd_relative(tmp_path):
+    assert os.path.isabs(archive_path("x"))
+    assert archive_path("x", save_dir=str(tmp_path)) == os.path.join(str(tmp_path), "market_archive_x.jsonl")
@@ -0,0 +1,96 @@
+# HollywoodSim/tests/test_payroll.py
+
+"""PayrollLedger totals and expiry ordering against a recount of the contracts."""
+
+import random
+
+import pytest
+
+from contracts import create_contract
+from payroll import ROLES, PayrollLedger
+
+
+def _ledger():
+    return PayrollLedger({role: [] for role in ROLES})
+
+
+def _signed(ledger):
+    return [c for contracts in ledger.contracts.values() for c in contracts]
+
+
+def _check(ledger):
+    signed = _signed(ledger)
+    assert ledger.payroll() == pytest.approx(sum(c["salary"] for c in signed))
+    for role in ROLES:
+        assert ledger.payroll(role) == pytest.approx(sum(c["salary"] for c in ledger.contracts[role]))
+        roster = ledger.roster(role)
+        assert sorted(map(id, roster)) == sorted(map(id, ledger.contracts[role]))
+        left = [ledger.remaining(c) for c in roster]
+        assert left == sorted(left)
+    for months in (0, 1, 3, 12):
+        soon = ledger.expiring_within(months)
+        assert sorted(map(id, soon)) == sorted(id(c) for c in signed if ledger.remaining(c) <= months)
+        left = [ledger.remaining(c) for c in soon]
+        assert left == sorted(left)
+    schedule = ledger.salary_schedule(30)
+    for k, paid in enumerate(schedule):
+        assert paid == pytest.approx(sum(c["salary"] for c in signed if ledger.remaining(c) > k), abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_totals_and_order_follow_sign_release_expire(seed):
+    rng = random.Random(seed)
+    ledger = _ledger()
+    people = [{"id": f"person_{i}", "name": f"Person {i}"} for i in range(40)]
+
+    for month in range(60):
+        for _ in range(rng.randrange(4)):
+            contract = create_contract(rng.choice(people), rng.choice(ROLES), rng.randrange(1, 25),
+                                       round(rng.uniform(0.1, 3.0), 2))
+            ledger.sign(contract)
+        if rng.random() < 0.3 and _signed(ledger):
+            ledger.release(rng.choice(_signed(ledger)))
+        _check(ledger)
+
+        before = {id(c): ledger.remaining(c) for c in _signed(ledger)}
+        expired = ledger.expire()
+        assert all(before[id(c)] == 1 for c in expired)
+        assert all(ledger.remaining(c) >= 1 for c in _signed(ledger))
+        assert len(expired) + len(_signed(ledger)) == len(before)
+    _check(ledger)
+
+
+def test_expiry_is_an_absolute_month():
+    ledger = _ledger()
+    contract = create_contract({"id": "p", "name": "P"}, "actors", 3, 2.0)
+    ledger.sign(contract)
+    assert contract["expires"] == 3 and "remaining" not in contract
+    assert ledger.expire() == [] and ledger.remaining(contract) == 2
+    ledger.expire()
+    assert ledger.expire() == [contract]
+    assert ledger.payroll() == 0.0 and ledger.contracts["actors"] == []
+
+
+def test_a_person_can_hold_several_contracts():
+    ledger = _ledger()
+    person = {"id": "p", "name": "P"}
+    first = create_contract(person, "actors", 6, 1.0)
+    second = create_contract(person, "directors", 12, 2.0)
+    ledger.sign(first)
+    ledger.sign(second)
+    assert ledger.contracts_for(person) == [first, second]
+    assert ledger.contract_for(person) is second
+
+    ledger.release(second)
+    assert ledger.contracts_for(person) == [first]
+    assert ledger.payroll() == pytest.approx(1.0)
+    ledger.release(first)
+    assert ledger.contract_for(person) is None
+
+
+def test_signing_twice_is_an_error():
+    ledger = _ledger()
+    contract = create_contract({"id": "p", "name": "P"}, "staff", 6, 1.0)
+    ledger.sign(contract)
+    with pytest.raises(ValueError):
+        ledger.sign(contract)
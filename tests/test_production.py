@@ -0,0 +1,104 @@
+# HollywoodSim/tests/test_production.py
+
+"""ProductionPipeline.advance, month by month and across skipped months."""
+
+import random
+
+import pytest
+
+from production import STAGES, ProductionPipeline
+
+
+class Clock:
+    """Just the part of GameCalendar the pipeline reads."""
+
+    def __init__(self, index=0):
+        self.index = index
+
+    def month_index(self):
+        return self.index
+
+
+def expected_status(movie, month):
+    """The stage a film's timeline puts it in during `month`."""
+    for stage, first, last in movie["timeline"]:
+        if last is None or month <= last:
+            return stage
+    raise AssertionError("timeline has no release_ready entry")
+
+
+def _films(rng, pipeline, clock, n=12):
+    films = []
+    for i in range(n):
+        clock.index = rng.randrange(0, 6)
+        durations = [(stage, rng.randrange(1, 4)) for stage in STAGES[:-1]]
+        movie = {"id": f"movie_{i}", "title": f"Film {i}"}
+        pipeline.start(movie, clock, delay=rng.randrange(0, 3), durations=durations)
+        films.append(movie)
+    return films
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_skipped_months_catch_up(seed):
+    rng = random.Random(seed)
+    stepped, jumped = ProductionPipeline(), ProductionPipeline()
+    clock = Clock()
+    rng_a, rng_b = random.Random(seed), random.Random(seed)
+    films_a = _films(rng_a, stepped, clock)
+    films_b = _films(rng_b, jumped, clock)
+    clock.index = 6
+
+    moved_a = {m["id"]: [] for m in films_a}
+    moved_b = {m["id"]: [] for m in films_b}
+    month = 6
+    while month < 30:
+        month += rng.randrange(1, 5)
+        for m in range(clock.index + 1, month + 1):
+            clock.index = m
+            for movie, stage in stepped.advance(clock):
+                moved_a[movie["id"]].append(stage)
+        for movie, stage in jumped.advance(clock):
+            moved_b[movie["id"]].append(stage)
+
+        for a, b in zip(films_a, films_b):
+            assert a["status"] == b["status"] == expected_status(a, month)
+        assert stepped.active == jumped.active
+
+    assert moved_a == moved_b
+    for stages in moved_b.values():
+        assert stages == list(STAGES[1:])  # every stage change reported once, in order
+    assert jumped.active == 0
+
+
+def test_timeline_and_ready_month():
+    pipeline = ProductionPipeline()
+    clock = Clock(10)
+    movie = {"id": "m", "title": "M"}
+    durations = [("pre_production", 1), ("shooting", 2), ("post_production", 1)]
+    ready = pipeline.start(movie, clock, delay=2, durations=durations)
+    assert movie["timeline"] == [
+        ("pre_production", 11, 13),
+        ("shooting", 14, 15),
+        ("post_production", 16, 16),
+        ("release_ready", 17, None),
+    ]
+    assert ready == pipeline.ready_month(movie) == 17
+    assert pipeline.remaining(movie, 12) == 5
+
+    clock.index = 17
+    assert [stage for _, stage in pipeline.advance(clock)] == ["shooting", "post_production", "release_ready"]
+    assert pipeline.advance(clock) == []  # the same month again moves nothing
+
+
+def test_dropped_and_finished_films_leave_the_pipeline():
+    pipeline = ProductionPipeline()
+    clock = Clock(0)
+    dropped, finished = {"id": "a", "title": "A"}, {"id": "b", "title": "B"}
+    for movie in (dropped, finished):
+        pipeline.start(movie, clock, durations=[(s, 1) for s in STAGES[:-1]])
+    pipeline.drop(dropped)
+    pipeline.finish(finished)
+    assert pipeline.active == 0 and finished["status"] == "release_ready"
+
+    clock.index = 12
+    assert pipeline.advance(clock) == []
@@ -0,0 +1,81 @@
+# HollywoodSim/tests/test_scheduling.py
+
+"""ResourceCalendar checked against a month-by-month brute-force model."""
+
+import random
+
+import pytest
+
+from scheduling import ResourceCalendar
+
+
+class BruteCalendar:
+    """Every booking in a list; every query walks it."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.bookings = {}
+
+    def load(self, month):
+        return sum(1 for start, end, _ in self.bookings.values() if start <= month <= end)
+
+    def is_free(self, start, end):
+        return all(self.load(m) < self.capacity for m in range(start, end + 1))
+
+    def next_free(self, start, months):
+        while not self.is_free(start, start + months - 1):
+            start += 1
+        return start
+
+    def holders(self, start, end):
+        overlapping = [(s, i, h) for i, (s, e, h) in self.bookings.items() if s <= end and e >= start]
+        return [h for _, _, h in sorted(overlapping)]
+
+
+@pytest.mark.parametrize("capacity", [1, 2, 3])
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force(capacity, seed):
+    rng = random.Random(seed)
+    calendar = ResourceCalendar("Stage", capacity)
+    model = BruteCalendar(capacity)
+
+    for step in range(300):
+        if model.bookings and rng.random() < 0.3:
+            booking_id = rng.choice(list(model.bookings))
+            calendar.cancel(booking_id)
+            del model.bookings[booking_id]
+        else:
+            # Months past the initial tree size exercise _grow
+            start = rng.randrange(0, 150)
+            end = start + rng.randrange(0, 12)
+            if model.is_free(start, end):
+                booking_id = calendar.book(start, end, f"film {step}")
+                model.bookings[booking_id] = (start, end, f"film {step}")
+            else:
+                with pytest.raises(ValueError):
+                    calendar.book(start, end, f"film {step}")
+
+        a = rng.randrange(0, 170)
+        b = a + rng.randrange(0, 15)
+        months = rng.randrange(1, 10)
+        assert calendar.is_free(a, b) == model.is_free(a, b)
+        assert calendar.next_free(a, months) == model.next_free(a, months)
+        assert calendar.holders(a, b) == model.holders(a, b)
+
+
+def test_next_free_skips_gaps_too_short():
+    calendar = ResourceCalendar("Star")
+    calendar.book(0, 2, "A")
+    calendar.book(5, 6, "B")
+    assert calendar.next_free(0, 2) == 3
+    assert calendar.next_free(0, 3) == 7
+    assert calendar.holders(2, 5) == ["A", "B"]
+
+
+def test_cancel_frees_the_months():
+    calendar = ResourceCalendar("Star")
+    booking = calendar.book(10, 20, "A")
+    assert not calendar.is_free(15, 15)
+    calendar.cancel(booking)
+    assert calendar.is_free(0, 100)
+    assert calendar.holders(0, 100) == []
@@ -0,0 +1,175 @@
+# HollywoodSim/game/titles.py
+
+"""
+Unique Title Service
+--------------------
+Each genre's title space (every format in TITLE_FORMATS_BY_GENRE filled
+with every combination of its parts) is enumerated once on first use.
+Combinations that render to a string already seen in any genre are
+dropped, and the survivors are drawn without replacement with a lazy
+Fisher–Yates shuffle, so a new unique title costs O(1) with no retry loop.
+When a genre runs out, the next pass reuses the space with a numbered
+suffix ("... II").
+
+A title is identified by a compact integer code and only rendered to text
+on request.
+"""
+
+import random
+from array import array
+from itertools import product
+from string import Formatter
+
+import game_data
+
+DEFAULT_FORMATS = ["{prefix} {noun}", "{noun} of the {noun2}"]
+DEFAULT_PARTS = {"prefixes": ["The"], "nouns": ["Story"]}
+
+ROMAN_NUMERALS = [
+    (1000, "M"), (900, "CM"), (500, "D"), (400, "CD"), (100, "C"), (90, "XC"),
+    (50, "L"), (40, "XL"), (10, "X"), (9, "IX"), (5, "V"), (4, "IV"), (1, "I"),
+]
+
+
+def to_roman(n):
+    out = []
+    for value, numeral in ROMAN_NUMERALS:
+        count, n = divmod(n, value)
+        out.append(numeral * count)
+    return "".join(out)
+
+
+def title_case(text):
+    """Capitalise each word without str.title()'s "13Th" / "Don'T" quirks."""
+    return " ".join(word[:1].upper() + word[1:] for word in text.split())
+
+
+class TitleSpace:
+    """All distinct titles for one genre, addressable by integer index."""
+
+    def __init__(self, formats, parts, taken=None):
+        field_values = {
+            "prefix": parts.get("prefixes") or DEFAULT_PARTS["prefixes"],
+            "noun": parts.get("nouns") or DEFAULT_PARTS["nouns"],
+            "noun2": parts.get("noun2") or parts.get("nouns") or DEFAULT_PARTS["nouns"],
+            "mid_phrase": getattr(game_data, "MID_PHRASES", ["of the"]),
+            "place": getattr(game_data, "PLACES", ["Nowhere"]),
+            "adjective": getattr(game_data, "ADJECTIVES", ["Lonely"]),
+        }
+
+        # (format, field names, value lists, offset) per format; index = offset + mixed-radix digits
+        self.formats = []
+        offset = 0
+        for fmt in formats:
+            fields = list(dict.fromkeys(name for _, name, _, _ in Formatter().parse(fmt) if name))
+            values = [field_values.get(name, ["?"]) for name in fields]
+            size = 1
+            for v in values:
+                size *= len(v)
+            self.formats.append((fmt, fields, values, offset))
+            offset += size
+        self.total = offset
+
+        # Keep the first index of every title not already claimed (here or by another genre)
+        seen = set() if taken is None else taken
+        self.valid = array("l")
+        index = 0
+        for fmt, fields, values, _ in self.formats:
+            for combo in product(*values):
+                params = dict(zip(fields, combo))
+                if "noun2" not in params or params["noun2"] != params.get("noun"):
+                    title = title_case(fmt.format(**params))
+                    if title not in seen:
+                        seen.add(title)
+                        self.valid.append(index)
+                index += 1
+
+    def __len__(self):
+        return len(self.valid)
+
+    def _locate(self, index):
+        for entry in reversed(self.formats):
+            if index >= entry[3]:
+                return entry
+        raise IndexError(index)
+
+    def _params(self, index):
+        fmt, fields, values, offset = self._locate(index)
+        rest = index - offset
+        params = {}
+        for name, options in zip(reversed(fields), reversed(values)):
+            rest, digit = divmod(rest, len(options))
+            params[name] = options[digit]
+        return params
+
+    def _format(self, index, params):
+        return title_case(self._locate(index)[0].format(**params))
+
+    def render(self, slot):
+        """Text for the title in position `slot` of the distinct-title list."""
+        index = self.valid[slot]
+        return self._format(index, self._params(index))
+
+
+class TitleService:
+    """Hands out unique titles per genre for the lifetime of a game."""
+
+    def __init__(self, rng=random):
+        self.rng = rng
+        self.spaces = {}
+        self._remaining = {}   # genre -> titles left in the current pass
+        self._swaps = {}       # genre -> sparse Fisher–Yates swap table
+        self._passes = {}      # genre -> completed passes over the space
+
+    def _build(self, genre, taken=None):
+        formats_by_genre = getattr(game_data, "TITLE_FORMATS_BY_GENRE", {"default": DEFAULT_FORMATS})
+        formats = formats_by_genre.get(genre, formats_by_genre.get("default", DEFAULT_FORMATS))
+        parts = getattr(game_data, "SCRIPT_TITLES_BY_GENRE", {}).get(genre, DEFAULT_PARTS)
+        space = self.spaces[genre] = TitleSpace(formats, parts, taken)
+        self._remaining[genre] = len(space)
+        self._swaps[genre] = {}
+        self._passes[genre] = 0
+
+    def space(self, genre):
+        if not self.spaces:
+            # Genres share words, so build them all at once and let each title
+            # belong to the first genre that can make it.
+            taken = set()
+            for name in getattr(game_data, "SCRIPT_TITLES_BY_GENRE", {}):
+                self._build(name, taken)
+        if genre not in self.spaces:
+            self._build(genre)
+        return self.spaces[genre]
+
+    def draw_code(self, genre):
+        """Draw a title no earlier call has returned, as an integer code."""
+        space = self.space(genre)
+        if self._remaining[genre] == 0:
+            self._passes[genre] += 1
+            self._remaining[genre] = len(space)
+            self._swaps[genre] = {}
+
+        remaining = self._remaining[genre]
+        swaps = self._swaps[genre]
+        pick = self.rng.randrange(remaining)
+        last = remaining - 1
+        slot = swaps.get(pick, pick)
+        swaps[pick] = swaps.pop(last, last)
+        self._remaining[genre] = last
+        return self._passes[genre] * len(space) + slot
+
+    def render(self, genre, code):
+        space = self.space(genre)
+        cycle, slot = divmod(code, len(space))
+        title = space.render(slot)
+        return f"{title} {to_roman(cycle + 1)}" if cycle else title
+
+    def new_title(self, genre):
+        return self.render(genre, self.draw_code(genre))
+
+    def reset(self):
+        """Forget every title handed out (e.g. when a new game starts)."""
+        self.__init__(self.rng)
+
+
+TITLES = TitleService()